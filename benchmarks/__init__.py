@@ -0,0 +1,3 @@
+"""
+Performance benchmarks of the validation managers. They are not part of the unit tests, run them via `tox -e benchmark`.
+"""
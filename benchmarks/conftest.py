@@ -0,0 +1,138 @@
+from datetime import UTC, datetime
+
+import pytest
+import pytz
+from bomf import MigrationConfig
+from ibims.bo4e import (
+    Adresse,
+    Anrede,
+    Bankverbindung,
+    Geschaeftspartner,
+    Kontaktart,
+    Marktlokation,
+    Messlokation,
+    SepaInfo,
+    Sparte,
+    Typ,
+    Vertrag,
+    VertragskontoCBA,
+    VertragskontoMBA,
+    Zaehler,
+    ZusatzAttribut,
+)
+from ibims.datasets import TripicaCustomerLoaderDataSet, TripicaResourceLoaderDataSet
+from injector import Injector
+from pvframework import ValidationManager
+
+from pvtool import ValidationManagerProviderCustomer
+
+
+def pytest_addoption(parser: pytest.Parser):
+    parser.addoption(
+        "--num-data-sets",
+        action="store",
+        type=int,
+        default=1_000,
+        help="Number of data sets to validate per benchmark round",
+    )
+    parser.addoption(
+        "--scales",
+        action="store",
+        default="1000",
+        help="Comma separated sizes of the synthetic populations validated by the loader benchmarks, "
+        "e.g. 1000,100000,1000000",
+    )
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc):
+    if "scale" in metafunc.fixturenames:
+        scales = [int(scale) for scale in metafunc.config.getoption("--scales").split(",")]
+        metafunc.parametrize("scale", scales, ids=[f"{scale}_data_sets" for scale in scales])
+
+
+@pytest.fixture(scope="session")
+def num_data_sets(request: pytest.FixtureRequest) -> int:
+    return request.config.getoption("--num-data-sets")
+
+
+@pytest.fixture(scope="session")
+def migration_config() -> MigrationConfig:
+    return MigrationConfig(migration_key_date=datetime(2023, 6, 1, tzinfo=UTC))
+
+
+@pytest.fixture
+def customer_validation_manager(migration_config: MigrationConfig) -> ValidationManager:
+    injector = Injector(
+        [
+            lambda binder: binder.bind(MigrationConfig, to=migration_config),
+            ValidationManagerProviderCustomer(),
+        ]
+    )
+    return injector.get(ValidationManager)
+
+
+def build_customer_data_set(index: int) -> TripicaCustomerLoaderDataSet:
+    customer_id = f"2{index:08d}"
+    address = Adresse(version="1", postleitzahl="50564", ort="Köln", strasse="Gigastr.", hausnummer=str(index % 500))
+    return TripicaCustomerLoaderDataSet.model_construct(
+        powercloud_customer_id=customer_id,
+        geschaeftspartner=Geschaeftspartner.model_construct(
+            zusatz_attribute=[ZusatzAttribut(name="customerID", wert=customer_id)],
+            typ=Typ.GESCHAEFTSPARTNER,
+            nachname="Mustermann",
+            vorname="Max",
+            anrede=Anrede.HERR,
+            e_mail_adresse=f"max.mustermann{index}@example.com",
+            telefonnummer_mobil="+49 (0) 1324832749",
+            telefonnummer_privat="0221 937436",
+            erstellungsdatum=datetime(2023, 1, 1, tzinfo=pytz.UTC),
+            geburtstag=datetime(1980, 2, 29, tzinfo=pytz.UTC),
+        ),
+        liefer_adressen={"contract_id_1": address},
+        rechnungs_adressen={"contract_id_1": address},
+        banks={
+            "contract_id_1": Bankverbindung(
+                iban="DE52940594210000082271",
+                bic="TESTDETT421",
+                bankname="Sparkasse WelcheAuchImmer",
+                ouid=1,
+                kontoinhaber="Max Mustermann",
+                gueltig_seit=datetime(2023, 1, 1, tzinfo=pytz.UTC),
+                sepa_info=SepaInfo(sepa_id="123456789", sepa_zahler=True),
+            )
+        },
+        vertragskonten_mbas=[
+            VertragskontoMBA.model_construct(
+                ouid=1,
+                vertrags_adresse=address,
+                vertragskontonummer="300010000",
+                rechnungsstellung=Kontaktart.E_MAIL,
+                cbas=[
+                    VertragskontoCBA.model_construct(
+                        ouid=11,
+                        vertrags_adresse=address,
+                        vertragskontonummer="300010001",
+                        rechnungsstellung=Kontaktart.POSTWEG,
+                        vertrag=Vertrag.model_construct(vertragsnummer="300010002"),
+                        erstellungsdatum=datetime(2023, 1, 1, tzinfo=pytz.UTC),
+                        rechnungsdatum_start=datetime(2023, 2, 1, tzinfo=pytz.UTC),
+                        rechnungsdatum_naechstes=datetime(2023, 10, 1, tzinfo=pytz.UTC),
+                    )
+                ],
+            )
+        ],
+    )
+
+
+@pytest.fixture
+def customer_data_sets(num_data_sets: int) -> list[TripicaCustomerLoaderDataSet]:
+    return [build_customer_data_set(index) for index in range(num_data_sets)]
+
+
+def build_resource_data_set(index: int) -> TripicaResourceLoaderDataSet:
+    return TripicaResourceLoaderDataSet.model_construct(
+        marktlokation=Marktlokation.model_construct(marktlokations_id=f"{index:011d}"),
+        messlokation=Messlokation.model_construct(messlokations_id=f"DE{index:011d}ABCDEFGHIJ0123456789"),
+        vertrag=Vertrag.model_construct(sparte=Sparte.STROM),
+        zaehler=Zaehler.model_construct(zaehlernummer=f"{index}hhjbd0"),
+    )
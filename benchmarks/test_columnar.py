@@ -0,0 +1,33 @@
+import asyncio
+import logging
+
+import pytest
+from pvframework import ValidationManager
+
+from pvtool.resource_loader import build_resource_validation_manager
+
+from .conftest import build_resource_data_set
+
+
+def _benchmark_validation(benchmark, validation_manager: ValidationManager, data_sets: list, columnar: bool):
+    logging.disable(logging.WARNING)
+    validate = validation_manager.validate_columnar if columnar else validation_manager.validate
+
+    def _validate():
+        return asyncio.run(validate(*data_sets))
+
+    validation_summary = benchmark.pedantic(_validate, rounds=3)
+    benchmark.extra_info["us_per_data_set"] = benchmark.stats.stats.mean / len(data_sets) * 1e6
+    assert validation_summary.num_fails == 0
+    assert validation_summary.total == len(data_sets)
+
+
+@pytest.mark.parametrize("columnar", [False, True], ids=["validate", "validate_columnar"])
+def test_validate_resource_data_sets(benchmark, num_data_sets: int, columnar: bool):
+    data_sets = [build_resource_data_set(index) for index in range(num_data_sets)]
+    _benchmark_validation(benchmark, build_resource_validation_manager(), data_sets, columnar)
+
+
+@pytest.mark.parametrize("columnar", [False, True], ids=["validate", "validate_columnar"])
+def test_validate_customer_data_sets(benchmark, customer_validation_manager, customer_data_sets, columnar: bool):
+    _benchmark_validation(benchmark, customer_validation_manager, customer_data_sets, columnar)
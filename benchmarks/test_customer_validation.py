@@ -0,0 +1,34 @@
+import asyncio
+import logging
+
+import pytest
+from pvframework import ValidationManager
+
+from pvtool import ValidationManagerProviderCustomer
+from pvtool.process_pool import ProcessPoolRunner
+
+
+def test_validate_customer_data_sets(benchmark, customer_validation_manager: ValidationManager, customer_data_sets):
+    logging.disable(logging.WARNING)
+
+    def _validate():
+        return asyncio.run(customer_validation_manager.validate(*customer_data_sets))
+
+    validation_summary = benchmark.pedantic(_validate, rounds=3)
+    benchmark.extra_info["us_per_data_set"] = benchmark.stats.stats.mean / len(customer_data_sets) * 1e6
+    assert validation_summary.num_fails == 0
+    assert validation_summary.total == len(customer_data_sets)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2, 4])
+def test_validate_customer_data_sets_in_process_pool(benchmark, migration_config, customer_data_sets, max_workers: int):
+    logging.disable(logging.WARNING)
+
+    def _validate():
+        with ProcessPoolRunner(ValidationManagerProviderCustomer, migration_config, max_workers=max_workers) as runner:
+            return runner.run(customer_data_sets)
+
+    summary = benchmark.pedantic(_validate, rounds=3)
+    benchmark.extra_info["us_per_data_set"] = benchmark.stats.stats.mean / len(customer_data_sets) * 1e6
+    assert summary.num_fails == 0
+    assert summary.total == len(customer_data_sets)
@@ -0,0 +1,45 @@
+"""
+Compares the per-data-set cost of validating dirty customer data sets (an error is injected into each rule of 20% of
+the data sets, see `pvtool.synthetic`) in the normal and in the fail-fast mode (see `pvtool.fail_fast`).
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+import pytest
+from bomf import MigrationConfig
+
+from pvtool import ValidationManagerProviderCustomer
+from pvtool.fail_fast import FailFast
+from pvtool.process_pool import build_validation_manager
+from pvtool.synthetic import CustomerDataSetGenerator
+
+_ERROR_RATE = 0.2
+
+
+@pytest.fixture
+def dirty_customer_data_sets(num_data_sets: int, migration_config: MigrationConfig):
+    error_rates = {rule: _ERROR_RATE for rule in CustomerDataSetGenerator.RULES}
+    generator = CustomerDataSetGenerator(migration_config.migration_key_date, seed=0, error_rates=error_rates)
+    return list(generator.generate(num_data_sets))
+
+
+@pytest.mark.parametrize(
+    "fail_fast",
+    [None, FailFast(), FailFast(skip_warnings=True)],
+    ids=["normal", "fail_fast", "fail_fast_skip_warnings"],
+)
+def test_validate_dirty_data_sets(
+    benchmark, migration_config: MigrationConfig, dirty_customer_data_sets, fail_fast: Optional[FailFast]
+):
+    logging.disable(logging.ERROR)
+    validation_manager = build_validation_manager(ValidationManagerProviderCustomer, migration_config, fail_fast)
+
+    async def _validate_all() -> int:
+        validation_results = [await validation_manager.validate(data_set) for data_set in dirty_customer_data_sets]
+        return sum(validation_result.num_fails > 0 for validation_result in validation_results)
+
+    num_invalid = benchmark.pedantic(lambda: asyncio.run(_validate_all()), rounds=3)
+    assert 0 < num_invalid < len(dirty_customer_data_sets)
+    benchmark.extra_info["us_per_data_set"] = benchmark.stats.stats.mean / len(dirty_customer_data_sets) * 1e6
@@ -0,0 +1,37 @@
+"""
+Compares the provision of the parameters of all PathMappedValidators of the customer manager via
+`PathMappedValidator.provide` (each path is walked separately) and via the manager's `FieldAccessPlan`
+(see `PlannedPathMappedValidator`).
+"""
+
+import pytest
+from pvframework import PathMappedValidator, ValidationManager
+
+from pvtool.field_access import PlannedPathMappedValidator
+
+
+@pytest.mark.parametrize("planned", [False, True], ids=["provide", "field_access_plan"])
+def test_provide_path_parameters(
+    benchmark, customer_validation_manager: ValidationManager, customer_data_sets, planned
+):
+    plan = customer_validation_manager.field_access_plan  # type:ignore[attr-defined]
+    mapped_validators = [
+        mapped_validator
+        for mapped_validator in customer_validation_manager.validators
+        if isinstance(mapped_validator, PlannedPathMappedValidator)
+    ]
+
+    def _provide_all():
+        for data_set in customer_data_sets:
+            if planned:
+                with plan.resolved(data_set):
+                    for mapped_validator in mapped_validators:
+                        list(mapped_validator.provide(data_set))
+            else:
+                for mapped_validator in mapped_validators:
+                    list(PathMappedValidator.provide(mapped_validator, data_set))
+
+    benchmark.pedantic(_provide_all, rounds=5)
+    benchmark.extra_info["us_per_data_set"] = benchmark.stats.stats.mean / len(customer_data_sets) * 1e6
+    benchmark.extra_info["num_validators"] = len(mapped_validators)
+    benchmark.extra_info["num_getattr_steps"] = len(plan)
@@ -0,0 +1,105 @@
+"""
+Compares the ingest of data sets from JSON lines with and without pydantic's validation.
+Building the models via `model_construct` (i.e. skipping pydantic and relying on the pvtool validators) is not faster
+than `model_validate_json` with pydantic 2 - its validation runs in pydantic-core while the construction runs in
+Python. That's why pvtool has no such "fast loader"; this benchmark is kept to re-check it on updates of pydantic.
+"""
+
+import asyncio
+import json
+import logging
+import typing
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from functools import cache
+from typing import Any, Callable, Optional
+from uuid import UUID
+
+import pytest
+from ibims.datasets import TripicaCustomerLoaderDataSet
+from pvframework import ValidationManager
+from pydantic import BaseModel
+
+from .conftest import build_customer_data_set
+
+# bypasses the DeprecationWarning (and the frame inspection) of ibims' DataSetBaseModel.model_construct
+_model_construct: Callable[..., Any] = BaseModel.model_construct.__func__  # type:ignore[attr-defined]
+
+
+def _converter(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    arguments = [argument for argument in typing.get_args(annotation) if argument is not type(None)]
+    origin = typing.get_origin(annotation)
+    if origin is list:
+        item_converter = _converter(arguments[0])
+        return None if item_converter is None else lambda value: [item_converter(item) for item in value]
+    if origin is dict:
+        value_converter = _converter(arguments[1])
+        return None if value_converter is None else lambda value: {k: value_converter(v) for k, v in value.items()}
+    if origin is not None:  # Optional[...]
+        return _converter(arguments[0]) if len(arguments) == 1 else None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return lambda value: _construct_model(annotation, value)
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return annotation
+    return {datetime: datetime.fromisoformat, Decimal: Decimal, UUID: UUID}.get(annotation)
+
+
+@cache
+def _field_plan(model_type: type[BaseModel]) -> dict[str, Callable[[Any], Any]]:
+    plan = {}
+    for field_name, field_info in model_type.model_fields.items():
+        if (converter := _converter(field_info.annotation)) is not None:
+            plan[field_name] = converter
+            if field_info.alias is not None:
+                plan[field_info.alias] = converter
+    return plan
+
+
+def _construct_model(model_type: type[BaseModel], data: dict[str, Any]) -> Any:
+    plan = _field_plan(model_type)
+    return _model_construct(
+        model_type,
+        None,
+        **{key: plan[key](value) if key in plan and value is not None else value for key, value in data.items()},
+    )
+
+
+_INGEST: dict[str, Callable[[str], Any]] = {
+    "model_validate_json": TripicaCustomerLoaderDataSet.model_validate_json,
+    "model_validate": lambda line: TripicaCustomerLoaderDataSet.model_validate(json.loads(line)),
+    "model_construct": lambda line: _construct_model(TripicaCustomerLoaderDataSet, json.loads(line)),
+}
+
+
+@pytest.fixture(scope="module")
+def customer_json_lines(request: pytest.FixtureRequest) -> list[str]:
+    num_data_sets = request.config.getoption("--num-data-sets")
+    return [build_customer_data_set(index).model_dump_json(by_alias=True) for index in range(num_data_sets)]
+
+
+def test_constructed_models_equal_validated_models(customer_json_lines: list[str]):
+    for line in customer_json_lines[:10]:
+        assert _INGEST["model_construct"](line) == TripicaCustomerLoaderDataSet.model_validate_json(line)
+
+
+@pytest.mark.parametrize("ingest", list(_INGEST))
+def test_ingest(benchmark, customer_json_lines: list[str], ingest: str):
+    data_sets = benchmark.pedantic(lambda: [_INGEST[ingest](line) for line in customer_json_lines], rounds=5)
+    benchmark.extra_info["us_per_data_set"] = benchmark.stats.stats.mean / len(customer_json_lines) * 1e6
+    assert len(data_sets) == len(customer_json_lines)
+
+
+@pytest.mark.parametrize("ingest", list(_INGEST))
+def test_ingest_and_validate(
+    benchmark, customer_validation_manager: ValidationManager, customer_json_lines: list[str], ingest: str
+):
+    logging.disable(logging.WARNING)
+
+    def _ingest_and_validate():
+        data_sets = [_INGEST[ingest](line) for line in customer_json_lines]
+        return asyncio.run(customer_validation_manager.validate(*data_sets))
+
+    validation_summary = benchmark.pedantic(_ingest_and_validate, rounds=3)
+    benchmark.extra_info["us_per_data_set"] = benchmark.stats.stats.mean / len(customer_json_lines) * 1e6
+    assert validation_summary.num_fails == 0
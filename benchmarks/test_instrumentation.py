@@ -0,0 +1,27 @@
+"""
+Measures the overhead of the validator instrumentation on the validation of customers.
+"""
+
+import asyncio
+import logging
+from contextlib import nullcontext
+
+import pytest
+from pvframework import ValidationManager
+
+from pvtool.instrumentation import ValidatorInstrumentation
+
+
+@pytest.mark.parametrize("instrumented", [False, True], ids=["disabled", "enabled"])
+def test_validate_customer_data_sets(
+    benchmark, customer_validation_manager: ValidationManager, customer_data_sets, instrumented
+):
+    logging.disable(logging.WARNING)
+
+    def _validate():
+        return asyncio.run(customer_validation_manager.validate(*customer_data_sets))
+
+    with ValidatorInstrumentation().enabled() if instrumented else nullcontext():
+        validation_summary = benchmark.pedantic(_validate, rounds=3)
+    benchmark.extra_info["us_per_data_set"] = benchmark.stats.stats.mean / len(customer_data_sets) * 1e6
+    assert validation_summary.num_fails == 0
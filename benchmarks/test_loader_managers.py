@@ -0,0 +1,100 @@
+"""
+Performance baselines of the validation managers of all three loaders. Each benchmark validates a synthetic
+population (see `pvtool.synthetic`) in which about every 10th data set has injected errors (spread evenly over the
+rules of the loader). The data sets are generated while validating, i.e. the population is never held in memory. Each
+data set is validated separately to measure its latency. Besides the total time, the benchmarks report in `extra_info`:
+- `data_sets_per_second`: the throughput (excluding the generation of the data sets)
+- `p50_latency_us` and `p99_latency_us`: the percentiles of the latency per data set
+- `peak_memory_mib`: the peak of the memory allocated while validating (only `test_peak_memory`, which is slower
+  since the allocations are traced)
+By default, the populations consist of 1000 data sets. Pass e.g. `--scales 1000,100000,1000000` for larger ones.
+Note that a million customers take hours.
+"""
+
+import asyncio
+import logging
+import statistics
+import tracemalloc
+from array import array
+from time import perf_counter
+from typing import Any, Iterator
+
+import pytest
+from bomf import MigrationConfig
+from injector import Module
+
+from pvtool import (
+    ValidationManagerProviderCustomer,
+    ValidationManagerProviderNetwork,
+    ValidationManagerProviderResource,
+)
+from pvtool.process_pool import build_validation_manager
+from pvtool.synthetic import GENERATORS, CustomerDataSetGenerator
+from pvtool.validation_manager import PVToolValidationManager
+
+LOADERS: dict[str, type[Module]] = {
+    "customer": ValidationManagerProviderCustomer,
+    "network": ValidationManagerProviderNetwork,
+    "resource": ValidationManagerProviderResource,
+}
+
+ERROR_RATE = 0.1
+"""The share of the data sets with injected errors (approximately, the rules break independently)"""
+
+
+def generate_population(loader: str, scale: int, migration_config: MigrationConfig) -> Iterator[Any]:
+    """
+    Yields `scale` data sets of the loader. About every 10th data set is invalid.
+    """
+    generator_class = GENERATORS[loader]
+    error_rates = {rule: ERROR_RATE / len(generator_class.RULES) for rule in generator_class.RULES}
+    if generator_class is CustomerDataSetGenerator:
+        return CustomerDataSetGenerator(migration_config.migration_key_date, error_rates=error_rates).generate(scale)
+    return generator_class(error_rates=error_rates).generate(scale)
+
+
+async def _validate_population(
+    validation_manager: PVToolValidationManager, data_sets: Iterator[Any]
+) -> tuple[array, int]:
+    latencies = array("d")
+    num_fails = 0
+    for data_set in data_sets:
+        start = perf_counter()
+        validation_result = await validation_manager.validate(data_set)
+        latencies.append(perf_counter() - start)
+        num_fails += validation_result.num_fails
+    return latencies, num_fails
+
+
+def _benchmark_population(benchmark, loader: str, scale: int, migration_config: MigrationConfig) -> None:
+    logging.disable(logging.ERROR)
+    validation_manager = build_validation_manager(LOADERS[loader], migration_config)
+    assert isinstance(validation_manager, PVToolValidationManager)
+
+    def _validate():
+        return asyncio.run(
+            _validate_population(validation_manager, generate_population(loader, scale, migration_config))
+        )
+
+    latencies, num_fails = benchmark.pedantic(_validate, rounds=1)
+    assert len(latencies) == scale
+    benchmark.extra_info["data_sets_per_second"] = scale / sum(latencies)
+    benchmark.extra_info["p50_latency_us"] = statistics.median(latencies) * 1e6
+    benchmark.extra_info["p99_latency_us"] = statistics.quantiles(latencies, n=100)[98] * 1e6
+    benchmark.extra_info["num_fails"] = num_fails
+
+
+@pytest.mark.parametrize("loader", sorted(LOADERS))
+def test_throughput_and_latency(benchmark, loader: str, scale: int, migration_config: MigrationConfig):
+    _benchmark_population(benchmark, loader, scale, migration_config)
+
+
+@pytest.mark.parametrize("loader", sorted(LOADERS))
+def test_peak_memory(benchmark, loader: str, scale: int, migration_config: MigrationConfig):
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        _benchmark_population(benchmark, loader, scale, migration_config)
+        benchmark.extra_info["peak_memory_mib"] = tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
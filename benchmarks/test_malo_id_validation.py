@@ -0,0 +1,41 @@
+import pytest
+
+from pvtool.malo_id_validation import (
+    _get_malo_id_checksum,
+    _get_malo_id_checksum_per_digit,
+    _malo_id_pattern,
+    check_malo_id_checksums,
+)
+
+
+@pytest.fixture(scope="module")
+def malo_ids() -> list[str]:
+    ids = [f"{10_000_000_000 + index * 7919:011d}" for index in range(1_000)]
+    return [malo_id[:10] + _get_malo_id_checksum(malo_id) for malo_id in ids]
+
+
+def _check_malo_ids_per_digit(malo_ids: list[str]) -> list[bool]:
+    """The checks of `validate_marktlokations_id` using the per digit implementation of the checksum"""
+    return [
+        _malo_id_pattern.match(malo_id) is not None and malo_id[10:11] == _get_malo_id_checksum_per_digit(malo_id)
+        for malo_id in malo_ids
+    ]
+
+
+@pytest.mark.parametrize(
+    "checksum_function",
+    [
+        pytest.param(_get_malo_id_checksum_per_digit, id="per_digit"),
+        pytest.param(_get_malo_id_checksum, id="ascii_codes"),
+    ],
+)
+def test_malo_id_checksum(benchmark, checksum_function):
+    assert benchmark(checksum_function, "51238696781") == "1"
+
+
+def test_check_malo_ids_per_digit(benchmark, malo_ids: list[str]):
+    assert all(benchmark(_check_malo_ids_per_digit, malo_ids))
+
+
+def test_check_malo_id_checksums(benchmark, malo_ids: list[str]):
+    assert all(benchmark(check_malo_id_checksums, malo_ids).mask)
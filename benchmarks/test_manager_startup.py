@@ -0,0 +1,28 @@
+from typing import Optional
+
+import pytest
+from bomf import MigrationConfig
+from injector import Module
+
+from pvtool import (
+    ValidationManagerProviderCustomer,
+    ValidationManagerProviderNetwork,
+    ValidationManagerProviderResource,
+)
+from pvtool.process_pool import build_validation_manager
+from pvtool.validation_manager import clear_validation_manager_cache
+
+
+@pytest.mark.parametrize(
+    "provider", [ValidationManagerProviderCustomer, ValidationManagerProviderNetwork, ValidationManagerProviderResource]
+)
+@pytest.mark.parametrize("cached", [False, True])
+def test_manager_startup(benchmark, migration_config: MigrationConfig, provider: type[Module], cached: bool):
+    config: Optional[MigrationConfig] = migration_config if provider is ValidationManagerProviderCustomer else None
+
+    def _build():
+        if not cached:
+            clear_validation_manager_cache()
+        return build_validation_manager(provider, config)
+
+    benchmark(_build)
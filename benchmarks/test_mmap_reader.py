@@ -0,0 +1,41 @@
+from pathlib import Path
+
+import pytest
+from ibims.datasets import TripicaCustomerLoaderDataSet
+
+from pvtool.cli import read_data_sets
+from pvtool.mmap_reader import MemoryMappedJsonLines
+
+from .conftest import build_customer_data_set
+
+
+@pytest.fixture(scope="module")
+def customer_data_sets_file(tmp_path_factory: pytest.TempPathFactory, request: pytest.FixtureRequest) -> Path:
+    num_data_sets = request.config.getoption("--num-data-sets")
+    path = tmp_path_factory.mktemp("mmap_reader") / "customers.jsonl"
+    with open(path, "w", encoding="utf-8") as file:
+        for index in range(num_data_sets):
+            file.write(build_customer_data_set(index).model_dump_json(by_alias=True) + "\n")
+    return path
+
+
+def _count_valid(lines) -> int:
+    return sum(
+        not isinstance(data_set, Exception) for _, data_set in read_data_sets(lines, TripicaCustomerLoaderDataSet)
+    )
+
+
+def test_read_text_lines(benchmark, customer_data_sets_file: Path):
+    def _read():
+        with open(customer_data_sets_file, encoding="utf-8") as lines:
+            return _count_valid(lines)
+
+    assert benchmark.pedantic(_read, rounds=5) > 0
+
+
+def test_read_memory_mapped(benchmark, customer_data_sets_file: Path):
+    def _read():
+        with MemoryMappedJsonLines(customer_data_sets_file) as lines:
+            return _count_valid(lines)
+
+    assert benchmark.pedantic(_read, rounds=5) > 0
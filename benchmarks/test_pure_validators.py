@@ -0,0 +1,66 @@
+"""
+Compares the validation of repeating values by the validators marked as `pure` with and without their memo.
+Invalid values profit the most, because the uncached error path determines the parameter IDs via `param`.
+"""
+
+import asyncio
+import inspect
+import logging
+from dataclasses import dataclass, replace
+from typing import Callable
+
+import pytest
+from ibims.bo4e import Sparte
+from pvframework import PathMappedValidator, Validator
+
+from pvtool.customer_loader import check_postleitzahl, check_str_is_stripped, check_telefonnummer
+from pvtool.network_loader import check_obis, check_rollencodenr
+from pvtool.validation_manager import PVToolValidationManager
+
+
+@dataclass(frozen=True)
+class _Values:
+    index: int
+    nachname: str
+    postleitzahl: str
+    telefonnummer: str
+    rollencodenr: str
+    obis: str
+    sparte: Sparte
+
+
+_VALUES: dict[str, list[_Values]] = {
+    "valid": [
+        _Values(0, "Mustermann", "50564", "+49 (0) 1324832749", "9900000000101", "1-1:1.8.0", Sparte.STROM),
+        _Values(0, "Musterfrau", "10115", "0221 123456", "9903692223104", "7-20:3.0.0", Sparte.GAS),
+    ],
+    "invalid": [
+        _Values(0, " Mustermann", "5056!", "+49 (0) 13248327a9", "9900000000102", "1-1:1.8.0", Sparte.GAS),
+        _Values(0, "Musterfrau ", "1011?", "0221 1234a6", "990369222310", "7-1:1.8.0", Sparte.STROM),
+    ],
+}
+
+
+def _validation_manager(unwrap: bool) -> PVToolValidationManager[_Values]:
+    def validator(validator_function: Callable[..., None]) -> Validator:
+        return Validator(inspect.unwrap(validator_function) if unwrap else validator_function)
+
+    validation_manager = PVToolValidationManager[_Values]()
+    validation_manager.register(PathMappedValidator(validator(check_str_is_stripped), {"string": "nachname"}))
+    validation_manager.register(PathMappedValidator(validator(check_postleitzahl), {"postleitzahl": "postleitzahl"}))
+    validation_manager.register(PathMappedValidator(validator(check_telefonnummer), {"telefonnummer": "telefonnummer"}))
+    validation_manager.register(PathMappedValidator(validator(check_rollencodenr), {"rollencodenr": "rollencodenr"}))
+    validation_manager.register(PathMappedValidator(validator(check_obis), {"obis": "obis", "sparte": "sparte"}))
+    return validation_manager
+
+
+@pytest.mark.parametrize("values", list(_VALUES))
+@pytest.mark.parametrize("memoized", [True, False], ids=["memoized", "unwrapped"])
+def test_validate_repeating_values(benchmark, num_data_sets: int, values: str, memoized: bool):
+    logging.disable(logging.WARNING)
+    validation_manager = _validation_manager(unwrap=not memoized)
+    # the data sets are distinct, but their values repeat
+    data_sets = [replace(_VALUES[values][index % 2], index=index) for index in range(num_data_sets)]
+    validation_result = benchmark.pedantic(lambda: asyncio.run(validation_manager.validate(*data_sets)), rounds=3)
+    benchmark.extra_info["us_per_data_set"] = benchmark.stats.stats.mean / len(data_sets) * 1e6
+    assert validation_result.num_fails == (len(data_sets) if values == "invalid" else 0)
@@ -0,0 +1,32 @@
+"""
+Compares the provision of the parameters of all QueryMappedValidators of the customer manager with and without
+sharing the common subqueries (e.g. the iteration over `banks`) via the manager's `QueryPlan`.
+"""
+
+from contextlib import nullcontext
+
+import pytest
+from pvframework import QueryMappedValidator, ValidationManager
+
+
+@pytest.mark.parametrize("planned", [False, True], ids=["provide", "query_plan"])
+def test_provide_query_parameters(
+    benchmark, customer_validation_manager: ValidationManager, customer_data_sets, planned
+):
+    query_plan = customer_validation_manager.query_plan  # type:ignore[attr-defined]
+    mapped_validators = [
+        mapped_validator
+        for mapped_validator in customer_validation_manager.validators
+        if isinstance(mapped_validator, QueryMappedValidator)
+    ]
+
+    def _provide_all():
+        for data_set in customer_data_sets:
+            with query_plan.materialize() if planned else nullcontext():
+                for mapped_validator in mapped_validators:
+                    list(mapped_validator.provide(data_set))
+
+    benchmark.pedantic(_provide_all, rounds=5)
+    benchmark.extra_info["us_per_data_set"] = benchmark.stats.stats.mean / len(customer_data_sets) * 1e6
+    benchmark.extra_info["num_validators"] = len(mapped_validators)
+    benchmark.extra_info["num_shared_queries"] = len(query_plan.shared_queries)
@@ -0,0 +1,33 @@
+"""
+Compares the validation of the bank details of customers by the single validators with the validation by the fused
+`Bankverbindung` rule group of the customer manager.
+"""
+
+import asyncio
+import logging
+
+import pytest
+from pvframework import ValidationManager
+
+from pvtool.validation_manager import ValidationManagerWithConfig
+
+
+@pytest.mark.parametrize("fused", [False, True], ids=["validators", "rule_group"])
+def test_validate_bankverbindungen(
+    benchmark, customer_validation_manager: ValidationManager, customer_data_sets, migration_config, fused
+):
+    logging.disable(logging.WARNING)
+    [rule_group] = customer_validation_manager.rule_groups  # type:ignore[attr-defined]
+    bank_validation_manager: ValidationManagerWithConfig = ValidationManagerWithConfig(migration_config)
+    for mapped_validator in rule_group.mapped_validators:
+        execution_info = customer_validation_manager.validators[mapped_validator]
+        bank_validation_manager.register(mapped_validator, timeout=execution_info.timeout, mode=execution_info.mode)
+    if fused:
+        bank_validation_manager.register_rule_group(rule_group)
+
+    def _validate():
+        return asyncio.run(bank_validation_manager.validate(*customer_data_sets))
+
+    validation_summary = benchmark.pedantic(_validate, rounds=3)
+    benchmark.extra_info["us_per_data_set"] = benchmark.stats.stats.mean / len(customer_data_sets) * 1e6
+    assert validation_summary.num_fails == 0
@@ -0,0 +1,53 @@
+"""
+Compares the time to decide whether customer data sets are valid: `validate` executes all validators, whereas
+`iter_errors` is stopped at the first error (in `ValidationMode.ERROR`). Every data set has an error injected into one
+of the rules (see `pvtool.synthetic`).
+"""
+
+import asyncio
+import logging
+from contextlib import aclosing
+
+import pytest
+from bomf import MigrationConfig
+from pvframework import ValidationManager
+from pvframework.errors import ValidationMode
+
+from pvtool.synthetic import CustomerDataSetGenerator
+
+_ERROR_RULES = ("check_iban", "check_e_mail", "check_address_fields", "check_date_in_past_required")
+
+
+@pytest.fixture
+def invalid_customer_data_sets(num_data_sets: int, migration_config: MigrationConfig):
+    data_sets = []
+    for index, rule in enumerate(_ERROR_RULES):
+        generator = CustomerDataSetGenerator(migration_config.migration_key_date, seed=index, error_rates={rule: 1.0})
+        data_sets.extend(generator.generate(num_data_sets // len(_ERROR_RULES)))
+    return data_sets
+
+
+async def _is_valid(validation_manager: ValidationManager, data_set) -> bool:
+    async with aclosing(
+        validation_manager.iter_errors(data_set, modes={ValidationMode.ERROR})  # type:ignore[attr-defined]
+    ) as validation_errors:
+        return await anext(validation_errors, None) is None
+
+
+@pytest.mark.parametrize("streamed", [False, True], ids=["validate", "iter_errors_until_first_error"])
+def test_decide_validity(
+    benchmark, customer_validation_manager: ValidationManager, invalid_customer_data_sets, streamed: bool
+):
+    logging.disable(logging.ERROR)
+
+    async def _decide_all() -> list[bool]:
+        if streamed:
+            return [await _is_valid(customer_validation_manager, data_set) for data_set in invalid_customer_data_sets]
+        return [
+            (await customer_validation_manager.validate(data_set)).num_fails == 0
+            for data_set in invalid_customer_data_sets
+        ]
+
+    validities = benchmark.pedantic(lambda: asyncio.run(_decide_all()), rounds=3)
+    assert not any(validities)
+    benchmark.extra_info["us_per_data_set"] = benchmark.stats.stats.mean / len(invalid_customer_data_sets) * 1e6
@@ -0,0 +1,27 @@
+"""
+Measures the throughput of the synthetic data set generators (see `pvtool.synthetic`).
+"""
+
+from collections import deque
+
+import pytest
+from bomf import MigrationConfig
+
+from pvtool.synthetic import GENERATORS, CustomerDataSetGenerator
+
+
+@pytest.mark.parametrize("with_errors", [False, True], ids=["valid", "1_percent_errors_per_rule"])
+@pytest.mark.parametrize("loader", sorted(GENERATORS))
+def test_generate(benchmark, loader: str, with_errors: bool, num_data_sets: int, migration_config: MigrationConfig):
+    generator_class = GENERATORS[loader]
+    error_rates = {rule: 0.01 for rule in generator_class.RULES} if with_errors else None
+    if generator_class is CustomerDataSetGenerator:
+        generator = CustomerDataSetGenerator(migration_config.migration_key_date, error_rates=error_rates)
+    else:
+        generator = generator_class(error_rates=error_rates)
+
+    def _generate():
+        deque(generator.generate(num_data_sets), maxlen=0)
+
+    benchmark.pedantic(_generate, rounds=5)
+    benchmark.extra_info["data_sets_per_minute"] = num_data_sets / benchmark.stats.stats.mean * 60
@@ -0,0 +1,71 @@
+"""
+Micro benchmarks of single validator functions. Only valid values are used, because the error path needs a running
+validation (to determine the parameter IDs via `param`).
+"""
+
+from typing import Any, Callable
+
+import pytest
+from ibims.bo4e import Adresse, Landescode, Sparte, ZusatzAttribut
+
+from pvtool.customer_loader import (
+    check_address_deutsch,
+    check_e_mail,
+    check_extern_customer_id,
+    check_postleitzahl,
+    check_telefonnummer,
+    check_vertragskontonummer,
+)
+from pvtool.network_loader import check_netzbetreiber_code_nr, check_obis, check_rollencodenr
+from pvtool.resource_loader import check_malo_id, check_melo_id
+from pvtool.validation_cache import ValidationCache, bic_validation_cache, iban_validation_cache
+
+
+@pytest.mark.parametrize(
+    ["validator_function", "kwargs"],
+    [
+        pytest.param(check_melo_id, {"messlokations_id": "DE0123401234012340123401234012340"}, id="melo_id"),
+        pytest.param(check_malo_id, {"marktlokations_id": "51238696781"}, id="malo_id"),
+        pytest.param(check_netzbetreiber_code_nr, {"netzbetreiber_code_nr": "9900000000003"}, id="netzbetreiber_code"),
+        pytest.param(check_rollencodenr, {"rollencodenr": "9900000000101"}, id="rollencodenr"),
+        pytest.param(check_obis, {"obis": "1-1:1.8.0", "sparte": Sparte.STROM}, id="obis"),
+        pytest.param(
+            check_extern_customer_id,
+            {"zusatz_attribute": [ZusatzAttribut(name="customerID", wert="209876543")]},
+            id="extern_customer_id",
+        ),
+        pytest.param(
+            check_address_deutsch,
+            {
+                "address": Adresse(
+                    postleitzahl="50564", ort="Köln", strasse="Gigastr.", hausnummer="5", landescode=Landescode.DE
+                )
+            },
+            id="address_deutsch",
+        ),
+        pytest.param(check_postleitzahl, {"postleitzahl": "50564"}, id="postleitzahl"),
+        pytest.param(check_vertragskontonummer, {"vertragskontonummer": "300010001"}, id="vertragskontonummer"),
+        pytest.param(check_telefonnummer, {"telefonnummer": "+49 (0) 1324832749"}, id="telefonnummer"),
+        pytest.param(check_e_mail, {"e_mail": "max.mustermann@hochfrequenz.de"}, id="e_mail"),
+    ],
+)
+def test_validator_function(benchmark, validator_function: Callable[..., None], kwargs: dict[str, Any]):
+    benchmark(validator_function, **kwargs)
+
+
+@pytest.mark.parametrize(
+    ["validation_cache", "value"],
+    [
+        pytest.param(iban_validation_cache, "DE52940594210000082271", id="iban"),
+        pytest.param(bic_validation_cache, "TESTDETT421", id="bic"),
+    ],
+)
+@pytest.mark.parametrize("cached", [True, False], ids=["cached", "uncached"])
+def test_bank_details_validation(benchmark, validation_cache: ValidationCache, value: str, cached: bool):
+    def validate() -> None:
+        if not cached:
+            validation_cache.cache_clear()
+        validation_cache.validate(value)
+
+    validation_cache.cache_clear()
+    benchmark(validate)
@@ -4,6 +4,8 @@ network data sets are supported.
 The `ValidationManager`s are provided through `injector.Module`s.
 """
 
+from .batch import BatchSummary, BatchValidation
 from .customer_loader import ValidationManagerProviderCustomer
 from .network_loader import ValidationManagerProviderNetwork
 from .resource_loader import ValidationManagerProviderResource
+from .validation_manager import PVToolValidationManager, ValidationManagerWithConfig
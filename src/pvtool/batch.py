@@ -0,0 +1,254 @@
+"""
+Contains functionality to validate large amounts of data sets in a streaming manner.
+"""
+
+import asyncio
+from collections import Counter, deque
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any, AsyncIterable, AsyncIterator, Generic, Iterable
+
+from pvframework import ValidationResult
+from pvframework.errors import ValidationError, ValidationMode
+from pvframework.types import DataSetT
+
+if TYPE_CHECKING:
+    from .validation_manager import PVToolValidationManager
+
+
+@dataclass(frozen=True)
+class ValidationErrorSummary:
+    """
+    A compact representation of a `ValidationError`. In contrast to the latter it doesn't reference the data set or
+    the validation manager. Thus, it is cheap to keep in memory, to pickle and to serialize.
+    """
+
+    error_id: int
+    error_type: str
+    """The name of the exception class raised by the validator"""
+    message_detail: str
+    validator: str
+    """The name of the validator function"""
+    mode: ValidationMode
+
+    @classmethod
+    def from_validation_error(cls, validation_error: ValidationError, mode: ValidationMode) -> "ValidationErrorSummary":
+        """
+        Creates the summary of the given ValidationError which was raised in the given validation mode.
+        """
+        return cls(
+            error_id=validation_error.error_id,
+            error_type=type(validation_error.cause).__name__,
+            message_detail=validation_error.message_detail,
+            validator=validation_error.mapped_validator.name,
+            mode=mode,
+        )
+
+    @classmethod
+    def from_dict(cls, summary_dict: dict[str, Any]) -> "ValidationErrorSummary":
+        """
+        Creates the summary from a dict as returned by `dataclasses.asdict`.
+        """
+        return cls(**{**summary_dict, "mode": ValidationMode(summary_dict["mode"])})
+
+
+@dataclass(frozen=True)
+class DataSetSummary:
+    """
+    Contains the errors and warnings of a single data set. The data set is referenced by its index in the input.
+    """
+
+    index: int
+    errors: tuple[ValidationErrorSummary, ...] = ()
+    warnings: tuple[ValidationErrorSummary, ...] = ()
+
+    @property
+    def succeeded(self) -> bool:
+        """True if the data set was validated without errors (warnings are allowed)"""
+        return len(self.errors) == 0
+
+    @classmethod
+    def from_validation_result(cls, index: int, validation_result: ValidationResult) -> "DataSetSummary":
+        """
+        Creates the summary of a validation result containing a single data set.
+        """
+        return cls(
+            index=index,
+            errors=tuple(
+                ValidationErrorSummary.from_validation_error(error, ValidationMode.ERROR)
+                for error in validation_result.all_errors
+            ),
+            warnings=tuple(
+                ValidationErrorSummary.from_validation_error(warning, ValidationMode.WARNING)
+                for warning in validation_result.all_warnings
+            ),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Returns the summary as JSON serializable dict.
+        """
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, summary_dict: dict[str, Any]) -> "DataSetSummary":
+        """
+        Creates the summary from a dict as returned by `to_dict`.
+        """
+        return cls(
+            index=summary_dict["index"],
+            errors=tuple(ValidationErrorSummary.from_dict(error) for error in summary_dict["errors"]),
+            warnings=tuple(ValidationErrorSummary.from_dict(warning) for warning in summary_dict["warnings"]),
+        )
+
+
+# pylint: disable=too-many-instance-attributes
+@dataclass
+class BatchSummary:
+    """
+    Aggregates the results of many validation runs. In contrast to `ValidationResult` it only contains counters,
+    i.e. neither the data sets nor the ValidationErrors are kept in memory.
+    """
+
+    total: int = 0
+    num_succeeds: int = 0
+    num_fails: int = 0
+    num_warnings: int = 0
+    num_errors_total: int = 0
+    num_warnings_total: int = 0
+    num_errors_per_id: Counter[int] = field(default_factory=Counter)
+    num_warnings_per_id: Counter[int] = field(default_factory=Counter)
+
+    def add(self, validation_result: ValidationResult) -> None:
+        """
+        Adds the counts of the given validation result to this summary.
+        """
+        self.total += validation_result.total
+        self.num_succeeds += validation_result.num_succeeds
+        self.num_fails += validation_result.num_fails
+        self.num_warnings += validation_result.num_warnings
+        self.num_errors_total += validation_result.num_errors_total
+        self.num_warnings_total += validation_result.num_warnings_total
+        self.num_errors_per_id.update(validation_result.num_errors_per_id)
+        self.num_warnings_per_id.update(validation_result.num_warnings_per_id)
+
+    def add_data_set_summary(self, data_set_summary: DataSetSummary) -> None:
+        """
+        Adds the counts of the given data set summary to this summary.
+        """
+        self.total += 1
+        if data_set_summary.succeeded:
+            self.num_succeeds += 1
+        else:
+            self.num_fails += 1
+        if len(data_set_summary.warnings) > 0:
+            self.num_warnings += 1
+        self.num_errors_total += len(data_set_summary.errors)
+        self.num_warnings_total += len(data_set_summary.warnings)
+        self.num_errors_per_id.update(error.error_id for error in data_set_summary.errors)
+        self.num_warnings_per_id.update(warning.error_id for warning in data_set_summary.warnings)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Returns the summary as JSON serializable dict.
+        """
+        return {
+            **asdict(self),
+            "num_errors_per_id": {str(error_id): count for error_id, count in self.num_errors_per_id.items()},
+            "num_warnings_per_id": {str(error_id): count for error_id, count in self.num_warnings_per_id.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, summary_dict: dict[str, Any]) -> "BatchSummary":
+        """
+        Creates the summary from a dict as returned by `to_dict`.
+        """
+        return cls(
+            **{
+                **summary_dict,
+                "num_errors_per_id": Counter(
+                    {int(error_id): count for error_id, count in summary_dict["num_errors_per_id"].items()}
+                ),
+                "num_warnings_per_id": Counter(
+                    {int(error_id): count for error_id, count in summary_dict["num_warnings_per_id"].items()}
+                ),
+            }
+        )
+
+    def merge(self, other: "BatchSummary") -> None:
+        """
+        Adds the counts of another summary to this summary.
+        """
+        self.total += other.total
+        self.num_succeeds += other.num_succeeds
+        self.num_fails += other.num_fails
+        self.num_warnings += other.num_warnings
+        self.num_errors_total += other.num_errors_total
+        self.num_warnings_total += other.num_warnings_total
+        self.num_errors_per_id.update(other.num_errors_per_id)
+        self.num_warnings_per_id.update(other.num_warnings_per_id)
+
+
+async def _iterate(data_sets: Iterable[DataSetT] | AsyncIterable[DataSetT]) -> AsyncIterator[DataSetT]:
+    """
+    Iterates synchronous and asynchronous iterables alike.
+    """
+    if isinstance(data_sets, AsyncIterable):
+        async for data_set in data_sets:
+            yield data_set
+    else:
+        for data_set in data_sets:
+            yield data_set
+
+
+class BatchValidation(Generic[DataSetT]):
+    """
+    Validates a stream of data sets. Iterating over an instance yields a `ValidationResult` for each data set in the
+    order of the input. At most `concurrency` data sets are validated (and thus held in memory) at the same time.
+    The counts of all results are aggregated in `summary` while iterating.
+    E.g.:
+    ```
+    batch = validation_manager.validate_many(data_sets, concurrency=50)
+    async for validation_result in batch:
+        ...
+    print(batch.summary.num_fails)
+    ```
+    """
+
+    def __init__(
+        self,
+        validation_manager: "PVToolValidationManager[DataSetT]",
+        data_sets: Iterable[DataSetT] | AsyncIterable[DataSetT],
+        concurrency: int,
+    ):
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        self.validation_manager = validation_manager
+        self.data_sets = data_sets
+        self.concurrency = concurrency
+        self.summary = BatchSummary()
+
+    async def __aiter__(self) -> AsyncIterator[ValidationResult[DataSetT]]:
+        in_flight: deque[asyncio.Task[ValidationResult[DataSetT]]] = deque()
+        try:
+            async for data_set in _iterate(self.data_sets):
+                if len(in_flight) >= self.concurrency:
+                    yield await self._finish(in_flight.popleft())
+                in_flight.append(asyncio.create_task(self.validation_manager.validate(data_set)))
+            while in_flight:
+                yield await self._finish(in_flight.popleft())
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+    async def _finish(self, task: asyncio.Task[ValidationResult[DataSetT]]) -> ValidationResult[DataSetT]:
+        validation_result = await task
+        self.summary.add(validation_result)
+        return validation_result
+
+    async def run(self) -> BatchSummary:
+        """
+        Validates all data sets and returns the summary. Use this if you are not interested in the single results.
+        """
+        async for _ in self:
+            pass
+        return self.summary
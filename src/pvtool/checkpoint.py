@@ -0,0 +1,179 @@
+"""
+Contains stores which record the outcome of validated data sets in a SQLite database. The checkpoint store allows to
+resume a validation run which died (e.g. of millions of customers) without validating the completed data sets again.
+"""
+
+import json
+import sqlite3
+from abc import ABC, abstractmethod
+from operator import attrgetter
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Mapping, Optional, Self
+
+from .batch import DataSetSummary
+
+RECORD_ID_PATHS: dict[str, str] = {
+    "customer": "powercloud_customer_id",
+    # a Marktlokation may have several Messlokationen and Zaehler
+    "network": "marktlokation.marktlokations_id,zaehler.zaehlernummer",
+    "resource": "marktlokation.marktlokations_id,messlokation.messlokations_id,zaehler.zaehlernummer",
+}
+"""The (comma separated) attribute paths of the IDs identifying the data sets of the `pvtool` data set types"""
+
+
+class DuplicateRecordIdError(ValueError):
+    """
+    Raised if a record ID which has to be unique occurs several times in the same run.
+    """
+
+
+class SummaryStore(ABC):
+    """
+    Records the `DataSetSummary` of each validated data set in a SQLite database, keyed by a record ID derived from the
+    data set (see `record_id`).
+    The store is bound to the given parameters: Opening an existing store with different ones raises a ValueError
+    since the recorded outcomes don't apply anymore.
+    Each opening of the store is a new run. Only the outcomes recorded by previous runs are returned by `get`. If a
+    record ID is added several times in the same run, the first outcome is kept. If the record IDs have to be unique
+    (`unique_record_ids`), a `DuplicateRecordIdError` is raised instead.
+    The records are committed every `commit_interval` records and on exit, i.e. a crash loses at most the outcomes of
+    the last `commit_interval` records.
+    """
+
+    unique_record_ids: bool = False
+    """True if data sets with the same record ID may have different outcomes, i.e. a duplicate is an error"""
+
+    def __init__(self, path: Path | str, run_parameters: Mapping[str, str], commit_interval: int = 1000):
+        if commit_interval < 1:
+            raise ValueError(f"commit_interval must be at least 1, got {commit_interval}")
+        self.path = Path(path)
+        self.run_parameters = dict(run_parameters)
+        self.commit_interval = commit_interval
+        self._connection: Optional[sqlite3.Connection] = None
+        self._run = 0
+        self._num_uncommitted = 0
+
+    @abstractmethod
+    def record_id(self, data_set: Any) -> Optional[str]:
+        """
+        Returns the record ID of the data set or None if it has none (such data sets are not recorded).
+        """
+
+    def __enter__(self) -> Self:
+        connection = sqlite3.connect(self.path)
+        try:
+            connection.execute("CREATE TABLE IF NOT EXISTS run_parameters (name TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS records "
+                "(record_id TEXT PRIMARY KEY, run INTEGER NOT NULL, succeeded INTEGER NOT NULL, summary TEXT NOT NULL)"
+            )
+            stored_parameters = dict(connection.execute("SELECT name, value FROM run_parameters").fetchall())
+            if not stored_parameters:
+                connection.executemany("INSERT INTO run_parameters VALUES (?, ?)", self.run_parameters.items())
+            elif stored_parameters != self.run_parameters:
+                raise ValueError(
+                    f"The store {self.path} was created with the parameters {stored_parameters}, "
+                    f"it can't be resumed with {self.run_parameters}"
+                )
+            self._run = connection.execute("SELECT COALESCE(MAX(run), 0) + 1 FROM records").fetchone()[0]
+            connection.commit()
+        except BaseException:
+            connection.close()
+            raise
+        self._connection = connection
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if self._connection is not None:
+            self._connection.commit()
+            self._connection.close()
+            self._connection = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """The connection to the database. Raises a RuntimeError if the store is not opened."""
+        if self._connection is None:
+            raise RuntimeError(f"The store is not opened. Use {type(self).__name__} as context manager.")
+        return self._connection
+
+    def get(self, record_id: Optional[str]) -> Optional[DataSetSummary]:
+        """
+        Returns the outcome of the record recorded by a previous run or None if it wasn't validated yet.
+        """
+        if record_id is None:
+            return None
+        row = self.connection.execute(
+            "SELECT summary FROM records WHERE record_id = ? AND run < ?", (record_id, self._run)
+        ).fetchone()
+        return None if row is None else DataSetSummary.from_dict(json.loads(row[0]))
+
+    def add(self, record_id: Optional[str], data_set_summary: DataSetSummary) -> None:
+        """
+        Records the outcome of the record. Records without ID are ignored.
+        Raises a `DuplicateRecordIdError` if the record ID was added in this run already and has to be unique.
+        """
+        if record_id is None:
+            return
+        cursor = self.connection.execute(
+            "INSERT INTO records VALUES (?, ?, ?, ?) ON CONFLICT (record_id) DO UPDATE "
+            "SET run = excluded.run, succeeded = excluded.succeeded, summary = excluded.summary "
+            "WHERE records.run < excluded.run",
+            (record_id, self._run, data_set_summary.succeeded, json.dumps(data_set_summary.to_dict())),
+        )
+        if cursor.rowcount == 0 and self.unique_record_ids:
+            raise DuplicateRecordIdError(f"The record ID {record_id} occurs several times")
+        self._num_uncommitted += 1
+        if self._num_uncommitted >= self.commit_interval:
+            self.connection.commit()
+            self._num_uncommitted = 0
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+
+class CheckpointStore(SummaryStore):
+    """
+    A `SummaryStore` keyed by an ID attribute of the data sets (e.g. the `powercloud_customer_id` of customers) or by
+    several ones (comma separated paths, e.g. `marktlokation.marktlokations_id,zaehler.zaehlernummer`). Data sets
+    lacking any of them are not recorded.
+    The record IDs have to be unique within the validated data. It allows to resume a run which died.
+    The store is bound to the run parameters (e.g. the data set type and the migration key date) and the record ID path.
+    E.g.:
+    ```
+    with CheckpointStore("customers.sqlite", "powercloud_customer_id", {"data_set_type": "customer"}) as store:
+        for data_set in data_sets:
+            record_id = store.record_id(data_set)
+            if store.get(record_id) is None:
+                store.add(record_id, validate(data_set))
+    ```
+    """
+
+    unique_record_ids = True
+
+    def __init__(
+        self,
+        path: Path | str,
+        record_id_path: str,
+        run_parameters: Mapping[str, str],
+        commit_interval: int = 1000,
+    ):
+        super().__init__(path, {**run_parameters, "record_id_path": record_id_path}, commit_interval)
+        self.record_id_path = record_id_path
+        self._get_record_ids = [attrgetter(path.strip()) for path in record_id_path.split(",")]
+
+    def record_id(self, data_set: Any) -> Optional[str]:
+        try:
+            record_ids = [get_record_id(data_set) for get_record_id in self._get_record_ids]
+        except AttributeError:
+            return None
+        if any(record_id is None for record_id in record_ids):
+            return None
+        if len(record_ids) == 1:
+            return str(record_ids[0])
+        return json.dumps([str(record_id) for record_id in record_ids])
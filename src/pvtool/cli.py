@@ -0,0 +1,333 @@
+"""
+Contains the `pvtool` console command. It validates data sets from a JSON lines file (one data set per line) and
+writes the errors as JSON lines. The input is read and validated as a stream, i.e. the memory usage doesn't depend on
+the size of the file.
+E.g.:
+```
+pvtool customer customers.jsonl --migration-key-date 2023-06-01T00:00:00+00:00 --output errors.jsonl
+```
+"""
+
+import argparse
+import asyncio
+import dataclasses
+import json
+import logging
+import sys
+from collections import deque
+from contextlib import ExitStack
+from datetime import datetime
+from typing import IO, Any, Iterable, Iterator, Optional, Sequence
+
+import pydantic
+from bomf.config import MigrationConfig
+from bomf.model import Bo4eDataSet
+from ibims.datasets import TripicaCustomerLoaderDataSet, TripicaNetworkLoaderDataSet, TripicaResourceLoaderDataSet
+from injector import Module
+from pvframework.errors import ValidationMode
+
+from .batch import BatchSummary, DataSetSummary, ValidationErrorSummary
+from .checkpoint import RECORD_ID_PATHS, CheckpointStore, DuplicateRecordIdError, SummaryStore
+from .customer_loader import ValidationManagerProviderCustomer
+from .fail_fast import FailFast
+from .incremental import ContentHashStore
+from .instrumentation import ValidatorInstrumentation
+from .mmap_reader import MemoryMappedJsonLines
+from .network_loader import ValidationManagerProviderNetwork
+from .process_pool import build_validation_manager
+from .resource_loader import ValidationManagerProviderResource
+from .validation_manager import PVToolValidationManager
+
+DATA_SET_TYPES: dict[str, tuple[type[Bo4eDataSet], type[Module]]] = {
+    "customer": (TripicaCustomerLoaderDataSet, ValidationManagerProviderCustomer),
+    "network": (TripicaNetworkLoaderDataSet, ValidationManagerProviderNetwork),
+    "resource": (TripicaResourceLoaderDataSet, ValidationManagerProviderResource),
+}
+"""The data set types which can be validated by the command and the modules providing their ValidationManagers"""
+
+
+def read_data_sets(
+    lines: Iterable[str | memoryview], data_set_type: type[Bo4eDataSet]
+) -> Iterator[tuple[int, Bo4eDataSet | pydantic.ValidationError]]:
+    """
+    Parses each non-empty line as data set of the given type. Yields the line number (starting at 1) together with
+    the data set or the error if the line is not a valid data set.
+    The lines may also be memoryviews as yielded by `MemoryMappedJsonLines`.
+    """
+    for line_number, line in enumerate(lines, start=1):
+        # pydantic doesn't accept memoryviews as JSON input
+        json_data = bytes(line) if isinstance(line, memoryview) else line
+        if not json_data.strip():
+            continue
+        try:
+            yield line_number, data_set_type.model_validate_json(json_data)
+        except pydantic.ValidationError as error:
+            yield line_number, error
+
+
+def _error_record(line_number: int, error_summary: ValidationErrorSummary) -> dict[str, Any]:
+    return {"line": line_number, **dataclasses.asdict(error_summary)}
+
+
+def _parse_error_record(line_number: int, error: pydantic.ValidationError) -> dict[str, Any]:
+    return {
+        "line": line_number,
+        "error_id": None,
+        "error_type": type(error).__name__,
+        "message_detail": str(error),
+        "validator": None,
+        "mode": ValidationMode.ERROR,
+    }
+
+
+class ErrorWriter:
+    """
+    Writes the errors as JSON lines and counts the results
+    """
+
+    def __init__(self, output: IO[str], with_warnings: bool):
+        self.output = output
+        self.with_warnings = with_warnings
+        self.summary = BatchSummary()
+        self.num_parse_errors = 0
+        self.num_reused = 0
+
+    def write(self, record: dict[str, Any]) -> None:
+        """Writes a single record as JSON line"""
+        self.output.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def write_parse_error(self, line_number: int, error: pydantic.ValidationError) -> None:
+        """Writes the error of a line which could not be parsed"""
+        self.num_parse_errors += 1
+        self.write(_parse_error_record(line_number, error))
+
+    def write_data_set_summary(self, data_set_summary: DataSetSummary) -> None:
+        """Writes the errors (and warnings) of a validated data set"""
+        self.summary.add_data_set_summary(data_set_summary)
+        for error in data_set_summary.errors:
+            self.write(_error_record(data_set_summary.index, error))
+        if self.with_warnings:
+            for warning in data_set_summary.warnings:
+                self.write(_error_record(data_set_summary.index, warning))
+
+
+# pylint: disable=too-many-arguments, too-many-positional-arguments
+async def validate_lines(
+    lines: Iterable[str | memoryview],
+    data_set_type: type[Bo4eDataSet],
+    validation_manager: PVToolValidationManager,
+    error_writer: ErrorWriter,
+    concurrency: int = 100,
+    stores: Sequence[SummaryStore] = (),
+) -> None:
+    """
+    Validates the data sets in the lines and writes their errors in the order of the lines. The lines are consumed
+    lazily.
+    Data sets recorded in one of the given stores (e.g. a `CheckpointStore`) are not validated again but their recorded
+    errors are written. The outcomes of all other data sets are recorded in the stores.
+    """
+    # The lines in input order whose outcomes weren't written yet: the data sets being validated (without outcome) and
+    # behind them the parse errors and the reused summaries of later lines.
+    pending_lines: deque[tuple[int, list[Optional[str]], Optional[pydantic.ValidationError | DataSetSummary]]] = deque()
+
+    def _write(line_number: int, record_ids: list[Optional[str]], outcome: pydantic.ValidationError | DataSetSummary):
+        if isinstance(outcome, pydantic.ValidationError):
+            error_writer.write_parse_error(line_number, outcome)
+            return
+        error_writer.write_data_set_summary(outcome)
+        for store, record_id in zip(stores, record_ids):
+            store.add(record_id, outcome)
+
+    def _write_completed_lines() -> None:
+        while pending_lines and pending_lines[0][2] is not None:
+            line_number, record_ids, outcome = pending_lines.popleft()
+            assert outcome is not None
+            _write(line_number, record_ids, outcome)
+
+    def _data_sets() -> Iterator[Bo4eDataSet]:
+        for line_number, data_set_or_error in read_data_sets(lines, data_set_type):
+            if isinstance(data_set_or_error, pydantic.ValidationError):
+                pending_lines.append((line_number, [], data_set_or_error))
+                _write_completed_lines()
+                continue
+            record_ids = [store.record_id(data_set_or_error) for store in stores]
+            recorded_summary = next(
+                (
+                    summary
+                    for store, record_id in zip(stores, record_ids)
+                    if (summary := store.get(record_id)) is not None
+                ),
+                None,
+            )
+            if recorded_summary is not None:
+                error_writer.num_reused += 1
+                pending_lines.append(
+                    (line_number, record_ids, dataclasses.replace(recorded_summary, index=line_number))
+                )
+                _write_completed_lines()
+                continue
+            pending_lines.append((line_number, record_ids, None))
+            yield data_set_or_error
+
+    async for validation_result in validation_manager.validate_many(_data_sets(), concurrency=concurrency):
+        line_number, record_ids, _ = pending_lines.popleft()
+        _write(line_number, record_ids, DataSetSummary.from_validation_result(line_number, validation_result))
+        _write_completed_lines()
+    _write_completed_lines()
+
+
+def add_validation_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Adds the arguments configuring the validation (shared by the `pvtool` and `pvtool-shards` commands).
+    """
+    parser.add_argument("data_set_type", choices=sorted(DATA_SET_TYPES), help="The type of the data sets")
+    parser.add_argument(
+        "--migration-key-date",
+        type=datetime.fromisoformat,
+        help="The migration key date as ISO 8601 datetime with time zone. Required for customer data sets.",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=100, help="The number of data sets validated at the same time"
+    )
+    parser.add_argument("--no-warnings", action="store_true", help="Don't write the warnings")
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop validating a data set after the first error, the cheap validators first. Only the errors of the "
+        "first failed validator are written, but the same data sets fail. Together with --no-warnings, the validators "
+        "of warnings are skipped.",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="Log every error of the ValidationManager")
+
+
+def check_validation_arguments(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """
+    Exits with a usage error if the arguments added by `add_validation_arguments` don't fit together.
+    """
+    if args.data_set_type == "customer" and args.migration_key_date is None:
+        parser.error("--migration-key-date is required for customer data sets")
+    if args.migration_key_date is not None and args.migration_key_date.tzinfo is None:
+        parser.error("--migration-key-date must contain a time zone")
+
+
+def fail_fast_mode(args: argparse.Namespace) -> Optional[FailFast]:
+    """
+    Returns the fail-fast mode selected by the arguments added by `add_validation_arguments` (if any).
+    """
+    return FailFast(skip_warnings=args.no_warnings) if args.fail_fast else None
+
+
+def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="pvtool",
+        description="Validates ibims data sets from a JSON lines file (one data set per line) and writes the errors "
+        "as JSON lines.",
+    )
+    add_validation_arguments(parser)
+    parser.add_argument(
+        "input", nargs="?", default="-", help="The JSON lines file containing the data sets (default: stdin)"
+    )
+    parser.add_argument("-o", "--output", default="-", help="The file to write the errors to (default: stdout)")
+    parser.add_argument(
+        "--checkpoint",
+        help="A SQLite file recording the outcome of each validated data set. If the file exists (e.g. from a run "
+        "which died), the data sets recorded by the previous runs are not validated again.",
+    )
+    parser.add_argument(
+        "--record-id",
+        help="The attribute path of the ID identifying the data sets in the checkpoint. Several comma separated paths "
+        "form a composite ID. The IDs have to be unique (default: "
+        + ", ".join(
+            f"{record_id_path} for {data_set_type}" for data_set_type, record_id_path in RECORD_ID_PATHS.items()
+        )
+        + ")",
+    )
+    parser.add_argument(
+        "--result-cache",
+        help="A SQLite file recording the outcome of each validated data set by a hash of its content. Data sets which "
+        "didn't change since a previous run (with the same validators and migration key date) are not validated again.",
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print the wall time, the number of calls and errors and the latency percentiles of each validator",
+    )
+    args = parser.parse_args(argv)
+    check_validation_arguments(parser, args)
+    return args
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    The entry point of the `pvtool` command. Returns 0 if all data sets are valid, 1 otherwise (and 2 if the
+    checkpoint or result cache doesn't fit the arguments or the record IDs of the checkpoint aren't unique).
+    """
+    args = _parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.CRITICAL)
+    data_set_type, provider = DATA_SET_TYPES[args.data_set_type]
+    config = (
+        MigrationConfig(migration_key_date=args.migration_key_date) if args.migration_key_date is not None else None
+    )
+    validation_manager = build_validation_manager(provider, config, fail_fast_mode(args))
+    assert isinstance(validation_manager, PVToolValidationManager)
+
+    with ExitStack() as stack:
+        stores: list[SummaryStore] = []
+        try:
+            if args.checkpoint is not None:
+                stores.append(
+                    CheckpointStore(
+                        args.checkpoint,
+                        args.record_id or RECORD_ID_PATHS[args.data_set_type],
+                        {
+                            "data_set_type": args.data_set_type,
+                            "migration_key_date": str(args.migration_key_date),
+                            # the errors of a fail-fast run are incomplete
+                            **(
+                                {"fail_fast": repr(validation_manager.fail_fast)}
+                                if validation_manager.fail_fast is not None
+                                else {}
+                            ),
+                        },
+                    )
+                )
+            if args.result_cache is not None:
+                stores.append(ContentHashStore(args.result_cache, validation_manager))
+            for store in stores:
+                stack.enter_context(store)
+        except ValueError as error:
+            print(error, file=sys.stderr)
+            return 2
+        # files are memory-mapped, stdin is read line by line
+        lines: Iterable[str | memoryview] = (
+            sys.stdin if args.input == "-" else stack.enter_context(MemoryMappedJsonLines(args.input))
+        )
+        output_file = (
+            sys.stdout if args.output == "-" else stack.enter_context(open(args.output, "w", encoding="utf-8"))
+        )
+        error_writer = ErrorWriter(output_file, with_warnings=not args.no_warnings)
+        instrumentation = stack.enter_context(ValidatorInstrumentation().enabled()) if args.timings else None
+        try:
+            asyncio.run(
+                validate_lines(lines, data_set_type, validation_manager, error_writer, args.concurrency, stores)
+            )
+        except DuplicateRecordIdError as error:
+            print(f"{error}. Use --record-id to choose unique IDs (with a new checkpoint).", file=sys.stderr)
+            return 2
+
+    if instrumentation is not None:
+        print(instrumentation.format_report(), file=sys.stderr)
+
+    summary = error_writer.summary
+    print(
+        f"{summary.total} data sets validated: {summary.num_succeeds} succeeded, {summary.num_fails} failed, "
+        f"{summary.num_warnings} with warnings. {error_writer.num_parse_errors} lines could not be parsed.",
+        file=sys.stderr,
+    )
+    if error_writer.num_reused > 0:
+        print(f"{error_writer.num_reused} data sets were already validated by a previous run.", file=sys.stderr)
+    return 0 if summary.num_fails == 0 and error_writer.num_parse_errors == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
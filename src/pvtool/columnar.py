@@ -0,0 +1,97 @@
+"""
+Contains a columnar validation engine for simple per-field rules. Instead of executing a validator once per data set
+through the ValidationManager, the validated field is extracted from a whole batch of data sets into a column and a
+column rule decides for all values at once which of them are valid. Only the data sets with values which are not
+known to be valid are validated by the validator itself. Thus, the resulting errors (messages and IDs) are exactly the
+same as without the columnar engine.
+"""
+
+import operator
+from typing import TYPE_CHECKING, Any, Callable, Sequence
+
+from pvframework import PathMappedValidator
+from pvframework.types import DataSetT, MappedValidatorSyncAsync
+from pvframework.validator import is_sync
+
+if TYPE_CHECKING:
+    from .validation_manager import PVToolValidationManager
+
+ColumnRule = Callable[[Sequence[Any]], list[bool]]
+"""
+A column rule gets the values of a field for a batch of data sets and returns a mask which is True for each value that
+passes both, the type check of the pvframework and the validator. For all other values (e.g. values of the wrong type)
+the mask has to be False.
+"""
+
+_column_rules: dict[Callable[..., Any], ColumnRule] = {}
+
+
+class _Missing:  # pylint: disable=too-few-public-methods
+    """
+    Marks values which could not be extracted from a data set
+    """
+
+
+MISSING = _Missing()
+"""Is used in a column for data sets which don't contain the field"""
+
+
+def column_rule(validator_function: Callable[..., Any]) -> Callable[[ColumnRule], ColumnRule]:
+    """
+    Registers the decorated function as column rule of the given validator function. The validator function must
+    have exactly one parameter.
+    """
+
+    def decorator(rule: ColumnRule) -> ColumnRule:
+        _column_rules[validator_function] = rule
+        return rule
+
+    return decorator
+
+
+def get_column_rule(mapped_validator: MappedValidatorSyncAsync) -> ColumnRule | None:
+    """
+    Returns the column rule of the mapped validator or None if it can't be validated columnar. This is only possible
+    for synchronous PathMappedValidators whose validator function has a single parameter and a registered column rule.
+    """
+    if not isinstance(mapped_validator, PathMappedValidator) or not is_sync(mapped_validator):
+        return None
+    if len(mapped_validator.validator.param_names) != 1:
+        return None
+    return _column_rules.get(mapped_validator.validator.func)
+
+
+def extract_column(data_sets: Sequence[Any], attribute_path: str) -> list[Any]:
+    """
+    Extracts the values at the given attribute path (e.g. `marktlokation.marktlokations_id`) from all data sets.
+    If a data set doesn't contain the attribute, its value in the column is `MISSING`.
+    """
+    getter = operator.attrgetter(attribute_path)
+    column: list[Any] = []
+    for data_set in data_sets:
+        try:
+            column.append(getter(data_set))
+        except AttributeError:
+            column.append(MISSING)
+    return column
+
+
+def find_passing_validators(
+    validation_manager: "PVToolValidationManager[DataSetT]", data_sets: Sequence[DataSetT]
+) -> list[set[MappedValidatorSyncAsync]]:
+    """
+    Evaluates the column rules of all suitable validators of the manager on the batch of data sets. Returns for each
+    data set the set of mapped validators which are known to pass, i.e. which don't have to be executed anymore.
+    """
+    passing_validators: list[set[MappedValidatorSyncAsync]] = [set() for _ in data_sets]
+    for mapped_validator in validation_manager.execution_order:
+        rule = get_column_rule(mapped_validator)
+        if rule is None:
+            continue
+        assert isinstance(mapped_validator, PathMappedValidator)
+        (attribute_path,) = mapped_validator.param_map.values()
+        mask = rule(extract_column(data_sets, attribute_path))
+        for passing, passing_validators_of_data_set in zip(mask, passing_validators):
+            if passing:
+                passing_validators_of_data_set.add(mapped_validator)
+    return passing_validators
@@ -2,35 +2,45 @@
 Contains validation logic for TripicaCustomerLoaderDataSet
 """
 
-import re
 from datetime import date, datetime
-from typing import Any, Generator, Optional, TypeAlias, TypeVar
+from typing import Any, Generator, Optional, Sequence, TypeAlias, TypeVar
 
 from bomf.config import MigrationConfig
-from dateutil.relativedelta import relativedelta
 from email_validator import validate_email
-from ibims.bo4e import Adresse, Anrede, Landescode, VertragskontoCBA, VertragskontoMBA, ZusatzAttribut
+from email_validator.rfc_constants import EMAIL_MAX_LENGTH, LOCAL_PART_MAX_LENGTH
+from ibims.bo4e import Adresse, Anrede, Bankverbindung, Landescode, VertragskontoCBA, VertragskontoMBA, ZusatzAttribut
 from ibims.datasets import TripicaCustomerLoaderDataSet
-from injector import Module, provider
+from injector import provider
 from more_itertools import first_true
-from pvframework import (
-    ParallelQueryMappedValidator,
-    PathMappedValidator,
-    Query,
-    QueryMappedValidator,
-    ValidationManager,
-    Validator,
-)
+from pvframework import ParallelQueryMappedValidator, QueryMappedValidator, ValidationManager, Validator
 from pvframework.errors import ValidationMode
 from pvframework.types import SyncValidatorFunction
 from pvframework.utils import param, required_field
 from pytz import timezone
-from schwifty import BIC, IBAN
 
-from .utils import migration_config
-from .validation_manager import ValidationManagerWithConfig
+from .columnar import column_rule
+from .fail_fast import ValidatorCost, validator_cost
+from .field_access import PlannedPathMappedValidator
+from .patterns import (
+    REGEX_SIMPLE_E_MAIL,
+    REGEX_TEL_NR,
+    REGEX_TEL_NR_IGNORED_CHARS,
+    is_ascii_alphanumeric,
+    is_ascii_digits,
+)
+from .query_plan import PlannedQuery
+from .utils import key_date_context
+from .validation_cache import bic_validation_cache, e_mail_domain_validation_cache, iban_validation_cache, pure
+from .validation_manager import (
+    KeyDateContext,
+    RuleGroup,
+    ValidationManagerProvider,
+    ValidationManagerWithConfig,
+    config_cache_key,
+)
 
 _berlin = timezone("Europe/Berlin")
+_EARLIEST_BIRTHDAY = date(1900, 1, 1)
 
 
 def get_zusatz_attribut(name: str, zusatz_attribute: list[ZusatzAttribut]) -> Optional[str]:
@@ -53,6 +63,7 @@ def check_geschaeftspartner_anrede(anrede: Anrede):
         )
 
 
+@pure()
 def check_str_is_stripped(string: str):
     """
     geschaeftspartner.nachname must not start with whitespace. Further validation is difficult because e.g.
@@ -63,13 +74,26 @@ def check_str_is_stripped(string: str):
         raise ValueError(f"{param('string').param_id} must not start or end with whitespace.")
 
 
+@validator_cost(ValidatorCost.EXPENSIVE)
 def check_e_mail(e_mail: Optional[str] = None):
     """
-    geschaeftspartner.e_mail_adresse must match the regex pattern `REGEX_E_MAIL`.
+    geschaeftspartner.e_mail_adresse must be a valid e-mail address according to `email_validator`.
+    Plain ASCII addresses (`REGEX_SIMPLE_E_MAIL`) are checked without the unicode and IDNA handling of
+    `email_validator` and the validation results of their domains are cached. All other addresses are checked by
+    `email_validator.validate_email`. The error messages are the same in both cases.
     """
     if not e_mail:
         return
-    validate_email(e_mail, check_deliverability=False)
+    match = REGEX_SIMPLE_E_MAIL.fullmatch(e_mail)
+    if match is None or len(match["local_part"]) > LOCAL_PART_MAX_LENGTH:
+        validate_email(e_mail, check_deliverability=False)
+        return
+    domain = e_mail_domain_validation_cache.validate(match["domain"])
+    # email_validator checks the length of the original, the normalized and the ASCII form of the address
+    longest_domain = max(len(match["domain"]), len(domain["domain"].encode("utf8")), len(domain["ascii_domain"]))
+    if len(match["local_part"]) + 1 + longest_domain > EMAIL_MAX_LENGTH:
+        # let email_validator create the error message
+        validate_email(e_mail, check_deliverability=False)
 
 
 def check_extern_customer_id(zusatz_attribute: list[ZusatzAttribut]):
@@ -79,7 +103,7 @@ def check_extern_customer_id(zusatz_attribute: list[ZusatzAttribut]):
     customer_id = get_zusatz_attribut("customerID", zusatz_attribute)
     if customer_id is None:
         raise ValueError("No Zusatzattribute with name customerID")
-    if re.match(r"^2\d{8}$", customer_id) is None:
+    if not (customer_id.startswith("2") and is_ascii_digits(customer_id, 9)):
         raise ValueError(
             f"{param('zusatz_attribute').param_id} -> customerID has to start with 2 followed by 8 digits."
         )
@@ -89,21 +113,19 @@ def check_date_in_past_required(past_date: datetime):
     """
     The date is required and must be in the past as of the migration_key_date
     """
-    config = migration_config()
-    if past_date.astimezone(_berlin).date() > config.migration_key_date.astimezone(_berlin).date():
-        raise ValueError(
-            f"{param('past_date').param_id} must be in the past as of " + str(config.migration_key_date.isoformat())
-        )
+    key_dates = key_date_context()
+    if past_date.astimezone(_berlin).date() > key_dates.migration_key_date_berlin:
+        raise ValueError(f"{param('past_date').param_id} must be in the past as of " + key_dates.migration_key_date_iso)
 
 
 def check_date_in_future_required(future_date: datetime):
     """
     The date is required and must be in the future as of the migration_key_date
     """
-    config = migration_config()
-    if future_date < config.migration_key_date:
+    key_dates = key_date_context()
+    if future_date < key_dates.migration_key_date_utc:
         raise ValueError(
-            f"{param('future_date').param_id} must be in the future as of " + str(config.migration_key_date.isoformat())
+            f"{param('future_date').param_id} must be in the future as of " + key_dates.migration_key_date_iso
         )
 
 
@@ -111,24 +133,19 @@ def check_date_in_past_optional(past_date: Optional[datetime] = None):
     """
     The date is optional and must be in the past as of the migration_key_date
     """
-    config = migration_config()
-    if (
-        past_date is not None
-        and past_date.astimezone(_berlin).date() > config.migration_key_date.astimezone(_berlin).date()
-    ):
-        raise ValueError(
-            f"{param('past_date').param_id} must be in the past as of " + str(config.migration_key_date.isoformat())
-        )
+    key_dates = key_date_context()
+    if past_date is not None and past_date.astimezone(_berlin).date() > key_dates.migration_key_date_berlin:
+        raise ValueError(f"{param('past_date').param_id} must be in the past as of " + key_dates.migration_key_date_iso)
 
 
 def check_date_in_future_optional(future_date: Optional[datetime] = None):
     """
     The date is optional and must be in the future as of the migration_key_date
     """
-    config = migration_config()
-    if future_date is not None and future_date < config.migration_key_date:
+    key_dates = key_date_context()
+    if future_date is not None and future_date < key_dates.migration_key_date_utc:
         raise ValueError(
-            f"{param('future_date').param_id} must be in the future as of " + str(config.migration_key_date.isoformat())
+            f"{param('future_date').param_id} must be in the future as of " + key_dates.migration_key_date_iso
         )
 
 
@@ -136,13 +153,13 @@ def check_date_in_past_bankverbindung(is_sepa_zahler: bool, past_date: Optional[
     """
     The date is required if customer is sepa_zahler, and must be in the past as of the migration_key_date
     """
-    config = migration_config()
+    key_dates = key_date_context()
     if is_sepa_zahler:
         if past_date is None:
             raise ValueError(f"{param('past_date').param_id} is required for sepa_zahler")
-        if past_date.astimezone(_berlin).date() > config.migration_key_date.astimezone(_berlin).date():
+        if past_date.astimezone(_berlin).date() > key_dates.migration_key_date_berlin:
             raise ValueError(
-                f"{param('past_date').param_id} must be in the past as of " + str(config.migration_key_date.isoformat())
+                f"{param('past_date').param_id} must be in the past as of " + key_dates.migration_key_date_iso
             )
 
 
@@ -150,27 +167,20 @@ def check_geschaeftspartner_geburtsdatum(geburtsdatum: datetime):
     """
     geschaeftspartner.geburtsdatum must be at least 18 years ago in the past but not earlier than 1900-01-01.
     """
-    config = migration_config()
     birthday_date = geburtsdatum.astimezone(_berlin).date()
-    latest_18 = config.migration_key_date.astimezone(_berlin).date() - relativedelta(years=18)
-    earliest_birthday = date(1900, 1, 1)
-    if birthday_date > latest_18 or birthday_date < earliest_birthday:
-        # Had to use dateutil here, because I didn't want to manually catch the case if somebody was born on 29th
-        # stdlib timedelta doesn't support years as kwarg
-        # February.
+    latest_18 = key_date_context().latest_adult_birthday
+    if birthday_date > latest_18 or birthday_date < _EARLIEST_BIRTHDAY:
         raise ValueError(
-            f"{param('geburtsdatum').param_id} must be in the range of " f"{earliest_birthday} to {latest_18}."
+            f"{param('geburtsdatum').param_id} must be in the range of " f"{_EARLIEST_BIRTHDAY} to {latest_18}."
         )
 
 
-REGEX_TEL_NR = re.compile(r"^(\+?[1-9]|0)[0-9]{7,14}$")
-
-
+@pure()
 def check_telefonnummer(telefonnummer: Optional[str] = None):
     r"""
     telefonnummer must match the regex pattern `REGEX_TEL_NR` (ignoring all following characters: r"[-.\s()]").
     """
-    if telefonnummer and re.match(REGEX_TEL_NR, re.sub(r"[-.\s()]", "", telefonnummer)) is None:
+    if telefonnummer and REGEX_TEL_NR.match(REGEX_TEL_NR_IGNORED_CHARS.sub("", telefonnummer)) is None:
         raise ValueError(f"{param('telefonnummer').param_id} does not match the regex pattern " "for phone numbers.")
 
 
@@ -180,10 +190,11 @@ def check_address_deutsch(address: Adresse):
     """
     if required_field(address, "landescode", Landescode) != Landescode.DE:  # type:ignore[attr-defined]
         raise ValueError(f"{param('address').param_id}.landescode must be 'DE'")
-    if not re.match(r"^\d{5}$", required_field(address, "postleitzahl", str)):
+    if not is_ascii_digits(required_field(address, "postleitzahl", str), 5):
         raise ValueError(f"{param('address').param_id}.postleitzahl must consist of 5 digits")
 
 
+@validator_cost(ValidatorCost.EXPENSIVE)
 def check_address_fields(address: Adresse):
     """
     This function reuses the pydantic validator function `strasse_xor_postfach` of the bo4e model `Addresse`.
@@ -217,33 +228,38 @@ def check_address_fields(address: Adresse):
     raise ValueError('You have to define either "strasse" and "hausnummer" or "postfach".')
 
 
+@pure()
 def check_postleitzahl(postleitzahl: str):
     """
     Check that `postleitzahl` consists of only digits and letters (case-insensitive).
     """
-    if not re.match(r"^[\dA-Za-z]+$", postleitzahl):
+    if not is_ascii_alphanumeric(postleitzahl):
         raise ValueError(f"{param('postleitzahl').param_id} is invalid")
 
 
+@validator_cost(ValidatorCost.EXPENSIVE)
 def check_iban(sepa_zahler: bool, iban: Optional[str] = None):
     r"""
     If sepa_zahler is True, iban is required and it will be checked if the IBAN is valid.
     If sepa_zahler is False, the test passes.
+    The results of the validation are cached, see `iban_validation_cache`.
     """
     if sepa_zahler:
         if iban is None:
             raise ValueError(f"{param('iban').param_id} is required for sepa_zahler")
-        IBAN(iban).validate()
+        iban_validation_cache.validate(iban)
 
 
+@validator_cost(ValidatorCost.EXPENSIVE)
 def check_bic(sepa_zahler: bool, bic: Optional[str] = None):
     """
     bic must consist of 8 or 11 alphanumeric characters.
+    The results of the validation are cached, see `bic_validation_cache`.
     """
     if sepa_zahler:
         if bic is None:
             raise ValueError(f"{param('bic').param_id} is required for sepa_zahler")
-        BIC(bic).validate()
+        bic_validation_cache.validate(bic)
 
 
 def check_kontoinhaber(is_sepa_zahler: bool, kontoinhaber: Optional[str] = None):
@@ -269,11 +285,55 @@ def check_bankname(is_sepa_zahler: bool, bankname: Optional[str] = None):
             raise ValueError(f"{param('bankname').param_id} must not be empty")
 
 
+def _bankverbindung_passes_sepa_rules(bankverbindung: Bankverbindung, key_dates: KeyDateContext) -> bool:
+    """
+    Checks the SEPA rules of a single bank detail, see `bankverbindungen_pass_sepa_rules`.
+    """
+    try:
+        sepa_zahler = bankverbindung.sepa_info.sepa_zahler  # type:ignore[union-attr]
+        iban, bic = bankverbindung.iban, bankverbindung.bic
+        kontoinhaber, bankname = bankverbindung.kontoinhaber, bankverbindung.bankname
+        gueltig_seit = bankverbindung.gueltig_seit
+    except AttributeError:
+        return False
+    if (
+        not isinstance(sepa_zahler, bool)
+        or not all(text is None or isinstance(text, str) for text in (iban, bic, kontoinhaber, bankname))
+        or not (gueltig_seit is None or isinstance(gueltig_seit, datetime))
+    ):
+        return False
+    if not sepa_zahler:
+        return True
+    has_names = bool((kontoinhaber or "").strip() and (bankname or "").strip())
+    if iban is None or bic is None or gueltig_seit is None or not has_names:
+        return False
+    try:
+        iban_validation_cache.validate(iban)
+        bic_validation_cache.validate(bic)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return False
+    return gueltig_seit.astimezone(_berlin).date() <= key_dates.migration_key_date_berlin
+
+
+def bankverbindungen_pass_sepa_rules(data_set: TripicaCustomerLoaderDataSet) -> bool:
+    """
+    Checks the SEPA rules of all bank details (`check_iban`, `check_bic`, `check_kontoinhaber`, `check_bankname` and
+    `check_date_in_past_bankverbindung`) in a single pass over `banks`. Bank details of non-SEPA payers are skipped
+    after the type checks. Returns True only if all the validators would pass. For any unusual data (e.g. missing
+    fields or values of wrong types) it returns False s.t. the validators are executed and report the errors.
+    """
+    banks = getattr(data_set, "banks", None)
+    if not isinstance(banks, dict):
+        return False
+    key_dates = key_date_context()
+    return all(_bankverbindung_passes_sepa_rules(bankverbindung, key_dates) for bankverbindung in banks.values())
+
+
 def check_vertragskontonummer(vertragskontonummer: str):
     """
     vertragskontonummer of every cba must consist of 9 digits.
     """
-    if re.match(r"^\d{9}$", vertragskontonummer) is None:
+    if not is_ascii_digits(vertragskontonummer, 9):
         raise ValueError(f"{param('vertragskontonummer').param_id} must consist of 9 digits")
 
 
@@ -287,6 +347,19 @@ def is_datetime(date_to_check: datetime):
 
 ValidatorType: TypeAlias = Validator[TripicaCustomerLoaderDataSet, SyncValidatorFunction]
 
+
+@column_rule(check_str_is_stripped)
+def str_is_stripped_column_rule(strings: Sequence[Any]) -> list[bool]:
+    """The column rule of `check_str_is_stripped`"""
+    return [isinstance(string, str) and string.strip() == string for string in strings]
+
+
+@column_rule(check_postleitzahl)
+def postleitzahl_column_rule(postleitzahlen: Sequence[Any]) -> list[bool]:
+    """The column rule of `check_postleitzahl`"""
+    return [isinstance(postleitzahl, str) and is_ascii_alphanumeric(postleitzahl) for postleitzahl in postleitzahlen]
+
+
 validate_geschaeftspartner_anrede: ValidatorType = Validator(check_geschaeftspartner_anrede)
 validate_str_is_stripped: ValidatorType = Validator(check_str_is_stripped)
 validate_e_mail: ValidatorType = Validator(check_e_mail)
@@ -330,156 +403,204 @@ def iter_vertragskonten(
     return ((vertragskonto, f"[ouid={vertragskonto.ouid}]") for vertragskonto in vertragskonten)
 
 
-class ValidationManagerProviderCustomer(Module):
+def build_customer_validation_manager(
+    config: MigrationConfig,
+) -> ValidationManagerWithConfig[TripicaCustomerLoaderDataSet]:
     """
-    This module provides a ValidationManager for customer loader with an injected MigrationConfig
+    Builds a ValidationManager for customer loader with the given MigrationConfig and registers all validators.
     """
-
-    @provider
-    def customer_validation_manager(self, config: MigrationConfig) -> ValidationManager:
-        """
-        This method provides a ValidationManager for customer loader with an injected MigrationConfig
-        """
-        customer_manager = ValidationManagerWithConfig[TripicaCustomerLoaderDataSet](
-            config, manager_id="CustomerLoader"
-        )
-        customer_manager.register(
-            PathMappedValidator(validate_geschaeftspartner_anrede, {"anrede": "geschaeftspartner.anrede"}),
-            mode=ValidationMode.WARNING,
-        )
-        customer_manager.register(
-            PathMappedValidator(validate_str_is_stripped, {"string": "geschaeftspartner.nachname"})
-        )
-        customer_manager.register(
-            PathMappedValidator(validate_str_is_stripped, {"string": "geschaeftspartner.vorname"})
-        )
-        customer_manager.register(PathMappedValidator(validate_e_mail, {"e_mail": "geschaeftspartner.e_mail_adresse"}))
-        customer_manager.register(
-            PathMappedValidator(validate_extern_customer_id, {"zusatz_attribute": "geschaeftspartner.zusatz_attribute"})
-        )
-        customer_manager.register(
-            PathMappedValidator(validate_date_in_past_required, {"past_date": "geschaeftspartner.erstellungsdatum"})
-        )
-        customer_manager.register(
-            PathMappedValidator(
-                validate_geschaeftspartner_geburtsdatum, {"geburtsdatum": "geschaeftspartner.geburtstag"}
-            ),
-            mode=ValidationMode.WARNING,
-        )
-        customer_manager.register(
-            PathMappedValidator(validate_telefonnummer, {"telefonnummer": "geschaeftspartner.telefonnummer_privat"}),
-            mode=ValidationMode.WARNING,
+    customer_manager = ValidationManagerWithConfig[TripicaCustomerLoaderDataSet](config, manager_id="CustomerLoader")
+    customer_manager.register(
+        PlannedPathMappedValidator(validate_geschaeftspartner_anrede, {"anrede": "geschaeftspartner.anrede"}),
+        mode=ValidationMode.WARNING,
+    )
+    customer_manager.register(
+        PlannedPathMappedValidator(validate_str_is_stripped, {"string": "geschaeftspartner.nachname"})
+    )
+    customer_manager.register(
+        PlannedPathMappedValidator(validate_str_is_stripped, {"string": "geschaeftspartner.vorname"})
+    )
+    customer_manager.register(
+        PlannedPathMappedValidator(validate_e_mail, {"e_mail": "geschaeftspartner.e_mail_adresse"})
+    )
+    customer_manager.register(
+        PlannedPathMappedValidator(
+            validate_extern_customer_id, {"zusatz_attribute": "geschaeftspartner.zusatz_attribute"}
         )
-        customer_manager.register(
-            PathMappedValidator(validate_telefonnummer, {"telefonnummer": "geschaeftspartner.telefonnummer_geschaeft"}),
-            mode=ValidationMode.WARNING,
+    )
+    customer_manager.register(
+        PlannedPathMappedValidator(validate_date_in_past_required, {"past_date": "geschaeftspartner.erstellungsdatum"})
+    )
+    customer_manager.register(
+        PlannedPathMappedValidator(
+            validate_geschaeftspartner_geburtsdatum, {"geburtsdatum": "geschaeftspartner.geburtstag"}
+        ),
+        mode=ValidationMode.WARNING,
+    )
+    customer_manager.register(
+        PlannedPathMappedValidator(validate_telefonnummer, {"telefonnummer": "geschaeftspartner.telefonnummer_privat"}),
+        mode=ValidationMode.WARNING,
+    )
+    customer_manager.register(
+        PlannedPathMappedValidator(
+            validate_telefonnummer, {"telefonnummer": "geschaeftspartner.telefonnummer_geschaeft"}
+        ),
+        mode=ValidationMode.WARNING,
+    )
+    customer_manager.register(
+        PlannedPathMappedValidator(validate_telefonnummer, {"telefonnummer": "geschaeftspartner.telefonnummer_mobil"}),
+        mode=ValidationMode.WARNING,
+    )
+    customer_manager.register(
+        QueryMappedValidator(
+            validate_address_deutsch, {"address": PlannedQuery().path("liefer_adressen").iter(iter_contract_id_dict)}
         )
-        customer_manager.register(
-            PathMappedValidator(validate_telefonnummer, {"telefonnummer": "geschaeftspartner.telefonnummer_mobil"}),
-            mode=ValidationMode.WARNING,
+    )
+    customer_manager.register(
+        QueryMappedValidator(
+            validate_address_fields, {"address": PlannedQuery().path("liefer_adressen").iter(iter_contract_id_dict)}
         )
-        customer_manager.register(
-            QueryMappedValidator(
-                validate_address_deutsch, {"address": Query().path("liefer_adressen").iter(iter_contract_id_dict)}
-            )
+    )
+    customer_manager.register(
+        QueryMappedValidator(
+            validate_address_fields, {"address": PlannedQuery().path("rechnungs_adressen").iter(iter_contract_id_dict)}
         )
-        customer_manager.register(
-            QueryMappedValidator(
-                validate_address_fields, {"address": Query().path("liefer_adressen").iter(iter_contract_id_dict)}
-            )
+    )
+    customer_manager.register(
+        QueryMappedValidator(
+            validate_postleitzahl,
+            {
+                "postleitzahl": PlannedQuery()
+                .path("rechnungs_adressen")
+                .iter(iter_contract_id_dict)
+                .path("postleitzahl")
+            },
         )
-        customer_manager.register(
-            QueryMappedValidator(
-                validate_address_fields, {"address": Query().path("rechnungs_adressen").iter(iter_contract_id_dict)}
-            )
+    )
+    customer_manager.register(
+        ParallelQueryMappedValidator(
+            validate_iban,
+            {
+                "iban": PlannedQuery().path("banks").iter(iter_contract_id_dict).path("iban"),
+                "sepa_zahler": PlannedQuery().path("banks").iter(iter_contract_id_dict).path("sepa_info.sepa_zahler"),
+            },
         )
-        customer_manager.register(
-            QueryMappedValidator(
-                validate_postleitzahl,
-                {"postleitzahl": Query().path("rechnungs_adressen").iter(iter_contract_id_dict).path("postleitzahl")},
-            )
+    )
+    customer_manager.register(
+        ParallelQueryMappedValidator(
+            validate_bic,
+            {
+                "bic": PlannedQuery().path("banks").iter(iter_contract_id_dict).path("bic"),
+                "sepa_zahler": PlannedQuery().path("banks").iter(iter_contract_id_dict).path("sepa_info.sepa_zahler"),
+            },
         )
-        customer_manager.register(
-            ParallelQueryMappedValidator(
-                validate_iban,
-                {
-                    "iban": Query().path("banks").iter(iter_contract_id_dict).path("iban"),
-                    "sepa_zahler": Query().path("banks").iter(iter_contract_id_dict).path("sepa_info.sepa_zahler"),
-                },
-            )
+    )
+    customer_manager.register(
+        ParallelQueryMappedValidator(
+            validate_kontoinhaber,
+            {
+                "kontoinhaber": PlannedQuery().path("banks").iter(iter_contract_id_dict).path("kontoinhaber"),
+                "is_sepa_zahler": PlannedQuery()
+                .path("banks")
+                .iter(iter_contract_id_dict)
+                .path("sepa_info.sepa_zahler"),
+            },
         )
-        customer_manager.register(
-            ParallelQueryMappedValidator(
-                validate_bic,
-                {
-                    "bic": Query().path("banks").iter(iter_contract_id_dict).path("bic"),
-                    "sepa_zahler": Query().path("banks").iter(iter_contract_id_dict).path("sepa_info.sepa_zahler"),
-                },
-            )
+    )
+    customer_manager.register(
+        ParallelQueryMappedValidator(
+            validate_date_in_past_bankverbindung,
+            {
+                "past_date": PlannedQuery().path("banks").iter(iter_contract_id_dict).path("gueltig_seit"),
+                "is_sepa_zahler": PlannedQuery()
+                .path("banks")
+                .iter(iter_contract_id_dict)
+                .path("sepa_info.sepa_zahler"),
+            },
         )
-        customer_manager.register(
-            ParallelQueryMappedValidator(
-                validate_kontoinhaber,
-                {
-                    "kontoinhaber": Query().path("banks").iter(iter_contract_id_dict).path("kontoinhaber"),
-                    "is_sepa_zahler": Query().path("banks").iter(iter_contract_id_dict).path("sepa_info.sepa_zahler"),
-                },
-            )
+    )
+    customer_manager.register(
+        QueryMappedValidator(
+            validate_date_in_future_optional,
+            {"future_date": PlannedQuery().path("banks").iter(iter_contract_id_dict).path("gueltig_bis")},
         )
-        customer_manager.register(
-            ParallelQueryMappedValidator(
-                validate_date_in_past_bankverbindung,
-                {
-                    "past_date": Query().path("banks").iter(iter_contract_id_dict).path("gueltig_seit"),
-                    "is_sepa_zahler": Query().path("banks").iter(iter_contract_id_dict).path("sepa_info.sepa_zahler"),
-                },
-            )
+    )
+    customer_manager.register(
+        QueryMappedValidator(
+            validate_date_in_past_optional,
+            {"past_date": PlannedQuery().path("banks").iter(iter_contract_id_dict).path("sepa_info.gueltig_seit")},
         )
-        customer_manager.register(
-            QueryMappedValidator(
-                validate_date_in_future_optional,
-                {"future_date": Query().path("banks").iter(iter_contract_id_dict).path("gueltig_bis")},
-            )
+    )
+    customer_manager.register(
+        ParallelQueryMappedValidator(
+            validate_bankname,
+            {
+                "bankname": PlannedQuery().path("banks").iter(iter_contract_id_dict).path("bankname"),
+                "is_sepa_zahler": PlannedQuery()
+                .path("banks")
+                .iter(iter_contract_id_dict)
+                .path("sepa_info.sepa_zahler"),
+            },
         )
-        customer_manager.register(
-            QueryMappedValidator(
-                validate_date_in_past_optional,
-                {"past_date": Query().path("banks").iter(iter_contract_id_dict).path("sepa_info.gueltig_seit")},
-            )
+    )
+    customer_manager.register(
+        QueryMappedValidator(
+            validate_vertragskontonummer,
+            {
+                "vertragskontonummer": PlannedQuery()
+                .path("vertragskonten_mbas")
+                .iter(iter_vertragskonten)
+                .path("cbas")
+                .iter(iter_vertragskonten)
+                .path("vertrag.vertragsnummer")
+            },
         )
-        customer_manager.register(
-            ParallelQueryMappedValidator(
-                validate_bankname,
-                {
-                    "bankname": Query().path("banks").iter(iter_contract_id_dict).path("bankname"),
-                    "is_sepa_zahler": Query().path("banks").iter(iter_contract_id_dict).path("sepa_info.sepa_zahler"),
-                },
-            )
+    )
+    customer_manager.register(
+        QueryMappedValidator(
+            validate_is_datetime,
+            {
+                "date_to_check": PlannedQuery()
+                .path("vertragskonten_mbas")
+                .iter(iter_vertragskonten)
+                .path("cbas")
+                .iter(iter_vertragskonten)
+                .path("erstellungsdatum")
+            },
         )
-        customer_manager.register(
-            QueryMappedValidator(
-                validate_vertragskontonummer,
-                {
-                    "vertragskontonummer": Query()
-                    .path("vertragskonten_mbas")
-                    .iter(iter_vertragskonten)
-                    .path("cbas")
-                    .iter(iter_vertragskonten)
-                    .path("vertrag.vertragsnummer")
-                },
-            )
+    )
+    sepa_validators = {
+        validate_iban,
+        validate_bic,
+        validate_kontoinhaber,
+        validate_bankname,
+        validate_date_in_past_bankverbindung,
+    }
+    customer_manager.register_rule_group(
+        RuleGroup(
+            "Bankverbindung",
+            frozenset(
+                mapped_validator
+                for mapped_validator in customer_manager.validators
+                if mapped_validator.validator in sepa_validators
+            ),
+            bankverbindungen_pass_sepa_rules,
         )
-        customer_manager.register(
-            QueryMappedValidator(
-                validate_is_datetime,
-                {
-                    "date_to_check": Query()
-                    .path("vertragskonten_mbas")
-                    .iter(iter_vertragskonten)
-                    .path("cbas")
-                    .iter(iter_vertragskonten)
-                    .path("erstellungsdatum")
-                },
-            )
+    )
+    return customer_manager
+
+
+class ValidationManagerProviderCustomer(ValidationManagerProvider):
+    """
+    This module provides a ValidationManager for customer loader with an injected MigrationConfig
+    """
+
+    @provider
+    def customer_validation_manager(self, config: MigrationConfig) -> ValidationManager:
+        """
+        This method provides a ValidationManager for customer loader with an injected MigrationConfig
+        The manager is built once per MigrationConfig (and fail-fast mode) and reused afterwards.
+        """
+        return self._cached_validation_manager(
+            (TripicaCustomerLoaderDataSet, config_cache_key(config)), lambda: build_customer_validation_manager(config)
         )
-        return customer_manager
@@ -0,0 +1,87 @@
+"""
+Contains the fail-fast mode of the pvtool validation managers (see `PVToolValidationManager.fail_fast`). It is meant for
+consumers which only need to know whether a data set is valid or not:
+- The validators are executed in the order of their cost (see `validator_cost`), the cheap ones first.
+- The validation of a data set stops after the first validator which raised an error in `ValidationMode.ERROR`.
+- Optionally, the validators in `ValidationMode.WARNING` are not executed at all.
+Thus, the validation result tells correctly whether a data set is valid. But it contains only the errors of the first
+failed validator (and the warnings raised until then).
+"""
+
+from dataclasses import dataclass
+from enum import IntEnum
+from graphlib import TopologicalSorter
+from typing import Any, Callable, Iterable, Mapping, TypeVar
+
+from pvframework.types import MappedValidatorSyncAsync
+
+ValidatorFunctionT = TypeVar("ValidatorFunctionT", bound=Callable[..., Any])
+
+
+class ValidatorCost(IntEnum):
+    """
+    The (rough) cost of a validator function. It determines the execution order in the fail-fast mode.
+    """
+
+    CHEAP = 0
+    """Comparisons, regular expressions and alike. This is the default."""
+    EXPENSIVE = 1
+    """E.g. third-party validations like schwifty or email_validator or the inspection of the call stack"""
+
+
+@dataclass(frozen=True)
+class FailFast:
+    """
+    Enables the fail-fast mode of a manager, see the module docstring.
+    """
+
+    skip_warnings: bool = False
+    """If True, the validators in `ValidationMode.WARNING` are not executed"""
+
+
+_validator_costs: dict[Callable[..., Any], ValidatorCost] = {}
+
+
+def validator_cost(cost: ValidatorCost) -> Callable[[ValidatorFunctionT], ValidatorFunctionT]:
+    """
+    Registers the cost of the decorated validator function. Functions without a registered cost are `CHEAP`.
+    """
+
+    def decorator(validator_function: ValidatorFunctionT) -> ValidatorFunctionT:
+        _validator_costs[validator_function] = cost
+        return validator_function
+
+    return decorator
+
+
+def get_validator_cost(mapped_validator: MappedValidatorSyncAsync) -> ValidatorCost:
+    """
+    Returns the registered cost of the validator function of the mapped validator.
+    """
+    return _validator_costs.get(mapped_validator.validator.func, ValidatorCost.CHEAP)
+
+
+def cost_order(
+    dependencies: Mapping[MappedValidatorSyncAsync, Iterable[MappedValidatorSyncAsync]],
+) -> list[MappedValidatorSyncAsync]:
+    """
+    Returns the validators ordered by their cost. Dependencies still come before their dependents, i.e. of all
+    validators whose dependencies are ordered already, the cheapest comes next. Validators of the same cost keep the
+    order of `dependencies`.
+    """
+    positions = {mapped_validator: position for position, mapped_validator in enumerate(dependencies)}
+
+    def _sort_key(mapped_validator: MappedValidatorSyncAsync) -> tuple[ValidatorCost, int]:
+        return get_validator_cost(mapped_validator), positions[mapped_validator]
+
+    sorter = TopologicalSorter(dependencies)
+    sorter.prepare()
+    ready: list[MappedValidatorSyncAsync] = []
+    order: list[MappedValidatorSyncAsync] = []
+    while sorter.is_active():
+        ready.extend(sorter.get_ready())
+        ready.sort(key=_sort_key, reverse=True)
+        mapped_validator = ready.pop()
+        order.append(mapped_validator)
+        sorter.done(mapped_validator)
+    return order
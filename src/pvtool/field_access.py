@@ -0,0 +1,165 @@
+"""
+Contains a precompiled access plan for the attribute paths of PathMappedValidators. Many validators read fields with a
+common prefix (e.g. `geschaeftspartner.nachname` and `geschaeftspartner.vorname`). Instead of walking each path
+separately for each validator, all paths are compiled into a trie which is flattened into a list of `getattr` steps.
+Each prefix is then resolved only once per data set and the values are fanned out to all validators reading them.
+Validators built as `PlannedPathMappedValidator` read their parameters from the resolved values.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Generator, Iterable, Iterator, Optional, Sequence
+
+from pvframework import PathMappedValidator
+from pvframework.types import DataSetT, ValidatorFunctionT
+from pvframework.validator import Parameter, Parameters
+
+
+class _NotFound:  # pylint: disable=too-few-public-methods
+    """
+    Marks the values of paths which could not be resolved. It refers to the first prefix which is missing.
+    """
+
+    def __init__(self, path: str, error: AttributeError):
+        self.path = path
+        self.error = error
+
+    def to_error(self) -> AttributeError:
+        """Returns the same error as `pvframework.utils.required_field` raises"""
+        not_found_error = AttributeError(f"{self.path}: Not found")
+        not_found_error.__cause__ = self.error
+        return not_found_error
+
+
+class _ResolvedFields:  # pylint: disable=too-few-public-methods
+    """
+    Holds the values of all paths of a `FieldAccessPlan` for a single data set
+    """
+
+    def __init__(self, plan: "FieldAccessPlan", data_set: Any):
+        self.plan = plan
+        self.data_set = data_set
+        self.values = plan.resolve(data_set)
+
+
+_resolved_fields: ContextVar[Optional[_ResolvedFields]] = ContextVar("pvtool_resolved_fields", default=None)
+
+
+class PlannedPathMappedValidator(PathMappedValidator[DataSetT, ValidatorFunctionT]):
+    """
+    A `PathMappedValidator` whose paths are resolved by the `FieldAccessPlan` of the manager. It is used exactly like a
+    `PathMappedValidator`. Outside a validation of a manager with a `FieldAccessPlan` it behaves like a
+    `PathMappedValidator`, too.
+    """
+
+    def provide(self, data_set: DataSetT) -> Generator[Parameters[DataSetT] | Exception, None, None]:
+        resolved_fields = _resolved_fields.get()
+        if (
+            resolved_fields is None
+            or resolved_fields.data_set is not data_set
+            or not resolved_fields.plan.covers(self.param_map.values())
+        ):
+            return super().provide(data_set)
+        return resolved_fields.plan.provide(self, resolved_fields.values)
+
+
+class FieldAccessPlan:
+    """
+    Resolves a set of attribute paths at once. The paths are compiled into steps `(parent slot, attribute name)` in
+    depth-first order of their trie, where slot 0 is the data set itself and slot i (i > 0) is the result of step i-1.
+    E.g. the paths `zaehler.zaehlernummer` and `zaehler.zaehlwerke` result in the steps
+    `[(0, "zaehler"), (1, "zaehlernummer"), (1, "zaehlwerke")]`.
+    """
+
+    def __init__(self, attribute_paths: Iterable[str]):
+        self._steps: list[tuple[int, str]] = []
+        self._step_paths: list[str] = []
+        self.slots: dict[str, int] = {}
+        """The slot of each attribute path in the resolved values"""
+        for attribute_path in sorted(set(attribute_paths)):
+            parent_slot = 0
+            prefix = ""
+            for attribute_name in attribute_path.split("."):
+                prefix = f"{prefix}.{attribute_name}" if prefix else attribute_name
+                if prefix not in self.slots:
+                    self._steps.append((parent_slot, attribute_name))
+                    self._step_paths.append(prefix)
+                    self.slots[prefix] = len(self._steps)
+                parent_slot = self.slots[prefix]
+
+    @classmethod
+    def of_mapped_validators(cls, mapped_validators: Iterable[Any]) -> "FieldAccessPlan":
+        """
+        Plans the attribute paths of all PlannedPathMappedValidators (and subclasses) of the given mapped validators.
+        """
+        return cls(
+            attribute_path
+            for mapped_validator in mapped_validators
+            if isinstance(mapped_validator, PlannedPathMappedValidator)
+            for attribute_path in mapped_validator.param_map.values()
+        )
+
+    def __len__(self) -> int:
+        """The number of `getattr` steps"""
+        return len(self._steps)
+
+    def covers(self, attribute_paths: Iterable[str]) -> bool:
+        """True if all given attribute paths are resolved by this plan"""
+        return all(attribute_path in self.slots for attribute_path in attribute_paths)
+
+    def resolve(self, data_set: Any) -> list[Any]:
+        """
+        Returns the values of all slots for the given data set. The values of paths which could not be resolved are
+        `_NotFound` markers.
+        """
+        values: list[Any] = [data_set]
+        for step_index, (parent_slot, attribute_name) in enumerate(self._steps):
+            parent = values[parent_slot]
+            if isinstance(parent, _NotFound):
+                values.append(parent)
+                continue
+            try:
+                values.append(getattr(parent, attribute_name))
+            except AttributeError as error:
+                values.append(_NotFound(self._step_paths[step_index], error))
+        return values
+
+    def provide(
+        self, mapped_validator: PathMappedValidator[DataSetT, Any], values: Sequence[Any]
+    ) -> Generator[Parameters[DataSetT] | Exception, None, None]:
+        """
+        Provides the parameters of the mapped validator from the resolved values exactly as
+        `PathMappedValidator.provide` does.
+        """
+        parameter_values: dict[str, Parameter] = {}
+        for param_name, attr_path in mapped_validator.param_map.items():
+            value = values[self.slots[attr_path]]
+            provided = True
+            if isinstance(value, _NotFound):
+                if param_name in mapped_validator.validator.required_param_names:
+                    query_error = AttributeError(f"{attr_path}: value not provided")
+                    query_error.__cause__ = value.to_error()
+                    yield query_error
+                    return
+                value = mapped_validator.validator.signature.parameters[param_name].default
+                provided = False
+            parameter_values[param_name] = Parameter(
+                mapped_validator=mapped_validator,
+                name=param_name,
+                param_id=attr_path,
+                value=value,
+                provided=provided,
+            )
+        yield Parameters(mapped_validator, **parameter_values)
+
+    @contextmanager
+    def resolved(self, data_set: Any) -> Iterator[None]:
+        """
+        Within this context, the PlannedPathMappedValidators read their parameters for the given data set from the
+        values resolved by this plan. The paths are resolved once on entering. Enter it for each data set separately.
+        """
+        token = _resolved_fields.set(_ResolvedFields(self, data_set) if self._steps else None)
+        try:
+            yield
+        finally:
+            _resolved_fields.reset(token)
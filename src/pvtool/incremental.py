@@ -0,0 +1,162 @@
+"""
+Contains a store for incremental re-validations. Between the dry-runs of a migration most data sets don't change. The
+store records the outcome of each validated data set keyed by a hash over the fields read by the validators, the
+version of the validator set and the migration key date. Thus, only new or changed data sets have to be validated again.
+"""
+
+import functools
+import hashlib
+import importlib.metadata
+import inspect
+import warnings
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import pydantic_core
+from pvframework import PathMappedValidator, QueryMappedValidator, ValidationManager
+from pvframework.types import MappedValidatorSyncAsync
+
+from .checkpoint import SummaryStore
+from .validation_manager import ValidationManagerWithConfig
+
+
+def read_paths(validation_manager: ValidationManager) -> list[str]:
+    """
+    Returns the attribute paths of the data sets which are read by the registered validators. Queries are reduced to
+    their path before the first iteration, e.g. `banks` for `Query().path("banks").iter(...).path("iban")`, and paths
+    covered by others are omitted. If a validator reads the data sets in another way, the whole data set is read, i.e.
+    `[""]` is returned.
+    """
+    paths: set[str] = set()
+    for mapped_validator in validation_manager.validators:
+        if isinstance(mapped_validator, PathMappedValidator):
+            paths.update(mapped_validator.param_map.values())
+        elif isinstance(mapped_validator, QueryMappedValidator):
+            paths.update(str(query).split("[", 1)[0].lstrip(".") for query in mapped_validator.param_map.values())
+        else:
+            return [""]
+    if "" in paths:
+        return [""]
+    return sorted(path for path in paths if not any(path.startswith(other_path + ".") for other_path in paths - {path}))
+
+
+def _describe(mapped_validator: MappedValidatorSyncAsync) -> str:
+    param_map = getattr(mapped_validator, "param_map", {})
+    return (
+        f"{type(mapped_validator).__name__}({mapped_validator.name}, "
+        f"{sorted((param_name, str(path)) for param_name, path in param_map.items())})"
+    )
+
+
+_RULE_DISTRIBUTIONS = (
+    "bomf",
+    "email-validator",
+    "ibims",
+    "pvframework",
+    "pydantic",
+    "python-dateutil",
+    "pytz",
+    "schwifty",
+)
+"""The distributions whose versions may change the outcome of the validators (e.g. the bank registry of schwifty)"""
+
+_PACKAGE_DIR = Path(__file__).resolve().parent
+
+
+def _distribution_version(distribution: str) -> Optional[str]:
+    try:
+        return importlib.metadata.version(distribution)
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _rules_version(package_dir: Path = _PACKAGE_DIR) -> bytes:
+    """
+    Returns a hash over the source of all modules of this package (validators and their helpers like the patterns or
+    the MaLo-ID checksum) and the versions of the `_RULE_DISTRIBUTIONS`.
+    """
+    version_hash = hashlib.blake2b(digest_size=16)
+    for source_file in sorted(package_dir.rglob("*.py")):
+        version_hash.update(source_file.relative_to(package_dir).as_posix().encode())
+        version_hash.update(source_file.read_bytes())
+    for distribution in _RULE_DISTRIBUTIONS:
+        version_hash.update(f"{distribution}=={_distribution_version(distribution)}".encode())
+    return version_hash.digest()
+
+
+def validator_set_version(validation_manager: ValidationManager) -> str:
+    """
+    Returns a hash identifying the validator set of the ValidationManager. It changes if validators are added, removed
+    or mapped differently, if the source of this package or of a module containing a validator function changes, if
+    the version of a distribution the rules depend on changes (see `_RULE_DISTRIBUTIONS`) or if the fail-fast mode
+    changes (the errors of a fail-fast validation are incomplete).
+    Note that changes of helper functions in other modules outside this package are not detected.
+    """
+    version_hash = hashlib.blake2b(digest_size=16)
+    version_hash.update(_rules_version())
+    fail_fast = getattr(validation_manager, "fail_fast", None)
+    if fail_fast is not None:
+        version_hash.update(repr(fail_fast).encode())
+    for description in sorted(
+        f"{_describe(mapped_validator)} depends on {sorted(map(_describe, info.depends_on or []))}"
+        for mapped_validator, info in validation_manager.validators.items()
+    ):
+        version_hash.update(description.encode())
+    source_files: set[str] = set()
+    for mapped_validator in validation_manager.validators:
+        try:
+            source_file = inspect.getsourcefile(inspect.unwrap(mapped_validator.validator.func))
+        except TypeError:
+            source_file = None
+        # the sources of this package are part of the rules version
+        if source_file is not None and not Path(source_file).resolve().is_relative_to(_PACKAGE_DIR):
+            source_files.add(source_file)
+    for source_file in sorted(source_files):
+        version_hash.update(Path(source_file).read_bytes())
+    return version_hash.hexdigest()
+
+
+class ContentHashStore(SummaryStore):
+    """
+    A `SummaryStore` keyed by a hash over the values of all fields read by the validators (see `read_paths`), the
+    version of the validator set (see `validator_set_version`) and the migration key date of the ValidationManager.
+    Unchanged data sets have the same record ID in the next run and their recorded outcome can be reused. The outcomes
+    of several validator set versions and key dates can be stored in the same file.
+    E.g.:
+    ```
+    with ContentHashStore("customers.sqlite", validation_manager) as store:
+        for data_set in data_sets:
+            record_id = store.record_id(data_set)
+            if store.get(record_id) is None:
+                store.add(record_id, validate(data_set))
+    ```
+    """
+
+    def __init__(self, path: Path | str, validation_manager: ValidationManager, commit_interval: int = 1000):
+        super().__init__(path, {"record_id": "content hash"}, commit_interval)
+        self.paths = read_paths(validation_manager)
+        self.validator_set_version = validator_set_version(validation_manager)
+        self.migration_key_date = (
+            validation_manager.config.migration_key_date
+            if isinstance(validation_manager, ValidationManagerWithConfig)
+            else None
+        )
+        self._getters: list[tuple[str, Callable[[Any], Any]]] = [
+            (path, attrgetter(path) if path else lambda data_set: data_set) for path in self.paths
+        ]
+        self._key_prefix = f"{self.validator_set_version}|{self.migration_key_date}|".encode()
+
+    def record_id(self, data_set: Any) -> Optional[str]:
+        values = {}
+        for path, getter in self._getters:
+            try:
+                values[path] = getter(data_set)
+            except AttributeError:
+                pass  # a missing field differs from a field which is None
+        with warnings.catch_warnings():
+            # models which were constructed without validation may contain values of unexpected types
+            warnings.simplefilter("ignore")
+            content = pydantic_core.to_json(values, serialize_unknown=True)
+        return hashlib.blake2b(self._key_prefix + content, digest_size=16).hexdigest()
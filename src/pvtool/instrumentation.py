@@ -0,0 +1,222 @@
+"""
+Contains the optional instrumentation of the pvtool validation managers. Within `ValidatorInstrumentation.enabled`, the
+managers measure each execution of each validator for the data sets validated in this context and record the wall time,
+the number of calls and the number of errors per validator. Other validations by the same (cached) manager, e.g. in
+other asyncio tasks, are not affected. The validators are identified
+by their function name and the mapped paths of their parameters, e.g. `check_iban @ banks[*].iban`.
+The recorded values are available as structured report (see `ValidatorInstrumentation.report`) and are passed to the
+registered `ValidatorMetricsHook`s, e.g. to feed a metrics system.
+If the instrumentation is disabled, the manager doesn't measure anything.
+"""
+
+import math
+import random
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, Iterable, Iterator, Optional, Self
+
+from pvframework import PathMappedValidator, QueryMappedValidator
+from pvframework.errors import ErrorHandler
+
+
+def validator_key(mapped_validator: Any) -> str:
+    """
+    Returns the key identifying the mapped validator in the instrumentation, i.e. the name of the validator function
+    and the mapped paths of its parameters. Iterations of queries are written as `[*]`, e.g.
+    `check_iban @ banks[*].iban, banks[*].sepa_info.sepa_zahler`.
+    """
+    if isinstance(mapped_validator, PathMappedValidator):
+        paths = list(mapped_validator.param_map.values())
+    elif isinstance(mapped_validator, QueryMappedValidator):
+        paths = [str(query).removeprefix(".").replace("[...]", "[*]") for query in mapped_validator.param_map.values()]
+    else:
+        return mapped_validator.name
+    return f"{mapped_validator.name} @ {', '.join(paths)}"
+
+
+class ValidatorMetricsHook(ABC):
+    """
+    A hook which is notified about each measured execution of a validator, e.g. to feed a metrics system.
+    The hooks are called synchronously while validating, i.e. they should be cheap.
+    """
+
+    @abstractmethod
+    def on_validator_executed(self, key: str, duration: float, num_errors: int) -> None:
+        """
+        Is called after the validator identified by `key` (see `validator_key`) was executed for a data set.
+        The `duration` is the wall time in seconds. `num_errors` counts the errors and warnings of this execution.
+        """
+
+
+@dataclass(frozen=True)
+class ValidatorReport:  # pylint: disable=too-many-instance-attributes
+    """
+    The recorded metrics of a single validator. The times are in seconds. The percentiles are computed from a random
+    sample of at most `max_samples` executions (see `ValidatorInstrumentation`).
+    """
+
+    key: str
+    calls: int
+    errors: int
+    total_time: float
+    mean_time: float
+    p50_time: float
+    p90_time: float
+    p99_time: float
+    max_time: float
+
+
+def _percentile(sorted_samples: list[float], percentile: float) -> float:
+    """Returns the percentile (0 to 100) of the sorted samples by the nearest-rank method"""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(percentile / 100 * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+class _ValidatorStats:  # pylint: disable=too-few-public-methods
+    """
+    The recorded metrics of a single validator. The durations are sampled by reservoir sampling.
+    """
+
+    __slots__ = ("key", "calls", "errors", "total_time", "max_time", "samples")
+
+    def __init__(self, key: str):
+        self.key = key
+        self.calls = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.samples: list[float] = []
+
+    def to_report(self) -> ValidatorReport:
+        """Returns the report of the recorded metrics"""
+        sorted_samples = sorted(self.samples)
+        return ValidatorReport(
+            key=self.key,
+            calls=self.calls,
+            errors=self.errors,
+            total_time=self.total_time,
+            mean_time=self.total_time / self.calls if self.calls else 0.0,
+            p50_time=_percentile(sorted_samples, 50),
+            p90_time=_percentile(sorted_samples, 90),
+            p99_time=_percentile(sorted_samples, 99),
+            max_time=self.max_time,
+        )
+
+
+def _num_errors(error_handler: ErrorHandler, mapped_validator: Any) -> int:
+    return len(error_handler.error_excs.get(mapped_validator, ())) + len(
+        error_handler.warning_excs.get(mapped_validator, ())
+    )
+
+
+_instrumentation: ContextVar[Optional["ValidatorInstrumentation"]] = ContextVar("pvtool_instrumentation", default=None)
+
+
+def active_instrumentation() -> Optional["ValidatorInstrumentation"]:
+    """
+    Returns the instrumentation enabled in the current context (see `ValidatorInstrumentation.enabled`) or None.
+    """
+    return _instrumentation.get()
+
+
+class ValidatorInstrumentation:
+    """
+    Records the metrics of the validators executed by a manager. A call is a single execution of a validator for a data
+    set (including all parameter sets provided for it, e.g. all `banks`). Validators which are skipped for a data set
+    (e.g. by a `RuleGroup` or the columnar engine) are not recorded.
+    The durations of asynchronous validators include the time they wait for their dependencies and for other tasks.
+    To bound the memory usage, the percentiles are computed from a uniform random sample of `max_samples` durations
+    per validator.
+    """
+
+    def __init__(self, hooks: Iterable[ValidatorMetricsHook] = (), max_samples: int = 10_000, seed: int = 0):
+        if max_samples < 1:
+            raise ValueError(f"max_samples must be at least 1, got {max_samples}")
+        self.hooks = list(hooks)
+        self.max_samples = max_samples
+        self._random = random.Random(seed)
+        self._stats: dict[Any, _ValidatorStats] = {}
+
+    def record(self, mapped_validator: Any, duration: float, num_errors: int) -> None:
+        """
+        Records a single execution of the mapped validator and notifies the hooks.
+        """
+        stats = self._stats.get(mapped_validator)
+        if stats is None:
+            stats = self._stats[mapped_validator] = _ValidatorStats(validator_key(mapped_validator))
+        stats.calls += 1
+        stats.errors += num_errors
+        stats.total_time += duration
+        stats.max_time = max(stats.max_time, duration)
+        if len(stats.samples) < self.max_samples:
+            stats.samples.append(duration)
+        else:
+            sample_index = self._random.randrange(stats.calls)
+            if sample_index < self.max_samples:
+                stats.samples[sample_index] = duration
+        for hook in self.hooks:
+            hook.on_validator_executed(stats.key, duration, num_errors)
+
+    @contextmanager
+    def enabled(self) -> Iterator[Self]:
+        """
+        Within this context, the validations of the pvtool validation managers are measured by this instrumentation.
+        The asyncio tasks started within the context are measured, too.
+        """
+        token = _instrumentation.set(self)
+        try:
+            yield self
+        finally:
+            _instrumentation.reset(token)
+
+    @contextmanager
+    def measure(self, mapped_validator: Any, error_handler: ErrorHandler) -> Iterator[None]:
+        """
+        Records the execution of the mapped validator within this context. The errors are counted in the error handler
+        of the data set.
+        """
+        num_errors_before = _num_errors(error_handler, mapped_validator)
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.record(
+                mapped_validator,
+                perf_counter() - start,
+                _num_errors(error_handler, mapped_validator) - num_errors_before,
+            )
+
+    def report(self) -> list[ValidatorReport]:
+        """
+        Returns the metrics of all recorded validators, the most expensive (by total time) first.
+        """
+        return sorted(
+            (stats.to_report() for stats in self._stats.values()), key=lambda report: report.total_time, reverse=True
+        )
+
+    def format_report(self) -> str:
+        """
+        Returns the report as table with the times in milliseconds.
+        """
+        lines = [
+            f"{'total ms':>10} {'calls':>8} {'errors':>7} {'mean ms':>8} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8}"
+            "  validator"
+        ]
+        for report in self.report():
+            lines.append(
+                f"{report.total_time * 1e3:10.1f} {report.calls:8d} {report.errors:7d} {report.mean_time * 1e3:8.3f} "
+                f"{report.p50_time * 1e3:8.3f} {report.p90_time * 1e3:8.3f} {report.p99_time * 1e3:8.3f}"
+                f"  {report.key}"
+            )
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        """
+        Discards all recorded metrics.
+        """
+        self._stats.clear()
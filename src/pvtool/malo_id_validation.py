@@ -3,11 +3,12 @@ validators that were included in the bo4e package prior to version 0.6.0
 """
 
 import re
+from typing import NamedTuple, Optional, Sequence
 
 from pydantic_core.core_schema import ValidationInfo
 
 
-def _get_malo_id_checksum(malo_id: str) -> str:
+def _get_malo_id_checksum_per_digit(malo_id: str) -> str:
     """
     Get the checksum of a marktlokations id.
     a) Quersumme aller Ziffern in ungerader Position
@@ -31,6 +32,27 @@ def _get_malo_id_checksum(malo_id: str) -> str:
     return str(result)
 
 
+# the checksum digit for each remainder of the weighted digit sum modulo 10
+_CHECKSUM_DIGITS = tuple(str((10 - remainder) % 10) for remainder in range(10))
+# the ASCII code of '0' is added once per digit, i.e. 5 times for the odd and 2*5 times for the even positions
+_ASCII_ZERO_OFFSET = 15 * ord("0")
+
+
+def _get_malo_id_checksum(malo_id: str) -> str:
+    """
+    Get the checksum of a marktlokations id. See `_get_malo_id_checksum_per_digit` for the algorithm.
+    This is a faster implementation which sums the ASCII codes of the digits at once instead of converting every
+    single digit. IDs with non-ASCII digits are handled by `_get_malo_id_checksum_per_digit`.
+    :return: the checksum as string
+    """
+    first_ten_digits = malo_id[:10]
+    if len(first_ten_digits) != 10 or not (first_ten_digits.isascii() and first_ten_digits.isdigit()):
+        return _get_malo_id_checksum_per_digit(malo_id)
+    ascii_codes = first_ten_digits.encode("ascii")
+    weighted_sum = sum(ascii_codes[0::2]) + 2 * sum(ascii_codes[1::2]) - _ASCII_ZERO_OFFSET
+    return _CHECKSUM_DIGITS[weighted_sum % 10]
+
+
 _malo_id_pattern = re.compile(r"^[1-9]\d{10}$")
 
 
@@ -53,3 +75,32 @@ def validate_marktlokations_id(  # type: ignore[no-untyped-def]
             f"The Marktlokations-ID '{marktlokations_id}' has checksum '{actual_checksum}' but '{expected_checksum}' was expected."
         )
     return marktlokations_id
+
+
+class MaLoIdChecksums(NamedTuple):
+    """
+    The result of `check_malo_id_checksums`
+    """
+
+    mask: list[bool]
+    """True for each valid marktlokations ID"""
+    expected_checksums: list[Optional[str]]
+    """The expected checksum of each ID or None if the ID doesn't match the pattern of marktlokations IDs"""
+
+
+def check_malo_id_checksums(marktlokations_ids: Sequence[str]) -> MaLoIdChecksums:
+    """
+    Checks many marktlokations IDs at once. An ID is valid iff `validate_marktlokations_id` accepts it.
+    """
+    mask: list[bool] = []
+    expected_checksums: list[Optional[str]] = []
+    match_pattern = _malo_id_pattern.match
+    for marktlokations_id in marktlokations_ids:
+        if marktlokations_id and match_pattern(marktlokations_id):
+            expected_checksum = _get_malo_id_checksum(marktlokations_id)
+            mask.append(marktlokations_id[10:11] == expected_checksum)
+            expected_checksums.append(expected_checksum)
+        else:
+            mask.append(False)
+            expected_checksums.append(None)
+    return MaLoIdChecksums(mask=mask, expected_checksums=expected_checksums)
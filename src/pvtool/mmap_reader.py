@@ -0,0 +1,103 @@
+"""
+Contains a reader for (multi-gigabyte) JSON lines files which memory-maps the file instead of reading it line by line.
+"""
+
+import mmap
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO, Generator, Optional
+
+_NEWLINE = ord("\n")
+_CARRIAGE_RETURN = ord("\r")
+
+
+class MemoryMappedJsonLines:
+    """
+    Memory-maps a JSON lines file and iterates over its lines as `memoryview` slices of the mapping, i.e. without
+    copying them. Line breaks (`\\n` or `\\r\\n`) are not part of the lines. A yielded line is only valid until the
+    next line is requested, copy it (e.g. by `bytes(line)`) if you need it longer.
+    Already processed parts of the file are dropped from memory regularly (every `release_size` bytes) on systems
+    supporting it. Thus, the resident memory stays flat even for files larger than the RAM.
+    E.g.:
+    ```
+    with MemoryMappedJsonLines("customers.jsonl") as lines:
+        for line in lines:
+            data_set = TripicaCustomerLoaderDataSet.model_validate_json(bytes(line))
+    ```
+    """
+
+    def __init__(self, path: Path | str, release_size: int = 64 * 2**20):
+        self.path = Path(path)
+        self.release_size = release_size
+        self._file: Optional[BinaryIO] = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._generators: list[Generator[memoryview, None, None]] = []
+
+    def __enter__(self) -> "MemoryMappedJsonLines":
+        # pylint: disable=consider-using-with
+        self._file = open(self.path, "rb")
+        if self.path.stat().st_size > 0:  # empty files can't be mapped
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                self._mmap.madvise(mmap.MADV_SEQUENTIAL)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        # the generators hold views of the mapping which have to be released before the mapping can be closed
+        for generator in self._generators:
+            generator.close()
+        self._generators.clear()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __iter__(self) -> Generator[memoryview, None, None]:
+        if self._file is None:
+            raise RuntimeError("The file is not opened. Use MemoryMappedJsonLines as context manager.")
+        generator = self._iter_lines()
+        self._generators.append(generator)
+        return generator
+
+    def _iter_lines(self) -> Generator[memoryview, None, None]:
+        mapping = self._mmap
+        if mapping is None:
+            return
+        size = len(mapping)
+        view = memoryview(mapping)
+        start = 0
+        released_until = 0
+        try:
+            while start < size:
+                end = mapping.find(b"\n", start)
+                if end == -1:
+                    end = size
+                line_end = end - 1 if end > start and mapping[end - 1] == _CARRIAGE_RETURN else end
+                line = view[start:line_end]
+                try:
+                    yield line
+                finally:
+                    line.release()
+                start = end + 1
+                if start - released_until >= self.release_size:
+                    released_until = self._release(released_until, start)
+        finally:
+            view.release()
+
+    def _release(self, start: int, end: int) -> int:
+        """
+        Drops the pages between start and end from the resident memory (the file itself is not affected).
+        Returns the (page aligned) end of the released range.
+        """
+        assert self._mmap is not None
+        aligned_end = end - end % mmap.PAGESIZE
+        if hasattr(mmap, "MADV_DONTNEED") and aligned_end > start:
+            self._mmap.madvise(mmap.MADV_DONTNEED, start, aligned_end - start)
+        return aligned_end
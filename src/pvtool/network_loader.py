@@ -2,15 +2,15 @@
 Contains validation logic for TripicaNetworkLoaderDataSet
 """
 
-import re
-from typing import Iterator
+from typing import Any, Iterator, Sequence
 
 from ibims.bo4e import Kundentyp, Registeranzahl, Rollencodetyp, Sparte, Zaehlerauspraegung, Zaehlwerk
 from ibims.datasets import TripicaNetworkLoaderDataSet
-from injector import Module, provider
-from pvframework import PathMappedValidator, Query, QueryMappedValidator, ValidationManager, Validator
+from injector import provider
+from pvframework import Query, QueryMappedValidator, ValidationManager, Validator
 from pvframework.utils import param
 
+from .columnar import column_rule
 from .customer_loader import (
     ValidatorType,
     validate_address_deutsch,
@@ -18,14 +18,18 @@ from .customer_loader import (
     validate_postleitzahl,
     validate_str_is_stripped,
 )
+from .field_access import PlannedPathMappedValidator
+from .patterns import OBIS_PATTERN, is_ascii_digits
 from .resource_loader import validate_malo_id, validate_sparte
+from .validation_cache import pure
+from .validation_manager import PVToolValidationManager, ValidationManagerProvider
 
 
 def check_netzbetreiber_code_nr(netzbetreiber_code_nr: str) -> None:
     """
     Netzbetreiber-Code-Nr is required and has to consist of 13 digits
     """
-    if not re.match(r"^\d{13}$", netzbetreiber_code_nr):
+    if not is_ascii_digits(netzbetreiber_code_nr, 13):
         raise ValueError(f"{param('netzbetreiber_code_nr').param_id} has to consist of 13 digits.")
 
 
@@ -40,9 +44,10 @@ def check_rollencodetyp(rollencodetyp: Rollencodetyp) -> None:
     """rollencodetyp is required'"""
 
 
+@pure()
 def check_rollencodenr(rollencodenr: str) -> None:
     """rollencodenr is required. The last digit must fulfill the 'Lok- und Waggon-Kennzeichnungsverfahren'."""
-    if not re.match(r"^\d{13}$", rollencodenr):
+    if not is_ascii_digits(rollencodenr, 13):
         raise ValueError(f"{param('rollencodenr').param_id} has to consist of 13 digits")
     rollencodenr_digits = [int(x) for x in rollencodenr]
     checksum = 10 - (sum(rollencodenr_digits[0::2]) + 2 * sum(rollencodenr_digits[1::2])) % 10
@@ -67,21 +72,13 @@ def check_registeranzahl(registeranzahl: Registeranzahl) -> None:
         raise ValueError(f"{param('registeranzahl').param_id} must be EINTARIF, ZWEITARIF or MEHRTARIF")
 
 
-OBIS_PATTERN = re.compile(
-    r"((1)-((?:[0-5]?[0-9])|(?:6[0-5])):((?:[1-8]|99))\."
-    r"((?:6|8|9|29))\."
-    r"([0-9]{1,2})|(7)-((?:[0-5]?[0-9])|(?:6[0-5])):(.{1,2})\."
-    r"(.{1,2})\."
-    r"([0-9]{1,2}))"
-)
-
-
+@pure()
 def check_obis(obis: str, sparte: Sparte) -> None:
     r"""
     obis is required. It must match the pattern ^[17]-\d+:\d+\.\d+\.\d+$.
     For Sparte.STROM it must start with '1', for Sparte.GAS it must start with '7'.
     """
-    if not re.match(OBIS_PATTERN, obis):
+    if not OBIS_PATTERN.match(obis):
         raise ValueError(f"{param('obis').param_id} does not match the regex pattern")
     if sparte == Sparte.STROM and not obis.startswith("1"):
         raise ValueError(f"{param('obis').param_id} must start with '1' for Sparte.STROM")
@@ -95,6 +92,37 @@ def check_is_digit(string: str) -> None:
         raise ValueError(f"{param('nachkommastellen').param_id} has to be a number")
 
 
+@column_rule(check_netzbetreiber_code_nr)
+def netzbetreiber_code_nr_column_rule(netzbetreiber_code_nrs: Sequence[Any]) -> list[bool]:
+    """The column rule of `check_netzbetreiber_code_nr`"""
+    return [
+        isinstance(netzbetreiber_code_nr, str) and is_ascii_digits(netzbetreiber_code_nr, 13)
+        for netzbetreiber_code_nr in netzbetreiber_code_nrs
+    ]
+
+
+@column_rule(check_zaehlernummer)
+def zaehlernummer_column_rule(zaehlernummern: Sequence[Any]) -> list[bool]:
+    """The column rule of `check_zaehlernummer`"""
+    return [isinstance(zaehlernummer, str) for zaehlernummer in zaehlernummern]
+
+
+@column_rule(check_zaehlerauspraegung)
+def zaehlerauspraegung_column_rule(zaehlerauspraegungen: Sequence[Any]) -> list[bool]:
+    """The column rule of `check_zaehlerauspraegung`"""
+    return [zaehlerauspraegung is Zaehlerauspraegung.EINRICHTUNGSZAEHLER for zaehlerauspraegung in zaehlerauspraegungen]
+
+
+@column_rule(check_registeranzahl)
+def registeranzahl_column_rule(registeranzahlen: Sequence[Any]) -> list[bool]:
+    """The column rule of `check_registeranzahl`"""
+    return [
+        isinstance(registeranzahl, Registeranzahl)
+        and registeranzahl in (Registeranzahl.EINTARIF, Registeranzahl.ZWEITARIF, Registeranzahl.MEHRTARIF)
+        for registeranzahl in registeranzahlen
+    ]
+
+
 validate_netzbetreiber_code_nr: ValidatorType = Validator(check_netzbetreiber_code_nr)
 validate_kundentyp: ValidatorType = Validator(check_kundentyp)
 validate_rollencodetyp: ValidatorType = Validator(check_rollencodetyp)
@@ -114,112 +142,124 @@ def iter_zaehlwerke(zaehlwerke: list[Zaehlwerk]) -> Iterator[tuple[Zaehlwerk, st
     return ((zaehlwerk, f"[{index}]") for index, zaehlwerk in enumerate(zaehlwerke))
 
 
-class ValidationManagerProviderNetwork(Module):
+def build_network_validation_manager() -> PVToolValidationManager[TripicaNetworkLoaderDataSet]:
     """
-    This module provides a ValidationManager for network loader
+    Builds a ValidationManager for network loader and registers all validators.
     """
-
-    @provider
-    def network_validation_manager(self) -> ValidationManager:
-        """
-        This method provides a ValidationManager for network loader
-        """
-        network_manager = ValidationManager[TripicaNetworkLoaderDataSet](manager_id="NetworkLoader")
-        network_manager.register(PathMappedValidator(validate_str_is_stripped, {"string": "kunde.nachname"}))
-        network_manager.register(PathMappedValidator(validate_str_is_stripped, {"string": "kunde.vorname"}))
-        network_manager.register(PathMappedValidator(validate_address_fields, {"address": "kunde.adresse"}))
-        network_manager.register(
-            PathMappedValidator(validate_postleitzahl, {"postleitzahl": "kunde.partneradresse.postleitzahl"})
-        )
-        network_manager.register(PathMappedValidator(validate_address_fields, {"address": "liefer_adresse"}))
-        network_manager.register(PathMappedValidator(validate_address_deutsch, {"address": "liefer_adresse"}))
-        network_manager.register(
-            PathMappedValidator(validate_address_fields, {"address": "geschaeftspartner_mit_rechnungs_adresse.adresse"})
-        )
-        network_manager.register(
-            PathMappedValidator(
-                validate_postleitzahl,
-                {"postleitzahl": "geschaeftspartner_mit_rechnungs_adresse.adresse.postleitzahl"},
-            )
-        )
-        network_manager.register(
-            PathMappedValidator(validate_malo_id, {"marktlokations_id": "marktlokation.marktlokations_id"})
-        )
-        network_manager.register(PathMappedValidator(validate_sparte, {"sparte": "marktlokation.sparte"}))
-        network_manager.register(
-            PathMappedValidator(
-                validate_netzbetreiber_code_nr, {"netzbetreiber_code_nr": "marktlokation.netzbetreibercodenr"}
-            )
+    network_manager = PVToolValidationManager[TripicaNetworkLoaderDataSet](manager_id="NetworkLoader")
+    network_manager.register(PlannedPathMappedValidator(validate_str_is_stripped, {"string": "kunde.nachname"}))
+    network_manager.register(PlannedPathMappedValidator(validate_str_is_stripped, {"string": "kunde.vorname"}))
+    network_manager.register(PlannedPathMappedValidator(validate_address_fields, {"address": "kunde.adresse"}))
+    network_manager.register(
+        PlannedPathMappedValidator(validate_postleitzahl, {"postleitzahl": "kunde.partneradresse.postleitzahl"})
+    )
+    network_manager.register(PlannedPathMappedValidator(validate_address_fields, {"address": "liefer_adresse"}))
+    network_manager.register(PlannedPathMappedValidator(validate_address_deutsch, {"address": "liefer_adresse"}))
+    network_manager.register(
+        PlannedPathMappedValidator(
+            validate_address_fields, {"address": "geschaeftspartner_mit_rechnungs_adresse.adresse"}
         )
-        network_manager.register(PathMappedValidator(validate_kundentyp, {"kundentyp": "marktlokation.kundengruppen"}))
-        network_manager.register(
-            PathMappedValidator(
-                validate_rollencodetyp,
-                {"rollencodetyp": "netzbetreiber.rollencodetyp"},
-            )
+    )
+    network_manager.register(
+        PlannedPathMappedValidator(
+            validate_postleitzahl,
+            {"postleitzahl": "geschaeftspartner_mit_rechnungs_adresse.adresse.postleitzahl"},
         )
-        network_manager.register(
-            PathMappedValidator(
-                validate_rollencodetyp,
-                {"rollencodetyp": "messstellenbetreiber.rollencodetyp"},
-            )
+    )
+    network_manager.register(
+        PlannedPathMappedValidator(validate_malo_id, {"marktlokations_id": "marktlokation.marktlokations_id"})
+    )
+    network_manager.register(PlannedPathMappedValidator(validate_sparte, {"sparte": "marktlokation.sparte"}))
+    network_manager.register(
+        PlannedPathMappedValidator(
+            validate_netzbetreiber_code_nr, {"netzbetreiber_code_nr": "marktlokation.netzbetreibercodenr"}
         )
-        network_manager.register(
-            PathMappedValidator(
-                validate_str_is_stripped,
-                {"string": "netzbetreiber.nachname"},
-            )
+    )
+    network_manager.register(
+        PlannedPathMappedValidator(validate_kundentyp, {"kundentyp": "marktlokation.kundengruppen"})
+    )
+    network_manager.register(
+        PlannedPathMappedValidator(
+            validate_rollencodetyp,
+            {"rollencodetyp": "netzbetreiber.rollencodetyp"},
         )
-        network_manager.register(
-            PathMappedValidator(
-                validate_str_is_stripped,
-                {"string": "messstellenbetreiber.nachname"},
-            )
+    )
+    network_manager.register(
+        PlannedPathMappedValidator(
+            validate_rollencodetyp,
+            {"rollencodetyp": "messstellenbetreiber.rollencodetyp"},
         )
-        network_manager.register(
-            PathMappedValidator(
-                validate_rollencodenr,
-                {"rollencodenr": "netzbetreiber.rollencodenummer"},
-            )
+    )
+    network_manager.register(
+        PlannedPathMappedValidator(
+            validate_str_is_stripped,
+            {"string": "netzbetreiber.nachname"},
         )
-        network_manager.register(
-            PathMappedValidator(
-                validate_rollencodenr,
-                {"rollencodenr": "messstellenbetreiber.rollencodenummer"},
-            )
+    )
+    network_manager.register(
+        PlannedPathMappedValidator(
+            validate_str_is_stripped,
+            {"string": "messstellenbetreiber.nachname"},
         )
-        network_manager.register(
-            PathMappedValidator(validate_zaehlernummer, {"zaehlernummer": "zaehler.zaehlernummer"})
+    )
+    network_manager.register(
+        PlannedPathMappedValidator(
+            validate_rollencodenr,
+            {"rollencodenr": "netzbetreiber.rollencodenummer"},
         )
-        network_manager.register(
-            PathMappedValidator(validate_zaehlerauspraegung, {"zaehlerauspraegung": "zaehler.zaehlerauspraegung"})
+    )
+    network_manager.register(
+        PlannedPathMappedValidator(
+            validate_rollencodenr,
+            {"rollencodenr": "messstellenbetreiber.rollencodenummer"},
         )
-        network_manager.register(
-            PathMappedValidator(validate_registeranzahl, {"registeranzahl": "zaehler.registeranzahl"})
+    )
+    network_manager.register(
+        PlannedPathMappedValidator(validate_zaehlernummer, {"zaehlernummer": "zaehler.zaehlernummer"})
+    )
+    network_manager.register(
+        PlannedPathMappedValidator(validate_zaehlerauspraegung, {"zaehlerauspraegung": "zaehler.zaehlerauspraegung"})
+    )
+    network_manager.register(
+        PlannedPathMappedValidator(validate_registeranzahl, {"registeranzahl": "zaehler.registeranzahl"})
+    )
+    network_manager.register(
+        QueryMappedValidator(
+            validate_obis,
+            {
+                "obis": Query().path("zaehler.zaehlwerke").iter(iter_zaehlwerke).path("obis"),
+                "sparte": Query().path("zaehler.sparte"),
+            },
         )
-        network_manager.register(
-            QueryMappedValidator(
-                validate_obis,
-                {
-                    "obis": Query().path("zaehler.zaehlwerke").iter(iter_zaehlwerke).path("obis"),
-                    "sparte": Query().path("zaehler.sparte"),
-                },
-            )
+    )
+    network_manager.register(
+        QueryMappedValidator(
+            validate_is_digit,
+            {
+                "string": Query().path("zaehler.zaehlwerke").iter(iter_zaehlwerke).path("nachkommastellen"),
+            },
         )
-        network_manager.register(
-            QueryMappedValidator(
-                validate_is_digit,
-                {
-                    "string": Query().path("zaehler.zaehlwerke").iter(iter_zaehlwerke).path("nachkommastellen"),
-                },
-            )
+    )
+    network_manager.register(
+        QueryMappedValidator(
+            validate_is_digit,
+            {
+                "string": Query().path("zaehler.zaehlwerke").iter(iter_zaehlwerke).path("vorkommastellen"),
+            },
         )
-        network_manager.register(
-            QueryMappedValidator(
-                validate_is_digit,
-                {
-                    "string": Query().path("zaehler.zaehlwerke").iter(iter_zaehlwerke).path("vorkommastellen"),
-                },
-            )
-        )
-        return network_manager
+    )
+    return network_manager
+
+
+class ValidationManagerProviderNetwork(ValidationManagerProvider):
+    """
+    This module provides a ValidationManager for network loader
+    """
+
+    @provider
+    def network_validation_manager(self) -> ValidationManager:
+        """
+        This method provides a ValidationManager for network loader
+        The manager is built once (per fail-fast mode) and reused afterwards.
+        """
+        return self._cached_validation_manager((TripicaNetworkLoaderDataSet,), build_network_validation_manager)
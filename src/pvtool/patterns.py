@@ -0,0 +1,41 @@
+"""
+Contains the regex patterns used by the validators of the PV-Tool. All of them are compiled once at import.
+Rules which only require a fixed number of digits don't need a regex at all, use `is_ascii_digits` instead.
+"""
+
+import re
+
+REGEX_TEL_NR = re.compile(r"^(\+?[1-9]|0)[0-9]{7,14}$")
+REGEX_TEL_NR_IGNORED_CHARS = re.compile(r"[-.\s()]")
+REGEX_MELO_ID = re.compile(r"^DE\d{11}[A-Z\d]{20}$")
+# An e-mail address with a plain ASCII part before the @-sign (RFC 5322 3.2.3 dot-atom) and an ASCII host name after it.
+# Addresses matching this pattern don't need any unicode or IDNA handling, see `check_e_mail`.
+REGEX_SIMPLE_E_MAIL = re.compile(
+    r"(?P<local_part>[a-zA-Z0-9_!#$%&'*+\-/=?^`{|}~]+(?:\.[a-zA-Z0-9_!#$%&'*+\-/=?^`{|}~]+)*)"
+    r"@(?P<domain>[a-zA-Z0-9.\-]+)"
+)
+OBIS_PATTERN = re.compile(
+    r"((1)-((?:[0-5]?[0-9])|(?:6[0-5])):((?:[1-8]|99))\."
+    r"((?:6|8|9|29))\."
+    r"([0-9]{1,2})|(7)-((?:[0-5]?[0-9])|(?:6[0-5])):(.{1,2})\."
+    r"(.{1,2})\."
+    r"([0-9]{1,2}))"
+)
+
+
+def is_ascii_digits(string: str, length: int) -> bool:
+    """
+    Returns True if the string consists of exactly `length` digits 0-9. This is a faster equivalent of
+    `re.fullmatch(rf"[0-9]{{{length}}}", string)`.
+    Note that in contrast to the regex `^\\d{length}$` neither non-ASCII digits (e.g. '٣') nor a trailing newline
+    are accepted.
+    """
+    return len(string) == length and string.isascii() and string.isdigit()
+
+
+def is_ascii_alphanumeric(string: str) -> bool:
+    """
+    Returns True if the string is non-empty and consists only of the characters 0-9, A-Z and a-z. This is a faster
+    equivalent of `re.fullmatch(r"[0-9A-Za-z]+", string)`.
+    """
+    return string.isascii() and string.isalnum()
@@ -0,0 +1,174 @@
+"""
+Contains functionality to validate data sets on several CPU cores. The validators are pure CPU work, thus the
+asyncio based ValidationManager only uses a single core.
+"""
+
+import asyncio
+import itertools
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Coroutine, Generic, Iterable, Iterator, Optional, TypeVar
+
+from bomf.config import MigrationConfig
+from injector import Injector, Module
+from pvframework import ValidationManager
+from pvframework.types import DataSetT
+
+from .batch import BatchSummary, DataSetSummary
+from .fail_fast import FailFast
+
+T = TypeVar("T")
+
+_worker_manager: Optional[ValidationManager] = None
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def build_validation_manager(
+    provider: type[Module], config: Optional[MigrationConfig] = None, fail_fast: Optional[FailFast] = None
+) -> ValidationManager:
+    """
+    Builds the ValidationManager of the given provider module (e.g. `ValidationManagerProviderCustomer`).
+    The MigrationConfig is only needed for providers which require it. If `fail_fast` is given, the manager validates
+    in the fail-fast mode (the provider has to be a `ValidationManagerProvider`).
+    """
+    modules: list[Any] = [provider() if fail_fast is None else provider(fail_fast=fail_fast)]  # type:ignore[call-arg]
+    if config is not None:
+        modules.append(lambda binder: binder.bind(MigrationConfig, to=config))
+    return Injector(modules).get(ValidationManager)
+
+
+def init_worker(
+    provider: type[Module], config: Optional[MigrationConfig] = None, fail_fast: Optional[FailFast] = None
+) -> None:
+    """
+    Builds the ValidationManager (see `build_validation_manager`) and the event loop once per worker process. This is
+    the initializer of the worker processes of `ProcessPoolRunner` and `pvtool.sharding`.
+    """
+    global _worker_manager, _worker_loop  # pylint: disable=global-statement
+    _worker_manager = build_validation_manager(provider, config, fail_fast)
+    _worker_loop = asyncio.new_event_loop()
+
+
+def worker_manager() -> ValidationManager:
+    """
+    Returns the ValidationManager of the current worker process.
+    """
+    assert _worker_manager is not None, "The worker is not initialized"
+    return _worker_manager
+
+
+def run_in_worker(coroutine: Coroutine[Any, Any, T]) -> T:
+    """
+    Runs the coroutine in the event loop of the current worker process.
+    """
+    assert _worker_loop is not None, "The worker is not initialized"
+    return _worker_loop.run_until_complete(coroutine)
+
+
+async def _validate_chunk(first_index: int, data_sets: list[Any]) -> list[DataSetSummary]:
+    validation_manager = worker_manager()
+    return [
+        DataSetSummary.from_validation_result(index, await validation_manager.validate(data_set))
+        for index, data_set in enumerate(data_sets, start=first_index)
+    ]
+
+
+def _validate_chunk_in_worker(first_index: int, data_sets: list[Any]) -> tuple[list[DataSetSummary], BatchSummary]:
+    """
+    Validates a chunk of data sets inside a worker process. Only the compact summaries are sent back.
+    """
+    data_set_summaries = run_in_worker(_validate_chunk(first_index, data_sets))
+    chunk_summary = BatchSummary()
+    for data_set_summary in data_set_summaries:
+        chunk_summary.add_data_set_summary(data_set_summary)
+    return data_set_summaries, chunk_summary
+
+
+class ProcessPoolRunner(Generic[DataSetT]):
+    """
+    Validates data sets in a pool of worker processes. Each worker builds the ValidationManager of the given provider
+    module once. The data sets are sent to the workers in chunks of `chunk_size` and only the compact
+    `DataSetSummary`s are sent back. The results are yielded in the order of the input, independent of the order in
+    which the workers finish, and the counts of all results are merged into `summary`. If `fail_fast` is given, the
+    workers validate in the fail-fast mode (see `pvtool.fail_fast`).
+    The data sets are pickled as they are. They are not sent as JSON because data sets built by `model_construct` (like
+    those of `pvtool.synthetic` or of a loader which skips pydantic) don't survive a JSON round trip: Parsing them
+    again runs the pydantic validation, which rejects or coerces exactly the values the validators are meant to
+    report. The pickling costs about as much as the validation of cheap data sets, thus the pool only pays off with
+    several workers. To validate JSON lines files, use `pvtool.sharding` instead, which sends only the file names.
+    E.g.:
+    ```
+    with ProcessPoolRunner(ValidationManagerProviderCustomer, config, max_workers=8) as runner:
+        for data_set_summary in runner.validate(data_sets):
+            ...
+        print(runner.summary.num_fails)
+    ```
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        provider: type[Module],
+        config: Optional[MigrationConfig] = None,
+        *,
+        max_workers: Optional[int] = None,
+        chunk_size: int = 200,
+        fail_fast: Optional[FailFast] = None,
+    ):
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+        self.provider = provider
+        self.config = config
+        self.fail_fast = fail_fast
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers if max_workers is not None else os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers, initializer=init_worker, initargs=(provider, config, fail_fast)
+        )
+        self.summary = BatchSummary()
+
+    def validate(self, data_sets: Iterable[DataSetT]) -> Iterator[DataSetSummary]:
+        """
+        Validates the data sets and yields a `DataSetSummary` for each of them in the order of the input.
+        The input is consumed lazily, at most two chunks per worker are in flight at the same time.
+        The `DataSetSummary.index` refers to the position of the data set in `data_sets`.
+        """
+        in_flight: deque[Future[tuple[list[DataSetSummary], BatchSummary]]] = deque()
+        data_sets_iter = iter(data_sets)
+        first_index = 0
+        try:
+            while chunk := list(itertools.islice(data_sets_iter, self.chunk_size)):
+                if len(in_flight) >= 2 * self.max_workers:
+                    yield from self._finish(in_flight.popleft())
+                in_flight.append(self._executor.submit(_validate_chunk_in_worker, first_index, chunk))
+                first_index += len(chunk)
+            while in_flight:
+                yield from self._finish(in_flight.popleft())
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+    def _finish(self, future: Future[tuple[list[DataSetSummary], BatchSummary]]) -> list[DataSetSummary]:
+        data_set_summaries, chunk_summary = future.result()
+        self.summary.merge(chunk_summary)
+        return data_set_summaries
+
+    def run(self, data_sets: Iterable[DataSetT]) -> BatchSummary:
+        """
+        Validates all data sets and returns the summary. Use this if you are not interested in the single results.
+        """
+        for _ in self.validate(data_sets):
+            pass
+        return self.summary
+
+    def close(self) -> None:
+        """
+        Shuts down the worker processes.
+        """
+        self._executor.shutdown(cancel_futures=True)
+
+    def __enter__(self) -> "ProcessPoolRunner[DataSetT]":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
@@ -0,0 +1,126 @@
+"""
+Contains a planner for the queries of QueryMappedValidators. Several validators often iterate over the same part of a
+data set, e.g. all validators of the bank details evaluate `Query().path("banks").iter(iter_contract_id_dict)` and most
+of them also `.path("sepa_info.sepa_zahler")`. Queries built as `PlannedQuery` record their steps. The `QueryPlan` of a
+manager detects the (sub)queries which are shared by several registered queries and materializes each of them only
+once per data set. All dependent queries are fed from the materialized results.
+"""
+
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Hashable, Iterable, Iterator, Optional, Self
+
+from pvframework import Query, QueryMappedValidator
+from pvframework.mapped_validators.query_map import IteratorReturnType, IteratorReturnTypeWithException
+
+QuerySteps = tuple[tuple[str, Hashable], ...]
+"""The steps of a query, e.g. `(("path", "banks"), ("iter", iter_contract_id_dict), ("path", "iban"))`"""
+
+_query_ids: dict[QuerySteps, int] = {}
+"""
+Interns the steps of all planned (sub)queries: Equal steps get the same ID. The IDs are cheap to hash in contrast to the
+steps which are looked up for each step of each query of each data set.
+"""
+
+
+class _MaterializedQueries:  # pylint: disable=too-few-public-methods
+    """
+    Holds the results of the shared queries for a single data set
+    """
+
+    def __init__(self, shared_query_ids: frozenset[int]):
+        self.shared_query_ids = shared_query_ids
+        self.results: dict[int, list[IteratorReturnTypeWithException]] = {}
+
+
+_materialized_queries: ContextVar[Optional[_MaterializedQueries]] = ContextVar(
+    "pvtool_materialized_queries", default=None
+)
+
+
+class PlannedQuery(Query):
+    """
+    A `Query` which records its steps s.t. a `QueryPlan` can detect and share common subqueries. It is used exactly
+    like a `Query`. Outside a validation of a manager with a `QueryPlan` it behaves like a `Query`, too.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.steps: QuerySteps = ()
+
+    def path(self, attr_path: str) -> Self:
+        super().path(attr_path)
+        self._add_step(("path", attr_path))
+        return self
+
+    def iter(self, iter_func: Callable[[Any], Iterator[IteratorReturnType]]) -> Self:
+        super().iter(iter_func)
+        self._add_step(("iter", iter_func))
+        return self
+
+    def _add_step(self, step: tuple[str, Hashable]) -> None:
+        """
+        Wraps the function of the last step s.t. it reads the materialized results if the query up to this step is
+        shared. Since each step calls the function of its parent step, shared prefixes are read from the results, too.
+        """
+        self.steps = self.steps + (step,)
+        query_id = _query_ids.setdefault(self.steps, len(_query_ids))
+        query_function = self._function_stack[-1]
+
+        def _planned_query_function(data_set: Any) -> Iterator[IteratorReturnTypeWithException]:
+            materialized_queries = _materialized_queries.get()
+            if materialized_queries is None or query_id not in materialized_queries.shared_query_ids:
+                return query_function(data_set)
+            results = materialized_queries.results.get(query_id)
+            if results is None:
+                results = materialized_queries.results[query_id] = list(query_function(data_set))
+            return iter(results)
+
+        self._function_stack[-1] = _planned_query_function
+
+
+class QueryPlan:
+    """
+    Detects the subqueries which are shared by several of the given queries. Only subqueries containing an iteration
+    are shared since materializing a simple attribute access isn't worth it.
+    """
+
+    def __init__(self, queries: Iterable[Query]):
+        subquery_counts: Counter[QuerySteps] = Counter()
+        for query in queries:
+            if isinstance(query, PlannedQuery):
+                subquery_counts.update(
+                    query.steps[:length]
+                    for length in range(1, len(query.steps) + 1)
+                    if any(step_type == "iter" for step_type, _ in query.steps[:length])
+                )
+        self.shared_queries: frozenset[QuerySteps] = frozenset(
+            steps for steps, count in subquery_counts.items() if count > 1
+        )
+        self._shared_query_ids = frozenset(_query_ids[steps] for steps in self.shared_queries)
+
+    @classmethod
+    def of_mapped_validators(cls, mapped_validators: Iterable[Any]) -> "QueryPlan":
+        """
+        Plans the queries of all QueryMappedValidators (and subclasses) of the given mapped validators.
+        """
+        return cls(
+            query
+            for mapped_validator in mapped_validators
+            if isinstance(mapped_validator, QueryMappedValidator)
+            for query in mapped_validator.param_map.values()
+        )
+
+    @contextmanager
+    def materialize(self) -> Iterator[None]:
+        """
+        Within this context, each shared query is evaluated only once. Enter it for each data set separately.
+        """
+        token = _materialized_queries.set(
+            _MaterializedQueries(self._shared_query_ids) if self._shared_query_ids else None
+        )
+        try:
+            yield
+        finally:
+            _materialized_queries.reset(token)
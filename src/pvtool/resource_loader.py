@@ -2,15 +2,19 @@
 Contains validation logic for TripicaResourceLoaderDataSet
 """
 
-import re
+from typing import Any, Sequence
 
 from ibims.bo4e import Sparte
 from ibims.datasets import TripicaResourceLoaderDataSet
-from injector import Module, provider
-from pvframework import PathMappedValidator, ValidationManager, Validator
+from injector import provider
+from pvframework import ValidationManager, Validator
 from pvframework.utils import param
 
+from .columnar import column_rule
 from .customer_loader import ValidatorType
+from .field_access import PlannedPathMappedValidator
+from .patterns import REGEX_MELO_ID, is_ascii_digits
+from .validation_manager import PVToolValidationManager, ValidationManagerProvider
 
 
 def check_melo_id(messlokations_id: str) -> None:
@@ -19,7 +23,7 @@ def check_melo_id(messlokations_id: str) -> None:
     characters.
     See https://wiki.hochfrequenz.de/index.php/Markt-_und_Messlokation#Aufbau_der_Messlokation
     """
-    if not re.match(r"^DE\d{11}[A-Z\d]{20}$", messlokations_id):
+    if not REGEX_MELO_ID.match(messlokations_id):
         raise ValueError(
             f"{param('messlokations_id').param_id} has to start with 'DE' followed by 11 "
             "digits and 20 alphanumeric characters."
@@ -30,7 +34,7 @@ def check_malo_id(marktlokations_id: str) -> None:
     """
     Marktlokations-ID is required and has to consist of 11 digits
     """
-    if not re.match(r"^\d{11}$", marktlokations_id):
+    if not is_ascii_digits(marktlokations_id, 11):
         raise ValueError(f"{param('marktlokations_id').param_id} has to consist of 11 digits.")
 
 
@@ -51,13 +55,61 @@ def check_zaehlernummer(zaehlernummer: str) -> None:
         raise ValueError(f"{param('zaehlernummer').param_id} must not start with whitespace")
 
 
+@column_rule(check_melo_id)
+def melo_id_column_rule(messlokations_ids: Sequence[Any]) -> list[bool]:
+    """The column rule of `check_melo_id`"""
+    return [
+        isinstance(messlokations_id, str) and REGEX_MELO_ID.match(messlokations_id) is not None
+        for messlokations_id in messlokations_ids
+    ]
+
+
+@column_rule(check_malo_id)
+def malo_id_column_rule(marktlokations_ids: Sequence[Any]) -> list[bool]:
+    """The column rule of `check_malo_id`"""
+    return [
+        isinstance(marktlokations_id, str) and is_ascii_digits(marktlokations_id, 11)
+        for marktlokations_id in marktlokations_ids
+    ]
+
+
+@column_rule(check_sparte)
+def sparte_column_rule(sparten: Sequence[Any]) -> list[bool]:
+    """The column rule of `check_sparte`"""
+    return [isinstance(sparte, Sparte) and sparte in (Sparte.STROM, Sparte.GAS) for sparte in sparten]
+
+
+@column_rule(check_zaehlernummer)
+def zaehlernummer_column_rule(zaehlernummern: Sequence[Any]) -> list[bool]:
+    """The column rule of `check_zaehlernummer`"""
+    return [isinstance(zaehlernummer, str) and not zaehlernummer.startswith(" ") for zaehlernummer in zaehlernummern]
+
+
 validate_melo_id: ValidatorType = Validator(check_melo_id)
 validate_malo_id: ValidatorType = Validator(check_malo_id)
 validate_sparte: ValidatorType = Validator(check_sparte)
 validate_zaehlernummer: ValidatorType = Validator(check_zaehlernummer)
 
 
-class ValidationManagerProviderResource(Module):
+def build_resource_validation_manager() -> PVToolValidationManager[TripicaResourceLoaderDataSet]:
+    """
+    Builds a ValidationManager for resource loader and registers all validators.
+    """
+    resource_manager = PVToolValidationManager[TripicaResourceLoaderDataSet](manager_id="ResourceLoader")
+    resource_manager.register(
+        PlannedPathMappedValidator(validate_melo_id, {"messlokations_id": "messlokation.messlokations_id"})
+    )
+    resource_manager.register(
+        PlannedPathMappedValidator(validate_malo_id, {"marktlokations_id": "marktlokation.marktlokations_id"})
+    )
+    resource_manager.register(
+        PlannedPathMappedValidator(validate_zaehlernummer, {"zaehlernummer": "zaehler.zaehlernummer"})
+    )
+    resource_manager.register(PlannedPathMappedValidator(validate_sparte, {"sparte": "vertrag.sparte"}))
+    return resource_manager
+
+
+class ValidationManagerProviderResource(ValidationManagerProvider):
     """
     This module provides a ValidationManager for network loader
     """
@@ -66,16 +118,6 @@ class ValidationManagerProviderResource(Module):
     def resource_validation_manager(self) -> ValidationManager:
         """
         This method provides a ValidationManager for resource loader
+        The manager is built once (per fail-fast mode) and reused afterwards.
         """
-        resource_manager = ValidationManager[TripicaResourceLoaderDataSet](manager_id="ResourceLoader")
-        resource_manager.register(
-            PathMappedValidator(validate_melo_id, {"messlokations_id": "messlokation.messlokations_id"})
-        )
-        resource_manager.register(
-            PathMappedValidator(validate_malo_id, {"marktlokations_id": "marktlokation.marktlokations_id"})
-        )
-        resource_manager.register(
-            PathMappedValidator(validate_zaehlernummer, {"zaehlernummer": "zaehler.zaehlernummer"})
-        )
-        resource_manager.register(PathMappedValidator(validate_sparte, {"sparte": "vertrag.sparte"}))
-        return resource_manager
+        return self._cached_validation_manager((TripicaResourceLoaderDataSet,), build_resource_validation_manager)
@@ -0,0 +1,307 @@
+"""
+Contains the `pvtool-shards` console command. It validates all JSON lines files (shards, e.g. the export chunks of a
+migration) in a directory using a pool of worker processes and writes the errors of each shard to a separate file
+plus a merged summary. Runs are restartable: Shards which were completed by a previous run with the same parameters
+(and didn't change since) are skipped, i.e. after a failure only the remaining shards are validated.
+E.g.:
+```
+pvtool-shards customer exports/ results/ --migration-key-date 2023-06-01T00:00:00+00:00 --workers 8
+```
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+from bomf.config import MigrationConfig
+
+from .batch import BatchSummary
+from .cli import (
+    DATA_SET_TYPES,
+    ErrorWriter,
+    add_validation_arguments,
+    check_validation_arguments,
+    fail_fast_mode,
+    validate_lines,
+)
+from .fail_fast import FailFast
+from .mmap_reader import MemoryMappedJsonLines
+from .process_pool import init_worker, run_in_worker, worker_manager
+from .validation_manager import PVToolValidationManager
+
+SUMMARY_FILE_NAME = "summary.json"
+"""The name of the merged summary in the output directory"""
+
+
+@dataclass(frozen=True)
+class ShardResult:
+    """
+    The result of validating a single input file
+    """
+
+    input_file: str
+    """The name of the shard, i.e. the path of the input file relative to the input directory"""
+    summary: Optional[BatchSummary] = None
+    """The counts of the validated data sets. None if the shard failed."""
+    num_parse_errors: int = 0
+    failure: Optional[str] = None
+    """The error message if the shard could not be validated"""
+
+    @property
+    def succeeded(self) -> bool:
+        """True if the shard was validated completely (independent of the validation results)"""
+        return self.failure is None
+
+
+@dataclass(frozen=True)
+class _Shard:
+    """
+    An input file and its name, which determines the paths of its outputs
+    """
+
+    input_file: Path
+    name: str
+    """The path of the input file relative to the input directory"""
+
+    def output_files(self, output_dir: Path) -> tuple[Path, Path]:
+        """Returns the paths of the errors and the summary of the shard"""
+        return output_dir / f"{self.name}.errors.jsonl", output_dir / f"{self.name}.summary.json"
+
+    def input_fingerprint(self) -> dict[str, int]:
+        """Returns the size and the modification time of the input file"""
+        stat = self.input_file.stat()
+        return {"input_size": stat.st_size, "input_mtime_ns": stat.st_mtime_ns}
+
+
+def _completed_shard(shard: _Shard, output_dir: Path, run_parameters: dict[str, str]) -> Optional[ShardResult]:
+    """
+    Returns the result of the shard if a previous run with the same parameters completed it and the input file didn't
+    change since.
+    """
+    _, summary_file = shard.output_files(output_dir)
+    try:
+        shard_summary = json.loads(summary_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if shard_summary.get("run_parameters") != run_parameters:
+        return None
+    if any(shard_summary.get(key) != value for key, value in shard.input_fingerprint().items()):
+        return None
+    return ShardResult(
+        input_file=shard.name,
+        summary=BatchSummary.from_dict(shard_summary["summary"]),
+        num_parse_errors=shard_summary["num_parse_errors"],
+    )
+
+
+def _validate_shard(  # pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals
+    data_set_type: str,
+    shard: _Shard,
+    output_dir: Path,
+    run_parameters: dict[str, str],
+    with_warnings: bool,
+    concurrency: int,
+) -> ShardResult:
+    """
+    Validates a single input file inside a worker process. The outputs are written to temporary files first, i.e. the
+    shard counts as completed only if the validation finished. The run parameters are recorded in the summary of the
+    shard (see `_completed_shard`).
+    """
+    validation_manager = worker_manager()
+    assert isinstance(validation_manager, PVToolValidationManager)
+    data_set_class, _ = DATA_SET_TYPES[data_set_type]
+    errors_file, summary_file = shard.output_files(output_dir)
+    errors_file.parent.mkdir(parents=True, exist_ok=True)
+    fingerprint = shard.input_fingerprint()
+    errors_tmp_file = errors_file.with_name(errors_file.name + ".tmp")
+    with MemoryMappedJsonLines(shard.input_file) as lines, open(errors_tmp_file, "w", encoding="utf-8") as output:
+        error_writer = ErrorWriter(output, with_warnings)
+        run_in_worker(validate_lines(lines, data_set_class, validation_manager, error_writer, concurrency))
+    os.replace(errors_tmp_file, errors_file)
+    summary_tmp_file = summary_file.with_name(summary_file.name + ".tmp")
+    summary_tmp_file.write_text(
+        json.dumps(
+            {
+                "input_file": shard.name,
+                **fingerprint,
+                "run_parameters": run_parameters,
+                "num_parse_errors": error_writer.num_parse_errors,
+                "summary": error_writer.summary.to_dict(),
+            }
+        ),
+        encoding="utf-8",
+    )
+    os.replace(summary_tmp_file, summary_file)
+    return ShardResult(
+        input_file=shard.name, summary=error_writer.summary, num_parse_errors=error_writer.num_parse_errors
+    )
+
+
+def _shards(input_files: Sequence[Path], input_dir: Optional[Path]) -> list[_Shard]:
+    """
+    Returns the shards of the input files. Raises a ValueError if several input files have the same name.
+    """
+    shards = [
+        _Shard(input_file, input_file.name if input_dir is None else input_file.relative_to(input_dir).as_posix())
+        for input_file in input_files
+    ]
+    shard_names = [shard.name for shard in shards]
+    duplicate_names = sorted({name for name in shard_names if shard_names.count(name) > 1})
+    if duplicate_names:
+        raise ValueError(f"The shard names must be unique, but these occur several times: {duplicate_names}")
+    return shards
+
+
+def validate_shards(  # pylint: disable=too-many-arguments, too-many-locals
+    data_set_type: str,
+    input_files: Sequence[Path],
+    output_dir: Path,
+    config: Optional[MigrationConfig] = None,
+    *,
+    input_dir: Optional[Path] = None,
+    max_workers: Optional[int] = None,
+    with_warnings: bool = True,
+    concurrency: int = 100,
+    restart: bool = False,
+    fail_fast: Optional[FailFast] = None,
+) -> list[ShardResult]:
+    """
+    Validates the input files in a pool of worker processes. Each worker builds the ValidationManager once and takes
+    the next pending file whenever it finished one, the largest files first. Thus, the load is balanced even if the
+    file sizes differ a lot.
+    For each input file `<name>` the errors are written to `<name>.errors.jsonl` and the counts to
+    `<name>.summary.json` in the output directory. The name is the path relative to `input_dir` (if given, e.g.
+    `2023/01.jsonl`) or the file name otherwise, and it has to be unique. Files completed by a previous run with the
+    same parameters (data set type, migration key date, warnings) are skipped unless `restart` is set. A failing shard
+    doesn't stop the others, it is reported in its `ShardResult` and retried by the next run.
+    If `fail_fast` is given, the data sets are validated in the fail-fast mode (see `pvtool.fail_fast`).
+    Returns the results of all input files in the order of `input_files`.
+    """
+    if data_set_type not in DATA_SET_TYPES:
+        raise ValueError(f"Unknown data set type {data_set_type}, expected one of {sorted(DATA_SET_TYPES)}")
+    shards = _shards(input_files, input_dir)
+    run_parameters = {
+        "data_set_type": data_set_type,
+        "migration_key_date": str(config.migration_key_date if config is not None else None),
+        "with_warnings": str(with_warnings),
+        "fail_fast": repr(fail_fast),
+    }
+    output_dir.mkdir(parents=True, exist_ok=True)
+    results: dict[str, ShardResult] = {}
+    pending: list[_Shard] = []
+    for shard in shards:
+        completed_shard = None if restart else _completed_shard(shard, output_dir, run_parameters)
+        if completed_shard is not None:
+            results[shard.name] = completed_shard
+        else:
+            pending.append(shard)
+    pending.sort(key=lambda shard: shard.input_file.stat().st_size, reverse=True)
+
+    if pending:
+        with ProcessPoolExecutor(
+            max_workers=max_workers or os.cpu_count() or 1,
+            initializer=init_worker,
+            initargs=(DATA_SET_TYPES[data_set_type][1], config, fail_fast),
+        ) as executor:
+            futures: dict[Future[ShardResult], _Shard] = {
+                executor.submit(
+                    _validate_shard, data_set_type, shard, output_dir, run_parameters, with_warnings, concurrency
+                ): shard
+                for shard in pending
+            }
+            for future in as_completed(futures):
+                shard = futures[future]
+                try:
+                    results[shard.name] = future.result()
+                except Exception as error:  # pylint: disable=broad-exception-caught
+                    results[shard.name] = ShardResult(input_file=shard.name, failure=f"{type(error).__name__}: {error}")
+    return [results[shard.name] for shard in shards]
+
+
+def merge_shard_results(shard_results: Sequence[ShardResult]) -> dict[str, Any]:
+    """
+    Returns the merged summary of all shards as JSON serializable dict.
+    """
+    summary = BatchSummary()
+    for shard_result in shard_results:
+        if shard_result.summary is not None:
+            summary.merge(shard_result.summary)
+    return {
+        "summary": summary.to_dict(),
+        "num_parse_errors": sum(shard_result.num_parse_errors for shard_result in shard_results),
+        "failed_shards": {
+            shard_result.input_file: shard_result.failure
+            for shard_result in shard_results
+            if shard_result.failure is not None
+        },
+    }
+
+
+def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="pvtool-shards",
+        description="Validates all ibims JSON lines files in a directory using several worker processes and writes "
+        "the errors of each file plus a merged summary to the output directory.",
+    )
+    add_validation_arguments(parser)
+    parser.add_argument("input_dir", type=Path, help="The directory containing the JSON lines files")
+    parser.add_argument("output_dir", type=Path, help="The directory to write the results to")
+    parser.add_argument("--pattern", default="*.jsonl", help="The glob pattern of the input files (default: *.jsonl)")
+    parser.add_argument("--workers", type=int, help="The number of worker processes (default: number of CPUs)")
+    parser.add_argument(
+        "--restart", action="store_true", help="Validate all files again, also those completed by a previous run"
+    )
+    args = parser.parse_args(argv)
+    check_validation_arguments(parser, args)
+    if not args.input_dir.is_dir():
+        parser.error(f"{args.input_dir} is not a directory")
+    return args
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    The entry point of the `pvtool-shards` command. Returns 0 if all shards were validated and all data sets are
+    valid, 1 otherwise.
+    """
+    args = _parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.CRITICAL)
+    config = (
+        MigrationConfig(migration_key_date=args.migration_key_date) if args.migration_key_date is not None else None
+    )
+    input_files = sorted(path for path in args.input_dir.glob(args.pattern) if path.is_file())
+    shard_results = validate_shards(
+        args.data_set_type,
+        input_files,
+        args.output_dir,
+        config,
+        input_dir=args.input_dir,
+        max_workers=args.workers,
+        with_warnings=not args.no_warnings,
+        concurrency=args.concurrency,
+        restart=args.restart,
+        fail_fast=fail_fast_mode(args),
+    )
+    merged_summary = merge_shard_results(shard_results)
+    (args.output_dir / SUMMARY_FILE_NAME).write_text(json.dumps(merged_summary, indent=2), encoding="utf-8")
+
+    summary = BatchSummary.from_dict(merged_summary["summary"])
+    failed_shards = merged_summary["failed_shards"]
+    print(
+        f"{len(input_files) - len(failed_shards)} of {len(input_files)} files validated. "
+        f"{summary.total} data sets validated: {summary.num_succeeds} succeeded, {summary.num_fails} failed, "
+        f"{summary.num_warnings} with warnings. {merged_summary['num_parse_errors']} lines could not be parsed.",
+        file=sys.stderr,
+    )
+    for input_file, failure in failed_shards.items():
+        print(f"{input_file} failed: {failure}", file=sys.stderr)
+    return 0 if not failed_shards and summary.num_fails == 0 and merged_summary["num_parse_errors"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
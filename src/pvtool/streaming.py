@@ -0,0 +1,41 @@
+"""
+Contains the streaming of validation errors (see `PVToolValidationManager.iter_errors`). While a data set is validated
+in a separate task, the errors of each validator are handed over to the consumer as soon as the validator completes.
+The validation task waits until the consumer has consumed them before it executes further validators. Thus, if the
+consumer stops iterating (e.g. at the first error), the remaining validators are not executed at all.
+"""
+
+import asyncio
+from typing import AbstractSet, AsyncIterator, Optional
+
+from pvframework.errors import ValidationError, ValidationMode
+
+
+class ErrorStream:
+    """
+    Hands the errors raised while validating a single data set over from the validation task to the consumer.
+    Only errors of validators registered with one of the `modes` are streamed.
+    """
+
+    def __init__(self, modes: AbstractSet[ValidationMode]):
+        self.modes = modes
+        self._queue: asyncio.Queue[Optional[list[ValidationError]]] = asyncio.Queue()
+
+    async def publish(self, validation_errors: list[ValidationError]) -> None:
+        """
+        Hands the errors of a validator over to the consumer and waits until it has consumed all of them.
+        """
+        self._queue.put_nowait(validation_errors)
+        await self._queue.join()
+
+    def close(self) -> None:
+        """
+        Signals the consumer that the validation has finished (successfully or not).
+        """
+        self._queue.put_nowait(None)
+
+    async def __aiter__(self) -> AsyncIterator[ValidationError]:
+        while (validation_errors := await self._queue.get()) is not None:
+            for validation_error in validation_errors:
+                yield validation_error
+            self._queue.task_done()
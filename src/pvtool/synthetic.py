@@ -0,0 +1,500 @@
+"""
+Contains seeded generators of synthetic ibims data sets to load-test and fuzz the validation managers. The generated
+data sets are valid (e.g. MaLo-IDs with correct BDEW checksums, IBANs with correct check digits and matching BICs)
+except for the errors which are injected on purpose: Each generator has a rate per rule, i.e. per validator function
+(e.g. `check_iban`), with which the value checked by this rule is replaced by an invalid one.
+The data sets are generated lazily, i.e. arbitrarily many of them can be streamed through a manager:
+```
+generator = CustomerDataSetGenerator(migration_key_date, seed=42, error_rates={"check_iban": 0.01})
+async for validation_result in customer_manager.validate_many(generator.generate(1_000_000)):
+    ...
+```
+Like `model_construct`, the generators don't validate the data sets by pydantic (just like the data sets the validators
+are meant for). But for speed, they copy a prototype per model class instead of calling `model_construct`.
+"""
+
+import random
+import string
+import warnings
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from functools import cache
+from itertools import count
+from typing import AbstractSet, Any, ClassVar, Generic, Iterator, Mapping, Optional, TypeVar
+
+from ibims.bo4e import (
+    Adresse,
+    Anrede,
+    Bankverbindung,
+    Geschaeftspartner,
+    Kontaktart,
+    Kundentyp,
+    Landescode,
+    Marktlokation,
+    Marktteilnehmer,
+    Messlokation,
+    Registeranzahl,
+    Rollencodetyp,
+    SepaInfo,
+    Sparte,
+    Typ,
+    Vertrag,
+    VertragskontoCBA,
+    VertragskontoMBA,
+    Zaehler,
+    Zaehlerauspraegung,
+    Zaehlwerk,
+    ZusatzAttribut,
+)
+from ibims.datasets import TripicaCustomerLoaderDataSet, TripicaNetworkLoaderDataSet, TripicaResourceLoaderDataSet
+from pydantic import BaseModel
+
+from .malo_id_validation import _get_malo_id_checksum
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+GeneratedDataSetT = TypeVar(
+    "GeneratedDataSetT", TripicaCustomerLoaderDataSet, TripicaNetworkLoaderDataSet, TripicaResourceLoaderDataSet
+)
+
+BANKS: tuple[tuple[str, str, str], ...] = (
+    ("37040044", "COBADEFFXXX", "Commerzbank"),
+    ("10010010", "PBNKDEFFXXX", "Postbank"),
+    ("50010517", "INGDDEFFXXX", "ING-DiBa"),
+    ("70150000", "SSKMDEMMXXX", "Stadtsparkasse München"),
+    ("20050550", "HASPDEHHXXX", "Hamburger Sparkasse"),
+    ("60050101", "SOLADEST600", "BW-Bank"),
+)
+"""Bank codes (BLZ) of German banks with their BICs and names"""
+
+_VORNAMEN = ("Max", "Erika", "Lukas", "Sophie", "Jörg", "Anna-Lena", "Mehmet", "Zoë")
+_NACHNAMEN = ("Mustermann", "Müller", "Schmidt", "Schneider", "Fischer", "Weber", "O'Neill", "Yılmaz")
+_ORTE = (("50667", "Köln"), ("10115", "Berlin"), ("80331", "München"), ("20095", "Hamburg"), ("04109", "Leipzig"))
+_STRASSEN = ("Hauptstraße", "Gigastr.", "Am Markt", "Bahnhofstraße", "Lindenallee")
+_E_MAIL_DOMAINS = ("example.com", "example.org", "hochfrequenz.de")
+_MELO_ID_CHARACTERS = string.ascii_uppercase + string.digits
+
+
+@cache
+def _prototype(model_class: type[ModelT]) -> ModelT:
+    """Returns an instance of the model class with the default values"""
+    with warnings.catch_warnings():
+        # the ibims data sets warn about `model_construct`
+        warnings.simplefilter("ignore", DeprecationWarning)
+        return model_class.model_construct()
+
+
+def _construct(model_class: type[ModelT], **values: Any) -> ModelT:
+    """
+    Returns an instance of the model class with the values like `model_class.model_construct(**values)`. A (shallow)
+    copy of the prototype is much cheaper than `model_construct` which fills in the default of each field one by one.
+    """
+    return _prototype(model_class).model_copy(update=values)
+
+
+def random_digits(rng: random.Random, length: int) -> str:
+    """Returns `length` random digits"""
+    return f"{rng.randrange(10**length):0{length}d}"
+
+
+def random_malo_id(rng: random.Random) -> str:
+    """Returns a random MaLo-ID with a correct BDEW checksum"""
+    first_ten_digits = str(rng.randrange(10**9, 10**10))
+    return first_ten_digits + _get_malo_id_checksum(first_ten_digits)
+
+
+def random_melo_id(rng: random.Random) -> str:
+    """Returns a random MeLo-ID matching `REGEX_MELO_ID`"""
+    return "DE" + random_digits(rng, 11) + "".join(rng.choices(_MELO_ID_CHARACTERS, k=20))
+
+
+# the last digit of a Rollencodenummer for each remainder of the weighted sum of the first twelve digits modulo 10. The
+# last digit is at an even position, i.e. it is part of the sum itself. There is none for odd remainders.
+_ROLLENCODENUMMER_CHECKSUM_DIGITS = tuple(
+    next((str(digit) for digit in range(1, 10) if 10 - (remainder + digit) % 10 == digit), None)
+    for remainder in range(10)
+)
+# the ASCII code of '0' is added once per digit, i.e. 6 times for the even and 2*6 times for the odd positions
+_ROLLENCODENUMMER_ASCII_ZERO_OFFSET = 18 * ord("0")
+
+
+def rollencodenummer_checksum(first_twelve_digits: str) -> Optional[str]:
+    """
+    Returns the last digit which completes the first twelve (ASCII) digits to a Rollencodenummer satisfying the checksum
+    of `check_rollencodenr` or None if there is none (i.e. if the weighted sum of the first twelve digits is odd).
+    """
+    ascii_codes = first_twelve_digits.encode("ascii")
+    weighted_sum = sum(ascii_codes[0::2]) + 2 * sum(ascii_codes[1::2]) - _ROLLENCODENUMMER_ASCII_ZERO_OFFSET
+    return _ROLLENCODENUMMER_CHECKSUM_DIGITS[weighted_sum % 10]
+
+
+def random_rollencodenummer(rng: random.Random) -> str:
+    """Returns a random BDEW Rollencodenummer (starting with 99) satisfying the checksum of `check_rollencodenr`"""
+    first_twelve_digits = "99" + random_digits(rng, 10)
+    checksum = rollencodenummer_checksum(first_twelve_digits)
+    if checksum is None:
+        # changing the parity of a digit at an even position makes the weighted sum even
+        first_twelve_digits = first_twelve_digits[:10] + str(int(first_twelve_digits[10]) ^ 1) + first_twelve_digits[11]
+        checksum = rollencodenummer_checksum(first_twelve_digits)
+    assert checksum is not None
+    return first_twelve_digits + checksum
+
+
+def iban_check_digits(country_code: str, bban: str) -> str:
+    """Returns the check digits of the IBAN (ISO 13616) of the given country and BBAN"""
+    rearranged = bban + "".join(str(int(character, 36)) for character in country_code) + "00"
+    return f"{98 - int(rearranged) % 97:02d}"
+
+
+def random_iban_and_bic(rng: random.Random) -> tuple[str, str, str]:
+    """Returns a random German IBAN with correct check digits, the BIC and the name of its bank"""
+    bank_code, bic, bank_name = rng.choice(BANKS)
+    bban = bank_code + random_digits(rng, 10)
+    return f"DE{iban_check_digits('DE', bban)}{bban}", bic, bank_name
+
+
+def random_obis(rng: random.Random, sparte: Sparte) -> str:
+    """Returns a random OBIS code matching `OBIS_PATTERN` and `check_obis` for the Sparte (STROM or GAS)"""
+    if sparte == Sparte.GAS:
+        return f"7-{rng.randrange(66)}:{rng.randrange(1, 100)}.{rng.randrange(100)}.{rng.randrange(100)}"
+    return (
+        f"1-{rng.randrange(66)}:{rng.choice(('1', '2', '99'))}.{rng.choice(('6', '8', '9', '29'))}.{rng.randrange(10)}"
+    )
+
+
+class DataSetGenerator(ABC, Generic[GeneratedDataSetT]):
+    """
+    Generates synthetic data sets. For each data set, the error of each rule is injected with the probability given
+    in `error_rates` (independently of the other rules). The rules are named like the validator functions they break,
+    see `RULES`. The generated data sets only depend on the seed and the error rates. To generate even faster, run
+    generators with different seeds in parallel processes.
+    """
+
+    RULES: ClassVar[tuple[str, ...]]
+    """The rules into which errors can be injected"""
+
+    def __init__(self, seed: int = 0, error_rates: Optional[Mapping[str, float]] = None):
+        self.seed = seed
+        self.error_rates = dict(error_rates or {})
+        unknown_rules = self.error_rates.keys() - set(self.RULES)
+        if unknown_rules:
+            raise ValueError(f"Unknown rules {sorted(unknown_rules)}. The rules are: {', '.join(self.RULES)}")
+        for rule, error_rate in self.error_rates.items():
+            if not 0 <= error_rate <= 1:
+                raise ValueError(f"The error rate of {rule} must be between 0 and 1, got {error_rate}")
+
+    def generate_with_errors(
+        self, num_data_sets: Optional[int] = None
+    ) -> Iterator[tuple[GeneratedDataSetT, frozenset[str]]]:
+        """
+        Yields `num_data_sets` data sets (endlessly if None) together with the rules whose errors were injected.
+        """
+        rng = random.Random(self.seed)
+        error_rates = [(rule, error_rate) for rule, error_rate in self.error_rates.items() if error_rate > 0]
+        for index in count() if num_data_sets is None else range(num_data_sets):
+            broken_rules = frozenset(rule for rule, error_rate in error_rates if rng.random() < error_rate)
+            yield self._build(rng, index, broken_rules), broken_rules
+
+    def generate(self, num_data_sets: Optional[int] = None) -> Iterator[GeneratedDataSetT]:
+        """
+        Yields `num_data_sets` data sets (endlessly if None).
+        """
+        return (data_set for data_set, _ in self.generate_with_errors(num_data_sets))
+
+    @abstractmethod
+    def _build(self, rng: random.Random, index: int, broken_rules: AbstractSet[str]) -> GeneratedDataSetT:
+        """
+        Builds the index-th data set. The values checked by the broken rules have to be invalid, all others valid.
+        """
+
+
+class CustomerDataSetGenerator(DataSetGenerator[TripicaCustomerLoaderDataSet]):
+    """
+    Generates `TripicaCustomerLoaderDataSet`s with a bank account and a contract. The dates are valid as of the
+    migration key date. The errors of `check_geschaeftspartner_anrede`, `check_geschaeftspartner_geburtsdatum` and
+    `check_telefonnummer` are warnings.
+    """
+
+    RULES = (
+        "check_geschaeftspartner_anrede",
+        "check_str_is_stripped",
+        "check_e_mail",
+        "check_extern_customer_id",
+        "check_date_in_past_required",
+        "check_geschaeftspartner_geburtsdatum",
+        "check_telefonnummer",
+        "check_address_deutsch",
+        "check_address_fields",
+        "check_postleitzahl",
+        "check_iban",
+        "check_bic",
+        "check_kontoinhaber",
+        "check_bankname",
+        "check_date_in_past_bankverbindung",
+        "check_date_in_future_optional",
+        "check_date_in_past_optional",
+        "check_vertragskontonummer",
+    )
+
+    def __init__(self, migration_key_date: datetime, seed: int = 0, error_rates: Optional[Mapping[str, float]] = None):
+        super().__init__(seed, error_rates)
+        self.migration_key_date = migration_key_date
+
+    # pylint: disable=too-many-locals
+    def _build(self, rng: random.Random, index: int, broken_rules: AbstractSet[str]) -> TripicaCustomerLoaderDataSet:
+        key_date = self.migration_key_date
+        customer_id = f"2{index % 10**8:08d}"
+        vorname, nachname = rng.choice(_VORNAMEN), rng.choice(_NACHNAMEN)
+        past = key_date - timedelta(days=rng.randrange(1, 3650))
+        future = key_date + timedelta(days=rng.randrange(1, 3650))
+        postleitzahl, ort = rng.choice(_ORTE)
+        liefer_adresse = _construct(
+            Adresse,
+            postleitzahl=postleitzahl,
+            ort=ort,
+            strasse=rng.choice(_STRASSEN),
+            hausnummer=None if "check_address_fields" in broken_rules else str(rng.randrange(1, 200)),
+            landescode=Landescode.AT if "check_address_deutsch" in broken_rules else Landescode.DE,  # type:ignore
+        )
+        rechnungs_adresse = (
+            liefer_adresse.model_copy(update={"postleitzahl": postleitzahl[:4] + "!"})
+            if "check_postleitzahl" in broken_rules
+            else liefer_adresse
+        )
+        iban, bic, bank_name = random_iban_and_bic(rng)
+        if "check_iban" in broken_rules:
+            iban = f"DE{(int(iban[2:4]) - 1) % 97 + 2:02d}{iban[4:]}"
+        vertragskontonummer = random_digits(rng, 8)
+        return _construct(
+            TripicaCustomerLoaderDataSet,
+            powercloud_customer_id=customer_id,
+            geschaeftspartner=_construct(
+                Geschaeftspartner,
+                zusatz_attribute=[
+                    _construct(
+                        ZusatzAttribut,
+                        name="customerID",
+                        wert=f"1{customer_id[1:]}" if "check_extern_customer_id" in broken_rules else customer_id,
+                    )
+                ],
+                typ=Typ.GESCHAEFTSPARTNER,
+                nachname=f" {nachname}" if "check_str_is_stripped" in broken_rules else nachname,
+                vorname=vorname,
+                anrede=Anrede.FAMILIE if "check_geschaeftspartner_anrede" in broken_rules else Anrede.HERR,
+                e_mail_adresse=(
+                    f"{customer_id}@"
+                    if "check_e_mail" in broken_rules
+                    else f"kunde{customer_id}@{rng.choice(_E_MAIL_DOMAINS)}"
+                ),
+                telefonnummer_mobil=(
+                    "0221 abc" if "check_telefonnummer" in broken_rules else f"+49 (0) 15{random_digits(rng, 9)}"
+                ),
+                telefonnummer_privat=f"0221 {random_digits(rng, 6)}",
+                erstellungsdatum=future if "check_date_in_past_required" in broken_rules else past,
+                geburtstag=(
+                    key_date - timedelta(days=rng.randrange(365, 6000))
+                    if "check_geschaeftspartner_geburtsdatum" in broken_rules
+                    else key_date - timedelta(days=rng.randrange(7000, 30000))
+                ),
+            ),
+            liefer_adressen={"contract_id_1": liefer_adresse},
+            rechnungs_adressen={"contract_id_1": rechnungs_adresse},
+            banks={
+                "contract_id_1": _construct(
+                    Bankverbindung,
+                    iban=iban,
+                    bic=None if "check_bic" in broken_rules else bic,
+                    bankname="" if "check_bankname" in broken_rules else bank_name,
+                    ouid=1,
+                    kontoinhaber=" " if "check_kontoinhaber" in broken_rules else f"{vorname} {nachname}",
+                    gueltig_seit=future if "check_date_in_past_bankverbindung" in broken_rules else past,
+                    gueltig_bis=past if "check_date_in_future_optional" in broken_rules else None,
+                    sepa_info=_construct(
+                        SepaInfo,
+                        sepa_id=customer_id,
+                        sepa_zahler=True,
+                        gueltig_seit=future if "check_date_in_past_optional" in broken_rules else past,
+                    ),
+                )
+            },
+            vertragskonten_mbas=[
+                _construct(
+                    VertragskontoMBA,
+                    ouid=1,
+                    vertrags_adresse=liefer_adresse,
+                    vertragskontonummer=f"3{vertragskontonummer}",
+                    rechnungsstellung=Kontaktart.E_MAIL,
+                    cbas=[
+                        _construct(
+                            VertragskontoCBA,
+                            ouid=11,
+                            vertrags_adresse=liefer_adresse,
+                            vertragskontonummer=f"4{vertragskontonummer}",
+                            rechnungsstellung=Kontaktart.POSTWEG,
+                            vertrag=_construct(
+                                Vertrag,
+                                vertragsnummer=(
+                                    vertragskontonummer
+                                    if "check_vertragskontonummer" in broken_rules
+                                    else f"5{vertragskontonummer}"
+                                ),
+                            ),
+                            erstellungsdatum=past,
+                            rechnungsdatum_start=past,
+                            rechnungsdatum_naechstes=future,
+                        )
+                    ],
+                )
+            ],
+        )
+
+
+class NetworkDataSetGenerator(DataSetGenerator[TripicaNetworkLoaderDataSet]):
+    """
+    Generates `TripicaNetworkLoaderDataSet`s with a meter of Sparte STROM or GAS.
+    Note that the network manager reads `geschaeftspartner_mit_rechnungs_adresse` which is not a field of the data set.
+    Thus, even the data sets without injected errors fail `check_address_fields` and `check_postleitzahl`.
+    """
+
+    RULES = (
+        "check_str_is_stripped",
+        "check_address_fields",
+        "check_postleitzahl",
+        "check_address_deutsch",
+        "check_malo_id",
+        "check_sparte",
+        "check_netzbetreiber_code_nr",
+        "check_kundentyp",
+        "check_rollencodetyp",
+        "check_rollencodenr",
+        "check_zaehlernummer",
+        "check_zaehlerauspraegung",
+        "check_registeranzahl",
+        "check_obis",
+        "check_is_digit",
+    )
+
+    def _build(self, rng: random.Random, index: int, broken_rules: AbstractSet[str]) -> TripicaNetworkLoaderDataSet:
+        sparte = rng.choice((Sparte.STROM, Sparte.GAS))
+        postleitzahl, ort = rng.choice(_ORTE)
+        adresse = _construct(
+            Adresse,
+            postleitzahl=postleitzahl,
+            ort=ort,
+            strasse=rng.choice(_STRASSEN),
+            hausnummer=str(rng.randrange(1, 200)),
+            landescode=Landescode.DE,
+        )
+        obis_sparte = sparte
+        if "check_obis" in broken_rules:
+            # an OBIS code of the other Sparte is invalid
+            obis_sparte = Sparte.GAS if sparte == Sparte.STROM else Sparte.STROM
+        return _construct(
+            TripicaNetworkLoaderDataSet,
+            kunde=_construct(
+                Geschaeftspartner,
+                nachname=" Mustermann" if "check_str_is_stripped" in broken_rules else rng.choice(_NACHNAMEN),
+                vorname=rng.choice(_VORNAMEN),
+                adresse=(
+                    adresse.model_copy(update={"hausnummer": None})
+                    if "check_address_fields" in broken_rules
+                    else adresse
+                ),
+                partneradresse=(
+                    adresse.model_copy(update={"postleitzahl": postleitzahl[:4] + "!"})
+                    if "check_postleitzahl" in broken_rules
+                    else adresse
+                ),
+            ),
+            liefer_adresse=(
+                adresse.model_copy(update={"landescode": Landescode.AT})  # type:ignore[attr-defined]
+                if "check_address_deutsch" in broken_rules
+                else adresse
+            ),
+            marktlokation=_construct(
+                Marktlokation,
+                marktlokations_id=random_digits(rng, 5) if "check_malo_id" in broken_rules else random_malo_id(rng),
+                sparte=Sparte.WASSER if "check_sparte" in broken_rules else sparte,
+                netzbetreibercodenr=(
+                    random_digits(rng, 12)
+                    if "check_netzbetreiber_code_nr" in broken_rules
+                    else random_rollencodenummer(rng)
+                ),
+                kundengruppen=(
+                    [] if "check_kundentyp" in broken_rules else [rng.choice((Kundentyp.PRIVAT, Kundentyp.GEWERBE))]
+                ),
+            ),
+            netzbetreiber=_construct(
+                Marktteilnehmer,
+                rollencodetyp=None if "check_rollencodetyp" in broken_rules else Rollencodetyp.BDEW,
+                nachname="Netz GmbH",
+                rollencodenummer=(
+                    str(int(random_rollencodenummer(rng)) + 1)
+                    if "check_rollencodenr" in broken_rules
+                    else random_rollencodenummer(rng)
+                ),
+            ),
+            messstellenbetreiber=_construct(
+                Marktteilnehmer,
+                rollencodetyp=Rollencodetyp.BDEW,
+                nachname="Messstellenbetrieb GmbH",
+                rollencodenummer=random_rollencodenummer(rng),
+            ),
+            zaehler=_construct(
+                Zaehler,
+                # the network manager only checks that the zaehlernummer is a string
+                zaehlernummer=None if "check_zaehlernummer" in broken_rules else f"{index}{random_digits(rng, 6)}",
+                zaehlerauspraegung=(
+                    Zaehlerauspraegung.ZWEIRICHTUNGSZAEHLER
+                    if "check_zaehlerauspraegung" in broken_rules
+                    else Zaehlerauspraegung.EINRICHTUNGSZAEHLER
+                ),
+                registeranzahl=None if "check_registeranzahl" in broken_rules else Registeranzahl.EINTARIF,
+                sparte=sparte,
+                # the network manager reads `obis` and the digits as string
+                zaehlwerke=[
+                    _construct(
+                        Zaehlwerk,
+                        obis=random_obis(rng, obis_sparte),
+                        nachkommastellen="x" if "check_is_digit" in broken_rules else str(rng.randrange(4)),
+                        vorkommastellen=str(rng.randrange(4, 9)),
+                    )
+                ],
+            ),
+        )
+
+
+class ResourceDataSetGenerator(DataSetGenerator[TripicaResourceLoaderDataSet]):
+    """
+    Generates `TripicaResourceLoaderDataSet`s
+    """
+
+    RULES = ("check_melo_id", "check_malo_id", "check_zaehlernummer", "check_sparte")
+
+    def _build(self, rng: random.Random, index: int, broken_rules: AbstractSet[str]) -> TripicaResourceLoaderDataSet:
+        return _construct(
+            TripicaResourceLoaderDataSet,
+            marktlokation=_construct(
+                Marktlokation,
+                marktlokations_id=random_digits(rng, 5) if "check_malo_id" in broken_rules else random_malo_id(rng),
+            ),
+            messlokation=_construct(
+                Messlokation,
+                messlokations_id=random_melo_id(rng)[:13] if "check_melo_id" in broken_rules else random_melo_id(rng),
+            ),
+            vertrag=_construct(
+                Vertrag,
+                sparte=Sparte.WASSER if "check_sparte" in broken_rules else rng.choice((Sparte.STROM, Sparte.GAS)),
+            ),
+            zaehler=_construct(
+                Zaehler,
+                zaehlernummer=f"{' ' if 'check_zaehlernummer' in broken_rules else ''}{index}{random_digits(rng, 6)}",
+            ),
+        )
+
+
+GENERATORS: dict[str, type[DataSetGenerator]] = {
+    "customer": CustomerDataSetGenerator,
+    "network": NetworkDataSetGenerator,
+    "resource": ResourceDataSetGenerator,
+}
+"""The generators of the data set types (the same keys as the data set types of the `pvtool` command)"""
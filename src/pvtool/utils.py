@@ -2,20 +2,46 @@
 Contains utility functions to be used in the PV-Tool.
 """
 
-import inspect
-from typing import Optional
+import sys
 
 from bomf.config import MigrationConfig
 from pvframework import ValidationManager
 
-from .validation_manager import ValidationManagerWithConfig
+from .validation_manager import KeyDateContext, ValidationManagerWithConfig, active_manager
+
+
+def _validation_manager() -> ValidationManagerWithConfig:
+    """
+    Returns the ValidationManagerWithConfig which is currently executing the validator functions.
+    Raises a TypeError if the validator function is executed by a manager without MigrationConfig and a RuntimeError if
+    it isn't executed by a manager at all.
+    """
+    try:
+        return active_manager()
+    except LookupError as error:
+        # Plain pvframework managers don't register themselves as active manager. They are only looked up on this error
+        # path: The frame above the validator function (which called `migration_config` or `key_date_context`) is the
+        # `_execute_sync_validator` or `_execute_async_validator` method of the manager.
+        try:
+            executing_frame = sys._getframe(3)  # pylint: disable=protected-access
+        except ValueError:  # the call stack is too short, i.e. there is no validator function
+            executing_frame = None
+        if executing_frame is not None and isinstance(executing_frame.f_locals.get("self"), ValidationManager):
+            raise TypeError(
+                "You can call this function only on ValidationManagerWithConfig, not on ValidationManager"
+            ) from error
+        raise RuntimeError(
+            "You can call this function only from inside a function "
+            "which is executed by a ValidationManagerWithConfig"
+        ) from error
 
 
 def migration_config() -> MigrationConfig:
     """
-    This function can only be used inside validator functions and will only work if the function is executed by the
-    validation framework. If you run the validator function "by yourself" or use this function elsewhere it will
-    raise a RuntimeError.
+    This function can only be used inside validator functions and will only work if the function is executed by a
+    `ValidationManagerWithConfig`. If you run the validator function "by yourself" or use this function elsewhere it
+    will raise a RuntimeError. If the validator function is executed by a manager without MigrationConfig, it raises a
+    TypeError.
     When using inside a validator function, this function returns the MigrationConfig object.
     E.g.:
     ```
@@ -23,29 +49,22 @@ def migration_config() -> MigrationConfig:
         config = migration_config()
         assert config.migration_key_date >= datetime_inst
     ```
+    The lookup is a simple context variable access, so it is cheap enough to be called on every validator execution.
     """
-    call_stack = inspect.stack()
-    # call_stack[0] -> this function
-    # call_stack[1] -> must be the validator function
-    # call_stack[2] -> should be either `_execute_sync_validator` or `_execute_async_validator`
-    validation_manager: Optional[ValidationManagerWithConfig] = None
-    try:
-        validation_manager = call_stack[2].frame.f_locals["self"]
-        if not isinstance(validation_manager, ValidationManagerWithConfig):
-            if isinstance(validation_manager, ValidationManager):
-                raise TypeError(
-                    "You can call this function only on ValidationManagerWithConfig, not on ValidationManager"
-                )
-            validation_manager = None
-    except KeyError:
-        pass
-
-    if validation_manager is None:
-        raise RuntimeError(
-            "You can call this function only directly from inside a function "
-            "which is executed by the validation framework"
-        )
-
-    config: MigrationConfig = validation_manager.config
+    config: MigrationConfig = _validation_manager().config
     assert isinstance(config, MigrationConfig), "This shouldn't happen"
     return config
+
+
+def key_date_context() -> KeyDateContext:
+    """
+    Like `migration_config` this function can only be used inside validator functions executed by a
+    `ValidationManagerWithConfig`. It returns the values derived from the migration key date which are precomputed
+    once per manager. E.g.:
+    ```
+    def validate_date(date_inst: datetime):
+        if date_inst.date() > key_date_context().migration_key_date_berlin:
+            raise ValueError("date must not be after the migration key date")
+    ```
+    """
+    return _validation_manager().key_date_context
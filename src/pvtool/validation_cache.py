@@ -0,0 +1,328 @@
+"""
+Contains a memoization layer for validations of single values which are expensive and occur very often, e.g. the
+validation of IBANs and BICs using schwifty or of the domains of e-mail addresses using email_validator.
+Validator functions which only depend on their arguments can be memoized as a whole by marking them as `pure`.
+"""
+
+import copy
+import functools
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Generic, Hashable, NamedTuple, NoReturn, Optional, TypeVar
+
+import email_validator
+from email_validator.syntax import DomainNameValidationResult, validate_email_domain_name
+from schwifty import BIC, IBAN
+from schwifty.common import clean
+
+from .validation_manager import ErrorIdentifier, current_param_ids, error_identifier, set_error_identifier
+
+ResultT = TypeVar("ResultT")
+ValidatorFunctionT = TypeVar("ValidatorFunctionT", bound=Callable[..., None])
+
+
+class CacheInfo(NamedTuple):
+    """
+    The statistics of a ValidationCache (analogous to `functools.lru_cache`)
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ValidationCache(Generic[ResultT]):
+    """
+    A bounded, thread-safe LRU cache for a validation function which takes a single string and raises an exception if
+    the value is invalid. The cache is keyed by the normalized value. Both, the results of valid values and the raised
+    exceptions are cached.
+    A cached exception is re-raised as copy which carries the identifier of the location where it was raised
+    originally (see `_CachedError`). Thus, the error message and the error ID generated by a PVToolValidationManager
+    are the same as without the cache.
+    The `normalize` function must not change the outcome of `validate`, i.e. `validate(value)` and
+    `validate(normalize(value))` must behave the same for every value.
+    """
+
+    def __init__(self, validate: Callable[[str], ResultT], normalize: Callable[[str], str], maxsize: int):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        self._validate = validate
+        self._normalize = normalize
+        self.maxsize = maxsize
+        self._cache: OrderedDict[str, tuple[Optional[ResultT], Optional[_CachedError]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def validate(self, value: str) -> ResultT:
+        """
+        Validates the value and returns the (cached) result of the validation function. Raises the (cached) exception if
+        the value is invalid.
+        """
+        if not isinstance(value, str):
+            # the normalization could fail on other types, let the validation function raise the appropriate error
+            return self._validate(value)
+        key = self._normalize(value)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+        if cached is None:
+            try:
+                result = self._validate(key)
+            except Exception as error:
+                self._add(key, (None, _CachedError.of(error)))
+                raise
+            self._add(key, (result, None))
+            return result
+        cached_result, cached_error = cached
+        if cached_error is not None:
+            cached_error.raise_copy()
+        return cached_result  # type:ignore[return-value]
+
+    def _add(self, key: str, cached: tuple[Optional[ResultT], Optional["_CachedError"]]) -> None:
+        with self._lock:
+            self._cache[key] = cached
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Returns the number of hits and misses and the current size of the cache.
+        """
+        with self._lock:
+            return CacheInfo(hits=self._hits, misses=self._misses, maxsize=self.maxsize, currsize=len(self._cache))
+
+    def cache_clear(self) -> None:
+        """
+        Removes all entries from the cache and resets the statistics.
+        """
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+def _without_traceback(error: BaseException) -> BaseException:
+    """
+    Returns a copy of the exception (and of its cause and context) without the traceback.
+    """
+    error_copy = copy.copy(error)
+    if error.__cause__ is not None:
+        error_copy.__cause__ = _without_traceback(error.__cause__)
+    if error.__context__ is not None:
+        error_copy.__context__ = _without_traceback(error.__context__)
+    error_copy.__suppress_context__ = error.__suppress_context__
+    return error_copy.with_traceback(None)
+
+
+class _CachedError(NamedTuple):
+    """
+    An exception cached by a ValidationCache or PureValidatorCache. The traceback is not kept: through the frames
+    (`f_back`) it would keep everything alive which was on the stack when the exception was raised, e.g. the validating
+    manager. Only the identifier of the location where the exception was raised is kept (see `error_identifier`).
+    """
+
+    error: BaseException
+    identifier: ErrorIdentifier
+
+    @classmethod
+    def of(cls, error: Exception) -> "_CachedError":
+        """
+        Returns the exception to be cached.
+        """
+        return cls(_without_traceback(error), error_identifier(error))
+
+    def raise_copy(self, args: Optional[tuple[Any, ...]] = None) -> NoReturn:
+        """
+        Raises a copy of the cached exception (optionally with other args) which carries the identifier of the original
+        exception. Thus, a PVToolValidationManager derives the same error ID from it. The cached exception itself is
+        never raised because raising it would set its traceback (possibly from several threads at once).
+        """
+        error_copy = _without_traceback(self.error)
+        if args is not None:
+            error_copy.args = args
+        assert isinstance(error_copy, Exception)  # only instances of Exception are cached
+        set_error_identifier(error_copy, self.identifier)
+        raise error_copy
+
+
+class PureValidatorCache:
+    """
+    A bounded, thread-safe LRU cache for a pure validator function, i.e. a function whose outcome depends on its
+    arguments only. The cache is keyed by the arguments (including their types). Both, passing arguments and the
+    raised exceptions are cached. Calls with unhashable arguments are not cached.
+    The messages of the errors usually contain the IDs of the parameters (via `pvframework.utils.param`), which differ
+    between the mapped validators of the same function. That's why the parameter IDs of the failed call are cached
+    with the exception. If a cached exception is raised for other parameter IDs, they are replaced in the string
+    arguments of the copy. The copy carries the identifier of the original exception, i.e. the error ID is the same as
+    without the cache.
+    Errors raised outside a validation (where the parameter IDs are unknown) are not cached.
+    """
+
+    def __init__(self, validator_function: Callable[..., None], maxsize: int):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        self._validator_function = validator_function
+        self.maxsize = maxsize
+        self._cache: OrderedDict[Hashable, Optional[tuple[_CachedError, dict[str, str]]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __call__(self, *args: Any, **kwargs: Any) -> None:
+        key = (
+            args,
+            tuple(kwargs.items()),
+            tuple(type(arg) for arg in args),
+            tuple(type(value) for value in kwargs.values()),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            self._validator_function(*args, **kwargs)
+            return
+        with self._lock:
+            is_hit = key in self._cache
+            if is_hit:
+                cached = self._cache[key]
+                self._cache.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+        if is_hit:
+            if cached is not None:
+                _raise_with_param_ids(*cached)
+            return
+        try:
+            self._validator_function(*args, **kwargs)
+        except Exception as error:
+            param_ids = _current_param_ids_or_none()
+            if param_ids is not None:
+                self._add(key, (_CachedError.of(error), param_ids))
+            raise
+        self._add(key, None)
+
+    def _add(self, key: Hashable, cached: Optional[tuple[_CachedError, dict[str, str]]]) -> None:
+        with self._lock:
+            self._cache[key] = cached
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Returns the number of hits and misses and the current size of the cache.
+        """
+        with self._lock:
+            return CacheInfo(hits=self._hits, misses=self._misses, maxsize=self.maxsize, currsize=len(self._cache))
+
+    def cache_clear(self) -> None:
+        """
+        Removes all entries from the cache and resets the statistics.
+        """
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+def _raise_with_param_ids(cached_error: _CachedError, cached_param_ids: dict[str, str]) -> NoReturn:
+    """
+    Raises a copy of the cached exception whose string arguments refer to the parameter IDs of the current call.
+    """
+    param_ids = _current_param_ids_or_none()
+    if param_ids is None:
+        cached_error.raise_copy()
+    replacements = [
+        (cached_param_id, param_ids[param_name])
+        for param_name, cached_param_id in cached_param_ids.items()
+        if param_ids.get(param_name, cached_param_id) != cached_param_id
+    ]
+    if not replacements:
+        cached_error.raise_copy()
+    # replace the longest IDs first since an ID may be the prefix of another one
+    replacements.sort(key=lambda replacement: len(replacement[0]), reverse=True)
+    cached_error.raise_copy(
+        tuple(_replace_all(arg, replacements) if isinstance(arg, str) else arg for arg in cached_error.error.args)
+    )
+
+
+def _current_param_ids_or_none() -> Optional[dict[str, str]]:
+    try:
+        return current_param_ids()
+    except LookupError:
+        return None
+
+
+def _replace_all(string: str, replacements: list[tuple[str, str]]) -> str:
+    for old, new in replacements:
+        string = string.replace(old, new)
+    return string
+
+
+def pure(maxsize: int = 2**12) -> Callable[[ValidatorFunctionT], ValidatorFunctionT]:
+    """
+    Marks a synchronous validator function as pure, i.e. its outcome depends on its arguments only (no `param` value
+    besides the parameter IDs in error messages, no migration config, no other state). The results of the function
+    are memoized in a `PureValidatorCache` with at most `maxsize` entries. This pays off for values which repeat
+    across data sets like postal codes or OBIS codes. The cache is available as `cache` attribute of the returned
+    function. E.g.:
+    ```
+    @pure(maxsize=2**10)
+    def check_postleitzahl(postleitzahl: str):
+        ...
+    ```
+    """
+
+    def decorator(validator_function: ValidatorFunctionT) -> ValidatorFunctionT:
+        cache = PureValidatorCache(validator_function, maxsize)
+
+        @functools.wraps(validator_function)
+        def memoized_validator_function(*args: Any, **kwargs: Any) -> None:
+            cache(*args, **kwargs)
+
+        memoized_validator_function.cache = cache  # type:ignore[attr-defined]
+        return memoized_validator_function  # type:ignore[return-value]
+
+    return decorator
+
+
+def is_pure(validator_function: Callable[..., Any]) -> bool:
+    """
+    Returns True if the validator function is marked as `pure`.
+    """
+    return isinstance(getattr(validator_function, "cache", None), PureValidatorCache)
+
+
+def _validate_iban(iban: str) -> None:
+    IBAN(iban).validate()
+
+
+def _validate_bic(bic: str) -> None:
+    BIC(bic).validate()
+
+
+# schwifty removes all whitespaces and converts the value to upper case before doing anything else
+iban_validation_cache = ValidationCache(_validate_iban, clean, maxsize=2**16)
+"""Caches the results of the IBAN validation"""
+bic_validation_cache = ValidationCache(_validate_bic, clean, maxsize=2**12)
+"""Caches the results of the BIC validation"""
+
+
+def _validate_e_mail_domain(domain: str) -> DomainNameValidationResult:
+    # use the same settings as `email_validator.validate_email`
+    return validate_email_domain_name(
+        domain,
+        test_environment=email_validator.TEST_ENVIRONMENT,
+        globally_deliverable=email_validator.GLOBALLY_DELIVERABLE,
+    )
+
+
+e_mail_domain_validation_cache = ValidationCache(_validate_e_mail_domain, str, maxsize=2**12)
+"""Caches the results of the validation of the part after the @-sign of e-mail addresses"""
@@ -2,18 +2,576 @@
 This module contains the ValidationManager classes used throughout the PV-Tool.
 """
 
+import asyncio
+import logging
+import threading
+from collections import defaultdict
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from graphlib import TopologicalSorter
+from itertools import takewhile
+from typing import AbstractSet, Any, AsyncGenerator, AsyncIterable, Callable, Hashable, Iterable, Optional, TypeVar
+
 from bomf.config import MigrationConfig
-from injector import inject
-from pvframework import ValidationManager
-from pvframework.types import DataSetT
+from dateutil.relativedelta import relativedelta
+from injector import Module, inject
+from pvframework import ValidationManager, ValidationResult
+from pvframework.errors import ErrorHandler, ValidationError, ValidationMode, _get_error_id, _get_identifier
+from pvframework.execution import _ExecutionState, _RuntimeExecutionInfo, _RuntimeTaskInfo
+from pvframework.types import DataSetT, MappedValidatorSyncAsync, SyncValidatorFunction
+from pvframework.validator import MappedValidator, is_async
+from pytz import timezone
+
+from .batch import BatchValidation
+from .columnar import find_passing_validators
+from .fail_fast import FailFast, cost_order
+from .field_access import FieldAccessPlan
+from .instrumentation import ValidatorInstrumentation, active_instrumentation
+from .query_plan import QueryPlan
+from .streaming import ErrorStream
+
+_berlin = timezone("Europe/Berlin")
+
+
+@dataclass
+class _ValidationState:
+    """
+    The state of the validation of a single data set by a PVToolValidationManager.
+    """
+
+    manager: "PVToolValidationManager"
+    runtime_execution_info: _RuntimeExecutionInfo
+    error_stream: Optional[ErrorStream] = None
+    """The stream to publish the errors to, see `PVToolValidationManager.iter_errors`"""
+    instrumentation: Optional[ValidatorInstrumentation] = None
+    """Measures the execution of the validators, see `pvtool.instrumentation`"""
+
+
+_validation_state: ContextVar[Optional[_ValidationState]] = ContextVar("pvtool_validation_state", default=None)
+"""
+Holds the state of the validation which is currently running in this context. Since asyncio tasks copy the context on
+creation, validators executed in separate tasks still see the validation which started them. The state is reset when
+the validation of the data set has finished.
+"""
+
+
+ErrorIdentifier = tuple[str, str, int]
+"""
+The location where an error was raised, i.e. the file name, the function name and the line within the function. The
+pvframework derives the error ID from it (see `pvframework.errors._get_identifier`).
+"""
+
+_ERROR_IDENTIFIER_ATTRIBUTE = "__pvtool_error_identifier__"
+
+
+def error_identifier(error: Exception) -> ErrorIdentifier:
+    """
+    Returns the identifier from which the error ID of the error is derived. It is the location where the error was
+    raised unless another identifier was assigned by `set_error_identifier`.
+    """
+    identifier: Optional[ErrorIdentifier] = getattr(error, _ERROR_IDENTIFIER_ATTRIBUTE, None)
+    return identifier if identifier is not None else _get_identifier(error)
+
+
+def set_error_identifier(error: Exception, identifier: ErrorIdentifier) -> None:
+    """
+    Assigns the identifier from which a PVToolValidationManager derives the error ID of the error, e.g. the identifier
+    of the original error if the error is a copy re-raised from a cache (see `pvtool.validation_cache`).
+    """
+    setattr(error, _ERROR_IDENTIFIER_ATTRIBUTE, identifier)
 
 
-class ValidationManagerWithConfig(ValidationManager[DataSetT]):
+class _ErrorHandler(ErrorHandler[DataSetT]):
     """
-    This class extends the ValidationManager class from the bomf package by adding the MigrationConfig.
+    An ErrorHandler which derives the error IDs from `error_identifier` instead of the traceback of the errors.
+    """
+
+    async def catch(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        msg: str,
+        error: Exception,
+        mapped_validator: Any,
+        validation_manager: ValidationManager[DataSetT],
+        custom_error_id: Optional[int] = None,
+        mode: ValidationMode = ValidationMode.ERROR,
+    ):
+        if custom_error_id is None:
+            custom_error_id = _get_error_id(error_identifier(error))
+        await super().catch(msg, error, mapped_validator, validation_manager, custom_error_id, mode)
+
+
+@dataclass(frozen=True)
+class KeyDateContext:
+    """
+    Contains the values derived from the migration key date which are needed by the validators. They are constant
+    during a migration and thus computed only once.
+    """
+
+    migration_key_date: datetime
+    """The migration key date as provided by the MigrationConfig"""
+    migration_key_date_utc: datetime
+    """The migration key date converted to UTC"""
+    migration_key_date_berlin: date
+    """The (local) date of the migration key date in Germany"""
+    migration_key_date_iso: str
+    """The migration key date in ISO format as used in error messages"""
+    latest_adult_birthday: date
+    """The latest birthday of a person which is of full age (18 years) as of the migration key date"""
+
+    @classmethod
+    def from_config(cls, config: MigrationConfig) -> "KeyDateContext":
+        """
+        Derives all values from the migration key date of the given MigrationConfig.
+        """
+        migration_key_date_berlin = config.migration_key_date.astimezone(_berlin).date()
+        return cls(
+            migration_key_date=config.migration_key_date,
+            migration_key_date_utc=config.migration_key_date.astimezone(UTC),
+            migration_key_date_berlin=migration_key_date_berlin,
+            migration_key_date_iso=config.migration_key_date.isoformat(),
+            # Had to use dateutil here, because I didn't want to manually catch the case if somebody was born on 29th
+            # February. stdlib timedelta doesn't support years as kwarg.
+            latest_adult_birthday=migration_key_date_berlin - relativedelta(years=18),
+        )
+
+
+@dataclass(frozen=True)
+class RuleGroup:
+    """
+    A group of registered validators which are checked for a data set in a single pass. `passes` returns True only if
+    all validators of the group pass for the data set without any error (including the parameter provision and type
+    checks of the pvframework). Then, they are not executed. Otherwise, they are executed one by one as usual. Thus,
+    `passes` may be conservative, e.g. return False for all unusual data, and the errors are always the same.
+    `passes` is called while the manager is active, i.e. it can use `pvtool.utils.key_date_context` and alike.
+    """
+
+    name: str
+    mapped_validators: frozenset[MappedValidatorSyncAsync]
+    passes: Callable[[Any], bool]
+
+
+class PVToolValidationManager(ValidationManager[DataSetT]):  # pylint: disable=too-many-instance-attributes
+    """
+    This class extends the ValidationManager class from the pvframework package. It is the base of all
+    ValidationManagers provided by the PV-Tool.
+    - The runtime information of a validation is stored in a context variable instead of the instance. Thus, the same
+      manager can validate several data sets concurrently in different asyncio tasks.
+    - The execution order of the validators is computed once after registration instead of once per data set.
+    - The attribute paths of all PlannedPathMappedValidators are compiled into a `FieldAccessPlan`. Thus, common
+      prefixes are resolved once per data set instead of once per validator.
+    - The queries of all QueryMappedValidators are planned in a `QueryPlan`. Thus, subqueries shared by several
+      `PlannedQuery`s are evaluated once per data set.
+    - Registered validators can be fused to a `RuleGroup` which checks them in a single pass.
+    - The execution of each validator can be measured by a `ValidatorInstrumentation` (see `pvtool.instrumentation`).
+    - `validate_many` validates a stream of data sets with bounded concurrency.
+    - `iter_errors` streams the errors of the data sets as soon as each validator completes.
+    - In the fail-fast mode (see `fail_fast`), the validation of a data set stops after the first error.
+    - `validate_columnar` validates a batch of data sets using the columnar engine for simple per-field rules.
+    """
+
+    def __init__(self, logger: Optional[logging.Logger] = None, manager_id: Optional[str] = None):
+        self._execution_order: Optional[list[MappedValidatorSyncAsync]] = None
+        self._skipped_validators: frozenset[MappedValidatorSyncAsync] = frozenset()
+        self._fail_fast: Optional[FailFast] = None
+        self._has_async_validators = False
+        self._field_access_plan = FieldAccessPlan([])
+        self._query_plan = QueryPlan([])
+        self.rule_groups: list[RuleGroup] = []
+        super().__init__(logger=logger, manager_id=manager_id)
+
+    @property
+    def _runtime_execution_info(self) -> Optional[_RuntimeExecutionInfo]:
+        validation_state = _validation_state.get()
+        if validation_state is None or validation_state.manager is not self:
+            return None
+        return validation_state.runtime_execution_info
+
+    @_runtime_execution_info.setter
+    def _runtime_execution_info(self, runtime_execution_info: Optional[_RuntimeExecutionInfo]):
+        # The pvframework initializes it with None. The runtime information is only set by `_validate_data_set`.
+        if runtime_execution_info is not None:
+            raise AttributeError("The runtime information is set per validation by _validate_data_set")
+
+    @property
+    def _state(self) -> _ValidationState:
+        validation_state = _validation_state.get()
+        assert validation_state is not None and validation_state.manager is self
+        return validation_state
+
+    def register(
+        self,
+        mapped_validator: MappedValidatorSyncAsync,
+        depends_on: Optional[set[MappedValidatorSyncAsync]] = None,
+        timeout: Optional[timedelta] = None,
+        mode: ValidationMode = ValidationMode.ERROR,
+    ):
+        super().register(mapped_validator, depends_on=depends_on, timeout=timeout, mode=mode)
+        self._execution_order = None
+
+    def register_rule_group(self, rule_group: "RuleGroup") -> None:
+        """
+        Registers a rule group. Its validators have to be registered already.
+        """
+        if not rule_group.mapped_validators <= self.validators.keys():
+            raise ValueError(f"The validators of the rule group {rule_group.name} are not registered")
+        self.rule_groups.append(rule_group)
+
+    @property
+    def fail_fast(self) -> Optional[FailFast]:
+        """
+        If set, the validators are executed in the order of their cost and the validation of a data set stops after
+        the first error (see `pvtool.fail_fast`). The result only contains the errors of the first failed validator.
+        Note that the managers of the providers are cached per fail-fast mode, i.e. set it by the provider (e.g.
+        `ValidationManagerProviderCustomer(fail_fast=FailFast())`) instead of on a provided manager.
+        """
+        return self._fail_fast
+
+    @fail_fast.setter
+    def fail_fast(self, fail_fast: Optional[FailFast]) -> None:
+        self._fail_fast = fail_fast
+        self._execution_order = None
+
+    @property
+    def execution_order(self) -> list[MappedValidatorSyncAsync]:
+        """
+        The order in which the registered validators are executed. Dependencies come before their dependents.
+        In the fail-fast mode, the validators are ordered by their cost and the skipped warnings are left out.
+        """
+        if self._execution_order is None:
+            dependencies = {mapped_validator: info.depends_on for mapped_validator, info in self.validators.items()}
+            if self._fail_fast is None:
+                self._execution_order = list(TopologicalSorter(dependencies).static_order())
+                self._skipped_validators = frozenset()
+            else:
+                self._skipped_validators = frozenset(
+                    mapped_validator
+                    for mapped_validator, info in self.validators.items()
+                    if self._fail_fast.skip_warnings and info.mode == ValidationMode.WARNING
+                )
+                self._execution_order = [
+                    mapped_validator
+                    for mapped_validator in cost_order(dependencies)
+                    if mapped_validator not in self._skipped_validators
+                ]
+            self._has_async_validators = any(is_async(mapped_validator) for mapped_validator in self.validators)
+            self._field_access_plan = FieldAccessPlan.of_mapped_validators(self.validators)
+            self._query_plan = QueryPlan.of_mapped_validators(self.validators)
+        return self._execution_order
+
+    @property
+    def field_access_plan(self) -> FieldAccessPlan:
+        """
+        The access plan of the attribute paths of all registered PlannedPathMappedValidators.
+        """
+        _ = self.execution_order  # compiles the plan if validators were registered since
+        return self._field_access_plan
+
+    @property
+    def query_plan(self) -> QueryPlan:
+        """
+        The plan of the queries of all registered QueryMappedValidators.
+        """
+        _ = self.execution_order  # compiles the plan if validators were registered since
+        return self._query_plan
+
+    async def _validate_data_set(
+        self,
+        data_set: DataSetT,
+        passing_validators: AbstractSet[MappedValidatorSyncAsync] = frozenset(),
+        error_stream: Optional[ErrorStream] = None,
+    ) -> ErrorHandler[DataSetT]:
+        """
+        Validates a single data set onto the registered validators and returns the error handler holding the errors.
+        The `passing_validators` are known to pass for this data set (see `validate_columnar`) and are not executed.
+        The same applies to the validators of the rule groups which pass for the data set (see `register_rule_group`).
+        In the fail-fast mode, the validation stops after the first validator which raised an error.
+        The errors are published to the `error_stream` if given (see `iter_errors`).
+        While validating, the state of the validation is published in the current context s.t. validator functions
+        can access the manager cheaply (see `current_param_ids` and `pvtool.utils.migration_config`).
+        """
+        try:
+            hash(data_set)
+        except TypeError as error:
+            raise TypeError(
+                f"The data set {data_set} is not hashable. This is required for the error handler."
+            ) from error
+        execution_order = self.execution_order
+        runtime_execution_info = _RuntimeExecutionInfo(
+            data_set=data_set,
+            error_handler=_ErrorHandler(data_set, self._logger),
+            states=defaultdict(lambda: _ExecutionState.PENDING),
+            tasks=defaultdict(lambda: None),
+            running_tasks=defaultdict(
+                lambda: _RuntimeTaskInfo(current_mapped_validator=None, current_provided_params=None)
+            ),
+        )
+        for mapped_validator in self._skipped_validators:
+            runtime_execution_info.states[mapped_validator] = _ExecutionState.FINISHED
+        token = _validation_state.set(
+            _ValidationState(
+                self, runtime_execution_info, error_stream=error_stream, instrumentation=active_instrumentation()
+            )
+        )
+        try:
+            for rule_group in self.rule_groups:
+                if rule_group.passes(data_set):
+                    passing_validators = passing_validators | rule_group.mapped_validators
+            if len(passing_validators) > 0:
+                for mapped_validator in passing_validators:
+                    self.info.states[mapped_validator] = _ExecutionState.FINISHED
+                execution_order = [
+                    mapped_validator
+                    for mapped_validator in execution_order
+                    if mapped_validator not in passing_validators
+                ]
+            validators: Iterable[MappedValidatorSyncAsync] = execution_order
+            if self._fail_fast is not None:
+                # no further validator is started after the first error (running async validators are finished)
+                error_excs = self.info.error_handler.error_excs
+                validators = takewhile(lambda _: not error_excs, validators)
+            with self._query_plan.materialize(), self._field_access_plan.resolved(data_set):
+                if self._has_async_validators:
+                    async with asyncio.TaskGroup() as task_group:
+                        await self._execute_validators(iter(validators), task_group=task_group)
+                else:
+                    await self._execute_validators(iter(validators))
+        finally:
+            _validation_state.reset(token)
+        return runtime_execution_info.error_handler
+
+    async def _execute_sync_validator(self, mapped_validator: MappedValidator[DataSetT, SyncValidatorFunction]):
+        """
+        Executes the validator like the pvframework does. The execution is measured if an instrumentation is enabled.
+        The errors are published if they are streamed (see `iter_errors`).
+        """
+        instrumentation = self._state.instrumentation
+        if instrumentation is None:
+            await super()._execute_sync_validator(mapped_validator)
+        else:
+            with instrumentation.measure(mapped_validator, self.info.error_handler):
+                await super()._execute_sync_validator(mapped_validator)
+        await self._publish_errors(mapped_validator)
+
+    async def _execute_async_validator(
+        self,
+        mapped_validator: MappedValidatorSyncAsync,
+        running_dependencies: set[MappedValidatorSyncAsync],
+    ):
+        """
+        Executes the validator like the pvframework does. The execution is measured if an instrumentation is enabled.
+        The errors are published if they are streamed (see `iter_errors`).
+        """
+        instrumentation = self._state.instrumentation
+        if instrumentation is None:
+            await super()._execute_async_validator(mapped_validator, running_dependencies)
+        else:
+            with instrumentation.measure(mapped_validator, self.info.error_handler):
+                await super()._execute_async_validator(mapped_validator, running_dependencies)
+        await self._publish_errors(mapped_validator)
+
+    async def _publish_errors(self, mapped_validator: MappedValidatorSyncAsync) -> None:
+        """
+        Hands the errors of the executed validator over to the consumer of the error stream (if any) and waits until
+        they are consumed.
+        """
+        error_stream = self._state.error_stream
+        if error_stream is None:
+            return
+        mode = self.validators[mapped_validator].mode
+        if mode not in error_stream.modes:
+            return
+        error_handler = self.info.error_handler
+        validation_errors = (
+            error_handler.error_excs if mode == ValidationMode.ERROR else error_handler.warning_excs
+        ).get(mapped_validator)
+        if validation_errors:
+            await error_stream.publish(validation_errors)
+
+    async def validate(self, *data_sets: DataSetT, log_summary: bool = False) -> ValidationResult[DataSetT]:
+        """
+        Validates each of the provided data set instances onto the registered validators.
+        Any errors occurring during validation will be collected the validation process will not be cancelled.
+        The returned `ValidationSummary` object supports several analytical methods - most importantly the property
+        `succeeded_data_sets` to retrieve the positively validated data sets (without errors).
+        """
+        error_handlers: dict[DataSetT, ErrorHandler[DataSetT]] = {}
+        for data_set in data_sets:
+            error_handlers[data_set] = await self._validate_data_set(data_set)
+        return self._validation_result(error_handlers, log_summary)
+
+    async def validate_columnar(self, *data_sets: DataSetT, log_summary: bool = False) -> ValidationResult[DataSetT]:
+        """
+        Validates the data sets like `validate` does and returns the same result. But the validators which have a
+        column rule (see `pvtool.columnar`) are evaluated for all data sets at once and are only executed for the
+        data sets whose values are not known to be valid. This is much faster for large batches (e.g. 1000 data sets)
+        of mostly valid data.
+        """
+        error_handlers: dict[DataSetT, ErrorHandler[DataSetT]] = {}
+        for data_set, passing_validators in zip(data_sets, find_passing_validators(self, data_sets)):
+            error_handlers[data_set] = await self._validate_data_set(data_set, passing_validators)
+        return self._validation_result(error_handlers, log_summary)
+
+    async def iter_errors(
+        self, *data_sets: DataSetT, modes: AbstractSet[ValidationMode] = frozenset(ValidationMode)
+    ) -> AsyncGenerator[ValidationError, None]:
+        """
+        Validates the data sets one after another like `validate` does, but yields the errors of each validator as soon
+        as it completes instead of a result after all validators. Only errors of validators registered with one of the
+        `modes` are yielded (use `self.validators[validation_error.mapped_validator].mode` to distinguish them).
+        The remaining validators are only executed if the consumer asks for the next error. I.e. if it stops iterating,
+        e.g. at the first error in `ValidationMode.ERROR`, the validation is cancelled:
+        ```
+        async with aclosing(validation_manager.iter_errors(data_set, modes={ValidationMode.ERROR})) as errors:
+            is_valid = await anext(errors, None) is None
+        ```
+        """
+        for data_set in data_sets:
+            error_stream = ErrorStream(modes)
+            task = asyncio.create_task(self._validate_data_set_into(data_set, error_stream))
+            try:
+                async for validation_error in error_stream:
+                    yield validation_error
+                await task
+            finally:
+                task.cancel()
+
+    async def _validate_data_set_into(self, data_set: DataSetT, error_stream: ErrorStream) -> None:
+        """
+        Validates the data set and publishes its errors to the error stream. Is executed in a separate task s.t. the
+        consumer can interleave with the validation.
+        """
+        try:
+            await self._validate_data_set(data_set, error_stream=error_stream)
+        finally:
+            error_stream.close()
+
+    def _validation_result(
+        self, error_handlers: dict[DataSetT, ErrorHandler[DataSetT]], log_summary: bool
+    ) -> ValidationResult[DataSetT]:
+        validation_result = ValidationResult(self, error_handlers)
+        if log_summary:
+            self._logger.info(
+                "Validation Summary: %i succeeded, %i failed, %i errors. %s",
+                validation_result.num_succeeds,
+                validation_result.num_fails,
+                validation_result.num_errors_total,
+                str(validation_result.num_errors_per_id),
+            )
+        return validation_result
+
+    def validate_many(
+        self, data_sets: Iterable[DataSetT] | AsyncIterable[DataSetT], *, concurrency: int = 100
+    ) -> BatchValidation[DataSetT]:
+        """
+        Validates a (possibly asynchronous and unbounded) stream of data sets. Iterate asynchronously over the returned
+        `BatchValidation` to get a `ValidationResult` for each data set as soon as it is validated. The data sets are
+        consumed lazily and at most `concurrency` of them are validated at the same time. The counts of all results
+        are aggregated in `BatchValidation.summary`.
+        """
+        return BatchValidation(self, data_sets, concurrency)
+
+
+class ValidationManagerWithConfig(PVToolValidationManager[DataSetT]):
+    """
+    This class extends the PVToolValidationManager class by adding the MigrationConfig.
+    The values derived from the migration key date are precomputed once in `key_date_context`.
     """
 
     @inject
     def __init__(self, config: MigrationConfig, **kwargs):
         super().__init__(**kwargs)
         self.config = config
+        self.key_date_context = KeyDateContext.from_config(config)
+
+
+def active_manager() -> ValidationManagerWithConfig:
+    """
+    Returns the ValidationManagerWithConfig which is currently validating in this context.
+    Raises a LookupError if no PVToolValidationManager is validating and a TypeError if the validating manager has no
+    MigrationConfig.
+    """
+    validation_state = _validation_state.get()
+    if validation_state is None:
+        raise LookupError("No PVToolValidationManager is validating in this context")
+    validation_manager = validation_state.manager
+    if not isinstance(validation_manager, ValidationManagerWithConfig):
+        raise TypeError(
+            "You can call this function only on ValidationManagerWithConfig, not on ValidationManager "
+            f"(the active manager {validation_manager.manager_id} has no MigrationConfig)"
+        )
+    return validation_manager
+
+
+def current_param_ids() -> dict[str, str]:
+    """
+    Returns the IDs (i.e. the attribute paths) of the parameters provided to the currently executed validator function
+    by name. In contrast to `pvframework.utils.param` it doesn't inspect the call stack, but it only works inside
+    validator functions executed by a PVToolValidationManager. Raises a LookupError otherwise.
+    """
+    validation_state = _validation_state.get()
+    if validation_state is None:
+        raise LookupError("No PVToolValidationManager is validating in this context")
+    provided_params = validation_state.runtime_execution_info.current_provided_params
+    if provided_params is None:
+        raise LookupError("No validator function is executed in this context")
+    return {param_name: parameter.param_id for param_name, parameter in provided_params.items()}
+
+
+ManagerT = TypeVar("ManagerT", bound=PVToolValidationManager)
+
+_manager_cache: dict[tuple[Hashable, ...], PVToolValidationManager] = {}
+_manager_cache_lock = threading.Lock()
+
+
+def config_cache_key(config: MigrationConfig) -> str:
+    """
+    Returns a hashable representation of the MigrationConfig which is equal for equal configs.
+    """
+    return config.model_dump_json()
+
+
+def cached_validation_manager(key: tuple[Hashable, ...], build_manager: Callable[[], ManagerT]) -> ManagerT:
+    """
+    Returns the cached ValidationManager for the given key. If there is none yet, it will be built by `build_manager`
+    and cached. The key should contain everything the manager depends on, e.g. the data set type and the
+    MigrationConfig (use `config_cache_key`).
+    Since the runtime information of a validation is stored per context, a cached manager can be shared safely.
+    But don't register further validators on a cached manager, as this would affect all its users.
+    """
+    with _manager_cache_lock:
+        if key not in _manager_cache:
+            _manager_cache[key] = build_manager()
+        validation_manager = _manager_cache[key]
+    return validation_manager  # type:ignore[return-value]
+
+
+class ValidationManagerProvider(Module):
+    """
+    The base of the modules providing the ValidationManagers of the PV-Tool. If `fail_fast` is given, the provided
+    managers validate in the fail-fast mode (see `PVToolValidationManager.fail_fast`). The managers are cached per
+    fail-fast mode.
+    """
+
+    def __init__(self, fail_fast: Optional[FailFast] = None):
+        self.fail_fast = fail_fast
+
+    def _cached_validation_manager(self, key: tuple[Hashable, ...], build_manager: Callable[[], ManagerT]) -> ManagerT:
+        """
+        Like `cached_validation_manager`, but the built manager validates in the fail-fast mode of this provider.
+        """
+
+        def _build_manager() -> ManagerT:
+            validation_manager = build_manager()
+            validation_manager.fail_fast = self.fail_fast
+            return validation_manager
+
+        return cached_validation_manager((*key, self.fail_fast), _build_manager)
+
+
+def clear_validation_manager_cache() -> None:
+    """
+    Removes all cached ValidationManagers.
+    """
+    with _manager_cache_lock:
+        _manager_cache.clear()
@@ -1,6 +1,14 @@
-from typing import TypeVar
+import asyncio
+from dataclasses import dataclass
+from typing import Any, TypeVar
 
-from pvframework.errors import ValidationError
+import pytest
+from ibims.bo4e import Marktlokation, Messlokation, Sparte, Vertrag, Zaehler
+from ibims.datasets import TripicaResourceLoaderDataSet
+from pvframework import PathMappedValidator, Validator
+from pvframework.errors import ValidationError, ValidationMode
+
+from pvtool import PVToolValidationManager
 
 SubT = TypeVar("SubT")
 BaseT = TypeVar("BaseT")
@@ -51,3 +59,95 @@ def assert_full_error_coverage(expected_errors: set[str], all_errors: set[Valida
             f"Expected errors not found: {expected_errors_not_found}\n"
             f"Actual errors not covered from expected list: {uncovered_actual_errors}"
         )
+
+
+def resource_data_set(index: int) -> TripicaResourceLoaderDataSet:
+    """
+    Returns a resource data set with valid and invalid values depending on the index. Some of the values have the wrong
+    type or are missing, i.e. the data set is constructed without validation.
+    """
+    marktlokations_ids: list[Any] = [f"{index:011d}", "123", 12345678901, None]
+    melo_ids: list[Any] = ["DE0123401234012340123401234012340", "DE01234", None]
+    zaehlernummern: list[Any] = [f"{index}hhjbd0", " 123", 123]
+    sparten: list[Any] = [Sparte.STROM, Sparte.GAS, Sparte.WASSER, "STROM"]
+    messlokation: Any = None
+    if index % 7:
+        messlokation = Messlokation.model_construct(messlokations_id=melo_ids[index % len(melo_ids)])  # type: ignore
+    return TripicaResourceLoaderDataSet.model_construct(
+        marktlokation=Marktlokation.model_construct(  # type: ignore[call-arg]
+            marktlokations_id=marktlokations_ids[index % len(marktlokations_ids)]
+        ),
+        messlokation=messlokation,
+        vertrag=Vertrag.model_construct(sparte=sparten[index % len(sparten)]),  # type: ignore[call-arg]
+        zaehler=Zaehler.model_construct(zaehlernummer=zaehlernummern[index % len(zaehlernummern)]),  # type: ignore
+    )
+
+
+@dataclass(frozen=True)
+class NumberDataSet:
+    """
+    A minimal data set to test the behaviour of the validation managers
+    """
+
+    number: int
+
+
+class NumberValidators:
+    """
+    The mapped validators of a `NumberDataSet`. The validator functions are created per instance and record their
+    names in `executed` when they are executed.
+    """
+
+    def __init__(self) -> None:
+        self.executed: list[str] = []
+        executed = self.executed
+
+        def check_positive(number: int):
+            executed.append("check_positive")
+            if number <= 0:
+                raise ValueError("number must be positive")
+
+        def check_even(number: int):
+            executed.append("check_even")
+            if number % 2 != 0:
+                raise ValueError("number should be even")
+
+        def check_small(number: int):
+            executed.append("check_small")
+            if number > 10:
+                raise ValueError("number must be small")
+
+        async def check_not_13(number: int):
+            await asyncio.sleep(0)
+            executed.append("check_not_13")
+            if number == 13:
+                raise ValueError("number must not be 13")
+
+        self.positive: PathMappedValidator[NumberDataSet, Any] = PathMappedValidator(
+            Validator(check_positive), {"number": "number"}
+        )
+        self.even: PathMappedValidator[NumberDataSet, Any] = PathMappedValidator(
+            Validator(check_even), {"number": "number"}
+        )
+        self.small: PathMappedValidator[NumberDataSet, Any] = PathMappedValidator(
+            Validator(check_small), {"number": "number"}
+        )
+        self.not_13: PathMappedValidator[NumberDataSet, Any] = PathMappedValidator(
+            Validator(check_not_13), {"number": "number"}
+        )
+
+
+@pytest.fixture
+def number_validators() -> NumberValidators:
+    return NumberValidators()
+
+
+@pytest.fixture
+def number_validation_manager(number_validators: NumberValidators) -> PVToolValidationManager[NumberDataSet]:
+    """
+    A manager validating `check_positive` and (as warning) `check_even` of the `number_validators`
+    """
+    manager = PVToolValidationManager[NumberDataSet]()
+    manager.register(number_validators.positive)
+    manager.register(number_validators.even, mode=ValidationMode.WARNING)
+    return manager
@@ -0,0 +1,106 @@
+import asyncio
+import json
+from dataclasses import dataclass
+from typing import AsyncIterator
+
+import pytest
+from pvframework import PathMappedValidator, Validator
+from pvframework.errors import ValidationMode
+
+from pvtool import BatchSummary, PVToolValidationManager
+
+
+@dataclass(frozen=True)
+class _DataSet:
+    number: int
+
+
+class _Counter:
+    in_flight = 0
+    max_in_flight = 0
+
+
+async def check_number(number: int):
+    _Counter.in_flight += 1
+    _Counter.max_in_flight = max(_Counter.max_in_flight, _Counter.in_flight)
+    await asyncio.sleep(0)
+    _Counter.in_flight -= 1
+    if number % 3 == 0:
+        raise ValueError("number must not be divisible by 3")
+
+
+def check_number_is_even(number: int):
+    if number % 2 == 1:
+        raise ValueError("number should be even")
+
+
+@pytest.fixture
+def validation_manager() -> PVToolValidationManager[_DataSet]:
+    _Counter.in_flight = 0
+    _Counter.max_in_flight = 0
+    manager = PVToolValidationManager[_DataSet]()
+    manager.register(PathMappedValidator(Validator(check_number), {"number": "number"}))
+    manager.register(
+        PathMappedValidator(Validator(check_number_is_even), {"number": "number"}), mode=ValidationMode.WARNING
+    )
+    return manager
+
+
+async def _async_data_sets(count: int) -> AsyncIterator[_DataSet]:
+    for number in range(1, count + 1):
+        await asyncio.sleep(0)
+        yield _DataSet(number=number)
+
+
+class TestValidateMany:
+    async def test_results_in_input_order(self, validation_manager: PVToolValidationManager[_DataSet]):
+        data_sets = [_DataSet(number=number) for number in range(1, 31)]
+        batch = validation_manager.validate_many(data_sets, concurrency=4)
+        validated_data_sets = [
+            data_set
+            async for validation_result in batch
+            for data_set in [*validation_result.succeeded_data_sets, *validation_result.data_set_errors]
+        ]
+        assert validated_data_sets == data_sets
+        assert _Counter.max_in_flight == 4
+
+    async def test_summary(self, validation_manager: PVToolValidationManager[_DataSet]):
+        summary = await validation_manager.validate_many(_async_data_sets(30), concurrency=8).run()
+        assert summary.total == 30
+        assert summary.num_fails == 10
+        assert summary.num_succeeds == 20
+        assert summary.num_errors_total == 10
+        assert summary.num_warnings == 15
+        assert summary.num_warnings_total == 15
+        assert sum(summary.num_errors_per_id.values()) == 10
+        assert sum(summary.num_warnings_per_id.values()) == 15
+
+    async def test_summary_equals_validate(self, validation_manager: PVToolValidationManager[_DataSet]):
+        data_sets = [_DataSet(number=number) for number in range(1, 31)]
+        expected_summary = BatchSummary()
+        expected_summary.add(await validation_manager.validate(*data_sets))
+        assert await validation_manager.validate_many(data_sets).run() == expected_summary
+
+    def test_invalid_concurrency(self, validation_manager: PVToolValidationManager[_DataSet]):
+        with pytest.raises(ValueError):
+            validation_manager.validate_many([], concurrency=0)
+
+
+class TestBatchSummary:
+    def test_merge(self):
+        summary = BatchSummary(total=2, num_succeeds=1, num_fails=1, num_errors_total=1)
+        summary.num_errors_per_id[1234567] = 1
+        other = BatchSummary(total=3, num_succeeds=1, num_fails=2, num_errors_total=4)
+        other.num_errors_per_id.update({1234567: 3, 7654321: 1})
+        summary.merge(other)
+        assert summary.total == 5
+        assert summary.num_fails == 3
+        assert summary.num_errors_total == 5
+        assert summary.num_errors_per_id == {1234567: 4, 7654321: 1}
+
+    def test_dict_round_trip(self):
+        summary = BatchSummary(total=3, num_succeeds=1, num_fails=2, num_warnings=1, num_errors_total=4)
+        summary.num_errors_per_id.update({1234567: 3, 7654321: 1})
+        summary.num_warnings_per_id[2345678] = 1
+        summary_dict = json.loads(json.dumps(summary.to_dict()))
+        assert BatchSummary.from_dict(summary_dict) == summary
@@ -0,0 +1,74 @@
+from pathlib import Path
+
+import pytest
+from ibims.datasets import TripicaResourceLoaderDataSet
+from pvframework.errors import ValidationMode
+
+from pvtool.batch import DataSetSummary, ValidationErrorSummary
+from pvtool.checkpoint import RECORD_ID_PATHS, CheckpointStore, DuplicateRecordIdError
+
+from .test_cli import _resource_data_set_json
+
+_ERROR = ValidationErrorSummary(
+    error_id=1234567,
+    error_type="ValueError",
+    message_detail="marktlokation.marktlokations_id has to consist of 11 digits.",
+    validator="check_malo_id",
+    mode=ValidationMode.ERROR,
+)
+
+
+class TestCheckpointStore:
+    def test_add_and_get(self, tmp_path: Path):
+        path = tmp_path / "checkpoint.sqlite"
+        data_set_summary = DataSetSummary(index=3, errors=(_ERROR,))
+        with CheckpointStore(path, "powercloud_customer_id", {"data_set_type": "customer"}, commit_interval=1) as store:
+            assert store.get("1") is None
+            store.add("1", data_set_summary)
+            store.add(None, data_set_summary)
+            assert len(store) == 1
+            # only the outcomes of previous runs are returned
+            assert store.get("1") is None
+        with CheckpointStore(path, "powercloud_customer_id", {"data_set_type": "customer"}) as store:
+            assert store.get("1") == data_set_summary
+            assert store.get(None) is None
+
+    @pytest.mark.parametrize(
+        ["record_id_path", "run_parameters"],
+        [
+            pytest.param("powercloud_customer_id", {"data_set_type": "network"}, id="other parameters"),
+            pytest.param("id", {"data_set_type": "customer"}, id="other record ID"),
+        ],
+    )
+    def test_other_run(self, tmp_path: Path, record_id_path: str, run_parameters: dict[str, str]):
+        path = tmp_path / "checkpoint.sqlite"
+        with CheckpointStore(path, "powercloud_customer_id", {"data_set_type": "customer"}):
+            pass
+        with pytest.raises(ValueError):
+            with CheckpointStore(path, record_id_path, run_parameters):
+                pass
+
+    def test_duplicate_record_id(self, tmp_path: Path):
+        path = tmp_path / "checkpoint.sqlite"
+        with CheckpointStore(path, "powercloud_customer_id", {}) as store:
+            store.add("1", DataSetSummary(index=1))
+            with pytest.raises(DuplicateRecordIdError):
+                store.add("1", DataSetSummary(index=2, errors=(_ERROR,)))
+        with CheckpointStore(path, "powercloud_customer_id", {}) as store:
+            assert store.get("1") == DataSetSummary(index=1)
+            # a resumed record may be recorded again once per run
+            store.add("1", DataSetSummary(index=1))
+            with pytest.raises(DuplicateRecordIdError):
+                store.add("1", DataSetSummary(index=1))
+
+    def test_record_id(self, tmp_path: Path):
+        data_set = TripicaResourceLoaderDataSet.model_validate_json(_resource_data_set_json("51238696781"))
+        store = CheckpointStore(tmp_path / "checkpoint.sqlite", "marktlokation.marktlokations_id", {})
+        assert store.record_id(data_set) == "51238696781"
+        assert CheckpointStore(tmp_path / "checkpoint.sqlite", "unknown.path", {}).record_id(data_set) is None
+        store = CheckpointStore(tmp_path / "checkpoint.sqlite", RECORD_ID_PATHS["resource"], {})
+        assert store.record_id(data_set) == '["51238696781", "DE0123401234012340123401234012340", "1hhjbd0"]'
+
+    def test_not_opened(self, tmp_path: Path):
+        with pytest.raises(RuntimeError):
+            CheckpointStore(tmp_path / "checkpoint.sqlite", "id", {}).get("1")
@@ -0,0 +1,158 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+from ibims.bo4e import Marktlokation, Messlokation, Sparte, Vertrag, Zaehler
+from ibims.datasets import TripicaResourceLoaderDataSet
+
+from pvtool.cli import main
+
+
+def _resource_data_set_json(marktlokations_id: str, messlokations_id: str = "DE0123401234012340123401234012340") -> str:
+    data_set = TripicaResourceLoaderDataSet.model_construct(
+        marktlokation=Marktlokation.model_construct(marktlokations_id=marktlokations_id, sparte=Sparte.STROM),
+        messlokation=Messlokation.model_construct(messlokations_id=messlokations_id),
+        vertrag=Vertrag.model_construct(sparte=Sparte.STROM),
+        zaehler=Zaehler.model_construct(zaehlernummer="1hhjbd0"),
+    )
+    return data_set.model_dump_json(by_alias=True)
+
+
+@pytest.fixture
+def resource_data_sets_file(tmp_path: Path) -> Path:
+    input_file = tmp_path / "resources.jsonl"
+    lines = [
+        _resource_data_set_json("51238696781"),
+        "",
+        _resource_data_set_json("123"),
+        "{not json",
+        _resource_data_set_json("41373559241"),
+    ]
+    input_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return input_file
+
+
+class TestCli:
+    def test_validate_file(self, resource_data_sets_file: Path, tmp_path: Path, capsys):
+        output_file = tmp_path / "errors.jsonl"
+        exit_code = main(["resource", str(resource_data_sets_file), "--output", str(output_file)])
+
+        assert exit_code == 1
+        records = [json.loads(line) for line in output_file.read_text(encoding="utf-8").splitlines()]
+        assert [(record["line"], record["error_type"]) for record in records] == [
+            (3, "ValueError"),
+            (4, "ValidationError"),
+        ]
+        assert records[0]["message_detail"] == "marktlokation.marktlokations_id has to consist of 11 digits."
+        assert records[0]["validator"] == "check_malo_id"
+        assert "3 data sets validated: 2 succeeded, 1 failed" in capsys.readouterr().err
+
+    def test_output_in_line_order(self, tmp_path: Path):
+        input_file, output_file = tmp_path / "resources.jsonl", tmp_path / "errors.jsonl"
+        lines = [_resource_data_set_json("123"), _resource_data_set_json("456"), "{not json", "{not json either"]
+        input_file.write_text("\n".join([*lines, _resource_data_set_json("789")]) + "\n", encoding="utf-8")
+
+        assert main(["resource", str(input_file), "--output", str(output_file)]) == 1
+        assert [json.loads(line)["line"] for line in output_file.read_text(encoding="utf-8").splitlines()] == [
+            1,
+            2,
+            3,
+            4,
+            5,
+        ]
+
+    def test_validate_stdin(self, resource_data_sets_file: Path, monkeypatch, capsys):
+        valid_line = resource_data_sets_file.read_text(encoding="utf-8").splitlines()[0]
+        monkeypatch.setattr("sys.stdin", [valid_line + "\n"])
+        assert main(["resource"]) == 0
+        assert capsys.readouterr().out == ""
+
+    def test_timings(self, resource_data_sets_file: Path, capsys):
+        main(["resource", str(resource_data_sets_file), "--output", os.devnull, "--timings"])
+        stderr = capsys.readouterr().err
+        assert "calls" in stderr
+        assert "check_malo_id @ marktlokation.marktlokations_id" in stderr
+
+    def test_customer_requires_migration_key_date(self):
+        with pytest.raises(SystemExit):
+            main(["customer"])
+
+    def test_resume_from_checkpoint(self, resource_data_sets_file: Path, tmp_path: Path, capsys):
+        checkpoint_file = tmp_path / "checkpoint.sqlite"
+        output_file = tmp_path / "errors.jsonl"
+        arguments = ["resource", str(resource_data_sets_file), "--output", str(output_file)]
+        expected_exit_code = main(arguments)
+        expected_output = output_file.read_text(encoding="utf-8")
+        # a run which died after the first three lines
+        first_lines_file = tmp_path / "first_lines.jsonl"
+        first_lines_file.write_text(
+            "".join(resource_data_sets_file.read_text(encoding="utf-8").splitlines(keepends=True)[:3]), encoding="utf-8"
+        )
+        main(["resource", str(first_lines_file), "--checkpoint", str(checkpoint_file)])
+        capsys.readouterr()
+
+        assert main([*arguments, "--checkpoint", str(checkpoint_file)]) == expected_exit_code
+        # the recorded errors are written in line order, too
+        assert output_file.read_text(encoding="utf-8") == expected_output
+        stderr = capsys.readouterr().err
+        assert "3 data sets validated: 2 succeeded, 1 failed" in stderr
+        assert "2 data sets were already validated by a previous run." in stderr
+
+    @pytest.mark.parametrize("store_option", ["--checkpoint", "--result-cache"])
+    def test_reused_results_in_line_order(self, tmp_path: Path, store_option: str):
+        input_file, output_file = tmp_path / "resources.jsonl", tmp_path / "errors.jsonl"
+        arguments = ["resource", str(input_file), "--output", str(output_file), store_option, str(tmp_path / "a.db")]
+        input_file.write_text(_resource_data_set_json("123") + "\n", encoding="utf-8")
+        main(arguments)
+        # the result of the second line is reused while the first line is validated
+        input_file.write_text(
+            _resource_data_set_json("456") + "\n" + _resource_data_set_json("123") + "\n", encoding="utf-8"
+        )
+
+        assert main(arguments) == 1
+        assert [json.loads(line)["line"] for line in output_file.read_text(encoding="utf-8").splitlines()] == [1, 2]
+
+    def test_checkpoint_of_several_messlokationen(self, resource_data_sets_file: Path, tmp_path: Path, capsys):
+        checkpoint_file = tmp_path / "checkpoint.sqlite"
+        with open(resource_data_sets_file, "a", encoding="utf-8") as input_file:
+            # the same Marktlokation with an invalid Messlokation
+            input_file.write(_resource_data_set_json("51238696781", messlokations_id="DE01") + "\n")
+        arguments = ["resource", str(resource_data_sets_file), "--concurrency", "1", "-o", os.devnull]
+
+        assert main([*arguments, "--checkpoint", str(checkpoint_file)]) == 1
+        assert "4 data sets validated: 2 succeeded, 2 failed" in capsys.readouterr().err
+        assert main([*arguments, "--checkpoint", str(tmp_path / "other.sqlite"), "--record-id", "messlokation"]) == 2
+        assert "occurs several times" in capsys.readouterr().err
+
+    def test_checkpoint_of_other_run(self, resource_data_sets_file: Path, tmp_path: Path, capsys):
+        checkpoint_file = tmp_path / "checkpoint.sqlite"
+        main(
+            ["resource", str(resource_data_sets_file), "--checkpoint", str(checkpoint_file), "-o", str(tmp_path / "a")]
+        )
+        assert main(["network", str(resource_data_sets_file), "--checkpoint", str(checkpoint_file)]) == 2
+        assert "can't be resumed" in capsys.readouterr().err
+
+    def test_reuse_results_of_unchanged_data_sets(self, resource_data_sets_file: Path, tmp_path: Path, capsys):
+        result_cache_file = tmp_path / "results.sqlite"
+        output_file = tmp_path / "errors.jsonl"
+        arguments = ["resource", str(resource_data_sets_file), "-o", str(output_file), "--result-cache"]
+        main([*arguments, str(result_cache_file)])
+        expected_output = output_file.read_text(encoding="utf-8")
+        lines = resource_data_sets_file.read_text(encoding="utf-8").splitlines(keepends=True)
+        lines[0] = _resource_data_set_json("12345678913") + "\n"
+        resource_data_sets_file.write_text("".join(lines), encoding="utf-8")
+        capsys.readouterr()
+
+        assert main([*arguments, str(result_cache_file)]) == 1
+        # only the changed data set is validated
+        assert "2 data sets were already validated by a previous run." in capsys.readouterr().err
+        assert output_file.read_text(encoding="utf-8") == expected_output
+
+    def test_fail_fast(self, resource_data_sets_file: Path, tmp_path: Path, capsys):
+        output_file = tmp_path / "errors.jsonl"
+        arguments = ["resource", str(resource_data_sets_file), "-o", str(output_file), "--checkpoint"]
+        assert main([*arguments, str(tmp_path / "a.sqlite"), "--fail-fast"]) == 1
+        assert "3 data sets validated: 2 succeeded, 1 failed" in capsys.readouterr().err
+        # the errors of a fail-fast run are incomplete, i.e. a normal run can't resume from its checkpoint
+        assert main([*arguments, str(tmp_path / "a.sqlite")]) == 2
@@ -0,0 +1,69 @@
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from bomf import MigrationConfig
+from pvframework import PathMappedValidator, ValidationResult, Validator
+
+from pvtool.columnar import MISSING, extract_column, get_column_rule
+from pvtool.customer_loader import validate_e_mail, validate_str_is_stripped
+from pvtool.resource_loader import build_resource_validation_manager, validate_malo_id
+from pvtool.utils import migration_config
+from pvtool.validation_manager import ValidationManagerWithConfig
+
+from .conftest import resource_data_set
+
+
+@dataclass(frozen=True)
+class _DataSet:
+    name: str
+    key_date: datetime
+
+
+def check_key_date(key_date: datetime):
+    if migration_config().migration_key_date != key_date:
+        raise ValueError("wrong migration config")
+
+
+def _errors_per_data_set(validation_result: ValidationResult) -> dict[Any, list[tuple[int, str]]]:
+    return {
+        data_set: sorted((error.error_id, error.message_detail) for error in errors)
+        for data_set, errors in validation_result.data_set_errors.items()
+    }
+
+
+class TestValidateColumnar:
+    async def test_same_errors_as_validate(self):
+        validation_manager = build_resource_validation_manager()
+        data_sets = [resource_data_set(index) for index in range(100)]
+        expected_result = await validation_manager.validate(*data_sets)
+        validation_result = await validation_manager.validate_columnar(*data_sets)
+
+        assert expected_result.num_fails > 0
+        assert validation_result.num_fails == expected_result.num_fails
+        assert validation_result.num_errors_per_id == expected_result.num_errors_per_id
+        assert _errors_per_data_set(validation_result) == _errors_per_data_set(expected_result)
+
+    async def test_validation_manager_with_config(self):
+        key_date = datetime(2023, 1, 1, tzinfo=UTC)
+        validation_manager = ValidationManagerWithConfig[_DataSet](MigrationConfig(migration_key_date=key_date))
+        validation_manager.register(PathMappedValidator(validate_str_is_stripped, {"string": "name"}))
+        validation_manager.register(PathMappedValidator(Validator(check_key_date), {"key_date": "key_date"}))
+
+        validation_result = await validation_manager.validate_columnar(
+            _DataSet(name="Mustermann", key_date=key_date), _DataSet(name=" Mustermann", key_date=key_date)
+        )
+        assert validation_result.num_fails == 1
+        assert validation_result.all_errors[0].message_detail == "name must not start or end with whitespace."
+
+
+def test_extract_column():
+    data_sets = [resource_data_set(index) for index in range(8)]
+    column = extract_column(data_sets, "messlokation.messlokations_id")
+    assert column[0] is MISSING
+    assert column[1:4] == ["DE01234", None, "DE0123401234012340123401234012340"]
+
+
+def test_get_column_rule():
+    assert get_column_rule(PathMappedValidator(validate_malo_id, {"marktlokations_id": "a.b"})) is not None
+    assert get_column_rule(PathMappedValidator(validate_e_mail, {"e_mail": "a.b"})) is None
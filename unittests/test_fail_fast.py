@@ -0,0 +1,120 @@
+import asyncio
+from datetime import UTC, datetime
+
+import pytest
+from bomf import MigrationConfig
+from injector import Injector
+from pvframework import ValidationManager
+
+from pvtool import PVToolValidationManager, ValidationManagerProviderCustomer
+from pvtool.fail_fast import FailFast, ValidatorCost, _validator_costs, cost_order, get_validator_cost
+from pvtool.process_pool import build_validation_manager
+from pvtool.synthetic import CustomerDataSetGenerator
+
+from .conftest import NumberDataSet, NumberValidators
+
+
+@pytest.fixture
+def expensive_check_positive(number_validators: NumberValidators, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Registers `check_positive` as expensive for the duration of the test"""
+    monkeypatch.setitem(_validator_costs, number_validators.positive.validator.func, ValidatorCost.EXPENSIVE)
+
+
+@pytest.fixture
+def validation_manager(
+    number_validation_manager: PVToolValidationManager[NumberDataSet],
+    number_validators: NumberValidators,
+    expensive_check_positive: None,  # pylint: disable=unused-argument
+) -> PVToolValidationManager[NumberDataSet]:
+    number_validation_manager.register(number_validators.small)
+    return number_validation_manager
+
+
+@pytest.mark.usefixtures("expensive_check_positive")
+class TestCostOrder:
+    def test_expensive_validators_last(self, number_validators: NumberValidators):
+        positive, even, small = number_validators.positive, number_validators.even, number_validators.small
+        assert get_validator_cost(positive) == ValidatorCost.EXPENSIVE
+        assert get_validator_cost(even) == ValidatorCost.CHEAP
+        assert cost_order({positive: set(), even: set(), small: set()}) == [even, small, positive]
+
+    def test_dependencies_come_first(self, number_validators: NumberValidators):
+        positive, even, small = number_validators.positive, number_validators.even, number_validators.small
+        assert cost_order({positive: set(), even: {positive}, small: set()}) == [small, positive, even]
+
+
+class TestFailFast:
+    async def test_stops_after_first_error(
+        self, validation_manager: PVToolValidationManager[NumberDataSet], number_validators: NumberValidators
+    ):
+        validation_manager.fail_fast = FailFast()
+        validation_result = await validation_manager.validate(NumberDataSet(13))
+        assert validation_result.num_fails == 1
+        # the warning doesn't stop the validation, the remaining expensive validator is not executed
+        assert number_validators.executed == ["check_even", "check_small"]
+        assert [error.mapped_validator for error in validation_result.all_errors] == [number_validators.small]
+        assert [error.mapped_validator for error in validation_result.all_warnings] == [number_validators.even]
+
+    async def test_skip_warnings(
+        self, validation_manager: PVToolValidationManager[NumberDataSet], number_validators: NumberValidators
+    ):
+        validation_manager.fail_fast = FailFast(skip_warnings=True)
+        validation_result = await validation_manager.validate(NumberDataSet(3))
+        assert validation_result.num_fails == 0
+        assert not validation_result.all_warnings
+        assert number_validators.executed == ["check_small", "check_positive"]
+
+    async def test_disable(
+        self, validation_manager: PVToolValidationManager[NumberDataSet], number_validators: NumberValidators
+    ):
+        validation_manager.fail_fast = FailFast()
+        await validation_manager.validate(NumberDataSet(13))
+        validation_manager.fail_fast = None
+        number_validators.executed.clear()
+        validation_result = await validation_manager.validate(NumberDataSet(13))
+        assert len(validation_result.all_errors + validation_result.all_warnings) == 2
+        assert sorted(number_validators.executed) == ["check_even", "check_positive", "check_small"]
+
+    async def test_async_validators(self, number_validators: NumberValidators):
+        validation_manager = PVToolValidationManager[NumberDataSet]()
+        validation_manager.register(number_validators.small)
+        validation_manager.register(number_validators.not_13)
+        validation_manager.fail_fast = FailFast()
+        validation_result = await validation_manager.validate(NumberDataSet(13))
+        assert validation_result.num_fails == 1
+        assert number_validators.executed == ["check_small"]
+        assert (await validation_manager.validate(NumberDataSet(2))).num_fails == 0
+        assert number_validators.executed == ["check_small", "check_small", "check_not_13"]
+
+    def test_same_validity_as_full_validation(self):
+        migration_config = MigrationConfig(migration_key_date=datetime(2023, 6, 1, tzinfo=UTC))
+        error_rates = {rule: 0.05 for rule in CustomerDataSetGenerator.RULES}
+        data_sets = list(
+            CustomerDataSetGenerator(migration_config.migration_key_date, seed=3, error_rates=error_rates).generate(50)
+        )
+        validation_manager = build_validation_manager(ValidationManagerProviderCustomer, migration_config)
+        fail_fast_manager = build_validation_manager(
+            ValidationManagerProviderCustomer, migration_config, FailFast(skip_warnings=True)
+        )
+        assert fail_fast_manager is not validation_manager
+        for data_set in data_sets:
+            validation_result = asyncio.run(validation_manager.validate(data_set))
+            fail_fast_result = asyncio.run(fail_fast_manager.validate(data_set))
+            assert fail_fast_result.num_fails == validation_result.num_fails
+            assert not fail_fast_result.all_warnings
+
+    def test_providers_cache_per_fail_fast_mode(self):
+        migration_config = MigrationConfig(migration_key_date=datetime(2023, 6, 1, tzinfo=UTC))
+
+        def _provide(fail_fast=None) -> ValidationManager:
+            return Injector(
+                [
+                    ValidationManagerProviderCustomer(fail_fast=fail_fast),
+                    lambda binder: binder.bind(MigrationConfig, to=migration_config),
+                ]
+            ).get(ValidationManager)
+
+        assert _provide(FailFast()) is _provide(FailFast())
+        assert _provide(FailFast()) is not _provide(FailFast(skip_warnings=True))
+        assert _provide().fail_fast is None  # type:ignore[attr-defined]
+        assert _provide(FailFast()).fail_fast == FailFast()  # type:ignore[attr-defined]
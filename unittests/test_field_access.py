@@ -0,0 +1,93 @@
+from typing import Any
+
+import pytest
+from pvframework import PathMappedValidator, ValidationManager, ValidationResult
+from pvframework.utils import required_field
+
+from pvtool.customer_loader import validate_str_is_stripped
+from pvtool.field_access import FieldAccessPlan, PlannedPathMappedValidator
+from pvtool.resource_loader import build_resource_validation_manager, validate_melo_id
+
+from .conftest import resource_data_set
+
+
+def _errors(validation_result: ValidationResult) -> list[tuple[Any, int, str]]:
+    return sorted(
+        (str(data_set), error.error_id, str(error))
+        for data_set, errors in validation_result.data_set_errors.items()
+        for error in errors
+    )
+
+
+def _plain_validation_manager(validation_manager: ValidationManager) -> ValidationManager:
+    """Returns a pvframework ValidationManager with the same validators"""
+    plain_validation_manager: ValidationManager = ValidationManager()
+    for mapped_validator, execution_info in validation_manager.validators.items():
+        plain_validation_manager.register(
+            mapped_validator,
+            depends_on=execution_info.depends_on,
+            timeout=execution_info.timeout,
+            mode=execution_info.mode,
+        )
+    return plain_validation_manager
+
+
+class TestFieldAccessPlan:
+    def test_common_prefixes_are_resolved_once(self):
+        plan = FieldAccessPlan(["zaehler.zaehlernummer", "zaehler.zaehlwerke", "vertrag.sparte", "zaehler"])
+        assert len(plan) == 5
+        data_set = resource_data_set(1)
+        values = plan.resolve(data_set)
+        assert values[plan.slots["zaehler"]] is data_set.zaehler
+        assert values[plan.slots["zaehler.zaehlernummer"]] == data_set.zaehler.zaehlernummer
+        assert values[plan.slots["vertrag.sparte"]] == data_set.vertrag.sparte
+
+    def test_missing_fields_raise_the_same_errors(self):
+        plan = FieldAccessPlan(["messlokation.messlokations_id"])
+        mapped_validator = PathMappedValidator(validate_melo_id, {"messlokations_id": "messlokation.messlokations_id"})
+        data_set = resource_data_set(0).model_copy(update={"messlokation": object()})
+        [expected_error] = list(mapped_validator.provide(data_set))
+        [error] = list(plan.provide(mapped_validator, plan.resolve(data_set)))
+        assert isinstance(error, AttributeError)
+        assert str(error) == str(expected_error)
+        with pytest.raises(AttributeError) as cause:
+            required_field(data_set, "messlokation.messlokations_id", Any)
+        assert str(error.__cause__) == str(cause.value)
+
+    def test_plans_planned_path_mapped_validators_only(self):
+        plan = FieldAccessPlan.of_mapped_validators(
+            [
+                PlannedPathMappedValidator(validate_str_is_stripped, {"string": "a.b"}),
+                PathMappedValidator(validate_str_is_stripped, {"string": "c"}),
+            ]
+        )
+        assert set(plan.slots) == {"a", "a.b"}
+
+    def test_planned_path_mapped_validator(self):
+        mapped_validator = PlannedPathMappedValidator(
+            validate_melo_id, {"messlokations_id": "messlokation.messlokations_id"}
+        )
+        plan = FieldAccessPlan.of_mapped_validators([mapped_validator])
+        data_set = resource_data_set(1)
+        other_data_set = resource_data_set(2)
+        with plan.resolved(data_set):
+            [parameters] = list(mapped_validator.provide(data_set))
+            # other data sets and validators with unplanned paths are provided as usual
+            [other_parameters] = list(mapped_validator.provide(other_data_set))
+            [unplanned_parameters] = list(
+                PlannedPathMappedValidator(
+                    validate_melo_id, {"messlokations_id": "marktlokation.marktlokations_id"}
+                ).provide(data_set)
+            )
+        assert parameters.param_dict == {"messlokations_id": data_set.messlokation.messlokations_id}
+        assert other_parameters.param_dict == {"messlokations_id": other_data_set.messlokation.messlokations_id}
+        assert unplanned_parameters.param_dict == {"messlokations_id": data_set.marktlokation.marktlokations_id}
+
+
+async def test_same_errors_as_pvframework():
+    validation_manager = build_resource_validation_manager()
+    data_sets = [resource_data_set(index) for index in range(30)]
+    validation_result = await validation_manager.validate(*data_sets)
+    expected_result = await _plain_validation_manager(validation_manager).validate(*data_sets)
+    assert validation_result.num_fails > 0
+    assert _errors(validation_result) == _errors(expected_result)
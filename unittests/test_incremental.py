@@ -0,0 +1,98 @@
+import shutil
+from datetime import UTC, datetime
+from pathlib import Path
+
+from bomf import MigrationConfig
+from ibims.bo4e import Marktlokation, Messlokation, Sparte, Vertrag, Zaehler
+from ibims.datasets import TripicaResourceLoaderDataSet
+from pvframework import PathMappedValidator, Query, QueryMappedValidator
+
+from pvtool import ValidationManagerProviderCustomer, ValidationManagerProviderResource, incremental
+from pvtool.customer_loader import iter_contract_id_dict, validate_iban, validate_str_is_stripped
+from pvtool.incremental import ContentHashStore, read_paths, validator_set_version
+from pvtool.process_pool import build_validation_manager
+from pvtool.resource_loader import build_resource_validation_manager
+
+
+def _resource_data_set(marktlokations_id: str, zaehlernummer: str = "1hhjbd0") -> TripicaResourceLoaderDataSet:
+    return TripicaResourceLoaderDataSet(
+        marktlokation=Marktlokation(marktlokations_id=marktlokations_id, sparte=Sparte.STROM),
+        messlokation=Messlokation(messlokations_id="DE0123401234012340123401234012340"),
+        vertrag=Vertrag(sparte=Sparte.STROM),
+        zaehler=Zaehler(zaehlernummer=zaehlernummer),
+    )
+
+
+def test_read_paths():
+    assert read_paths(build_resource_validation_manager()) == [
+        "marktlokation.marktlokations_id",
+        "messlokation.messlokations_id",
+        "vertrag.sparte",
+        "zaehler.zaehlernummer",
+    ]
+    validation_manager = build_resource_validation_manager()
+    validation_manager.register(PathMappedValidator(validate_str_is_stripped, {"string": "zaehler"}))
+    validation_manager.register(
+        QueryMappedValidator(validate_iban, {"iban": Query().path("banks").iter(iter_contract_id_dict).path("iban")})
+    )
+    assert read_paths(validation_manager) == [
+        "banks",
+        "marktlokation.marktlokations_id",
+        "messlokation.messlokations_id",
+        "vertrag.sparte",
+        "zaehler",
+    ]
+
+
+def test_validator_set_version():
+    validation_manager = build_resource_validation_manager()
+    version = validator_set_version(validation_manager)
+    assert validator_set_version(build_resource_validation_manager()) == version
+    validation_manager.register(PathMappedValidator(validate_str_is_stripped, {"string": "zaehler.zaehlernummer"}))
+    assert validator_set_version(validation_manager) != version
+
+
+def test_rules_version(tmp_path: Path, monkeypatch):
+    # pylint: disable=protected-access
+    package_dir = tmp_path / "pvtool"
+    shutil.copytree(incremental._PACKAGE_DIR, package_dir)
+    version = incremental._rules_version(package_dir)
+    assert version == incremental._rules_version()
+    # a helper module of the validators changes
+    with open(package_dir / "patterns.py", "a", encoding="utf-8") as patterns_file:
+        patterns_file.write("\n")
+    incremental._rules_version.cache_clear()
+    changed_source_version = incremental._rules_version(package_dir)
+    assert changed_source_version != version
+    # a dependency (e.g. the bank registry of schwifty) is updated
+    monkeypatch.setattr(incremental, "_distribution_version", lambda distribution: "9999.1.1")
+    incremental._rules_version.cache_clear()
+    assert incremental._rules_version(package_dir) != changed_source_version
+
+
+class TestContentHashStore:
+    def test_record_id(self, tmp_path: Path):
+        store = ContentHashStore(
+            tmp_path / "results.sqlite", build_validation_manager(ValidationManagerProviderResource)
+        )
+        record_id = store.record_id(_resource_data_set("51238696781"))
+        # the data sets get a new random ID, which isn't read by the validators
+        assert store.record_id(_resource_data_set("51238696781")) == record_id
+        assert store.record_id(_resource_data_set("41373559241")) != record_id
+        assert store.record_id(_resource_data_set("51238696781", zaehlernummer="2hhjbd0")) != record_id
+        data_set = _resource_data_set("51238696781")
+        data_set.marktlokation.lokationsadresse = None
+        assert store.record_id(data_set) == record_id
+
+    def test_migration_key_date(self, tmp_path: Path):
+        record_ids = {
+            ContentHashStore(
+                tmp_path / "results.sqlite",
+                build_validation_manager(
+                    ValidationManagerProviderCustomer,
+                    MigrationConfig(migration_key_date=datetime(year, 1, 1, tzinfo=UTC)),
+                ),
+            ).record_id(_resource_data_set("51238696781"))
+            for year in (2023, 2024)
+        }
+        assert len(record_ids) == 2
@@ -0,0 +1,97 @@
+import asyncio
+from datetime import UTC, datetime
+
+from bomf import MigrationConfig
+
+from pvtool.customer_loader import build_customer_validation_manager
+from pvtool.instrumentation import ValidatorInstrumentation, ValidatorMetricsHook, active_instrumentation, validator_key
+from pvtool.validation_manager import PVToolValidationManager
+
+from .conftest import NumberDataSet, NumberValidators
+
+
+class _RecordingHook(ValidatorMetricsHook):
+    def __init__(self) -> None:
+        self.events: list[tuple[str, int]] = []
+
+    def on_validator_executed(self, key: str, duration: float, num_errors: int) -> None:
+        assert duration >= 0
+        self.events.append((key, num_errors))
+
+
+class TestValidatorInstrumentation:
+    def test_validator_keys(self):
+        validation_manager = build_customer_validation_manager(
+            MigrationConfig(migration_key_date=datetime(2023, 6, 1, tzinfo=UTC))
+        )
+        keys = {validator_key(mapped_validator) for mapped_validator in validation_manager.validators}
+        assert "check_iban @ banks[*].iban, banks[*].sepa_info.sepa_zahler" in keys
+        assert "check_geschaeftspartner_anrede @ geschaeftspartner.anrede" in keys
+        assert len(keys) == len(validation_manager.validators)
+
+    async def test_calls_and_errors(
+        self, number_validation_manager: PVToolValidationManager[NumberDataSet], number_validators: NumberValidators
+    ) -> None:
+        number_validation_manager.register(number_validators.not_13)
+        await number_validation_manager.validate(NumberDataSet(1))
+        assert active_instrumentation() is None
+
+        hook = _RecordingHook()
+        with ValidatorInstrumentation([hook]).enabled() as instrumentation:
+            assert active_instrumentation() is instrumentation
+            await number_validation_manager.validate(NumberDataSet(-1), NumberDataSet(2), NumberDataSet(13))
+        reports = {report.key: report for report in instrumentation.report()}
+        assert {key: (report.calls, report.errors) for key, report in reports.items()} == {
+            "check_positive @ number": (3, 1),
+            "check_even @ number": (3, 2),
+            "check_not_13 @ number": (3, 1),
+        }
+        invalid_numbers = {
+            "check_positive @ number": {-1},
+            "check_even @ number": {-1, 13},
+            "check_not_13 @ number": {13},
+        }
+        assert sorted(hook.events) == sorted(
+            (key, int(number in numbers)) for key, numbers in invalid_numbers.items() for number in [-1, 2, 13]
+        )
+        assert all(report.max_time >= report.p99_time >= report.p50_time > 0 for report in reports.values())
+        assert "check_positive @ number" in instrumentation.format_report()
+
+        await number_validation_manager.validate(NumberDataSet(-3))
+        assert instrumentation.report()[0].calls == 3
+
+    async def test_other_validations_are_not_measured(
+        self, number_validation_manager: PVToolValidationManager[NumberDataSet]
+    ) -> None:
+        instrumentation = ValidatorInstrumentation()
+
+        async def _validate_instrumented() -> None:
+            with instrumentation.enabled():
+                await number_validation_manager.validate(NumberDataSet(1))
+
+        # both validations run concurrently on the same manager
+        await asyncio.gather(
+            _validate_instrumented(), number_validation_manager.validate(NumberDataSet(2), NumberDataSet(3))
+        )
+        assert {report.calls for report in instrumentation.report()} == {1}
+
+    def test_percentiles(self, number_validators: NumberValidators):
+        instrumentation = ValidatorInstrumentation(max_samples=1000)
+        mapped_validator = number_validators.positive
+        for duration in range(100, 0, -1):
+            instrumentation.record(mapped_validator, float(duration), num_errors=duration % 2)
+        [report] = instrumentation.report()
+        assert (report.calls, report.errors, report.total_time, report.mean_time) == (100, 50, 5050.0, 50.5)
+        assert (report.p50_time, report.p90_time, report.p99_time, report.max_time) == (50.0, 90.0, 99.0, 100.0)
+        instrumentation.reset()
+        assert not instrumentation.report()
+
+    def test_samples_are_bounded(self, number_validators: NumberValidators):
+        instrumentation = ValidatorInstrumentation(max_samples=10)
+        mapped_validator = number_validators.positive
+        for duration in range(1000):
+            instrumentation.record(mapped_validator, float(duration), num_errors=0)
+        [report] = instrumentation.report()
+        assert report.calls == 1000
+        assert report.max_time == 999.0
+        assert 0 <= report.p50_time <= report.p99_time <= 999.0
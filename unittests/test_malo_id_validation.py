@@ -1,7 +1,13 @@
 import pytest
 from pydantic import BaseModel, ValidationError, field_validator
 
-from pvtool.malo_id_validation import validate_marktlokations_id
+from pvtool.malo_id_validation import (
+    MaLoIdChecksums,
+    _get_malo_id_checksum,
+    _get_malo_id_checksum_per_digit,
+    check_malo_id_checksums,
+    validate_marktlokations_id,
+)
 
 
 class _ClassWithMaLoId(BaseModel):
@@ -37,3 +43,25 @@ class TestMaloIdValidation:
                 _instantiate_malo(malo_id)
         else:
             _instantiate_malo(malo_id)
+
+    @pytest.mark.parametrize(
+        "malo_id",
+        [
+            pytest.param("51238696781"),
+            pytest.param("12345678910"),
+            pytest.param("99999999990"),
+            pytest.param("10000000000"),
+            pytest.param("5123869678\N{ARABIC-INDIC DIGIT ONE}", id="non-ASCII checksum digit"),
+            pytest.param("51\N{ARABIC-INDIC DIGIT THREE}38696781", id="non-ASCII digit"),
+        ],
+    )
+    def test_checksum_equals_per_digit_implementation(self, malo_id: str):
+        assert _get_malo_id_checksum(malo_id) == _get_malo_id_checksum_per_digit(malo_id)
+
+    def test_check_malo_id_checksums(self):
+        malo_ids = ["51238696781", "41373559241", "12345678910", "asdasd", "", "05123869678", "5123869678"]
+        result = check_malo_id_checksums(malo_ids)
+        assert result == MaLoIdChecksums(
+            mask=[True, True, False, False, False, False, False],
+            expected_checksums=["1", "1", "3", None, None, None, None],
+        )
@@ -0,0 +1,47 @@
+from pathlib import Path
+
+import pytest
+
+from pvtool.mmap_reader import MemoryMappedJsonLines
+
+
+def _read_lines(path: Path, **kwargs) -> list[bytes]:
+    with MemoryMappedJsonLines(path, **kwargs) as lines:
+        return [bytes(line) for line in lines]
+
+
+class TestMemoryMappedJsonLines:
+    @pytest.mark.parametrize(
+        ["content", "expected_lines"],
+        [
+            pytest.param(b'{"a": 1}\n{"a": 2}\n', [b'{"a": 1}', b'{"a": 2}'], id="trailing newline"),
+            pytest.param(b'{"a": 1}\n{"a": 2}', [b'{"a": 1}', b'{"a": 2}'], id="no trailing newline"),
+            pytest.param(b'{"a": 1}\r\n\r\n{"a": 2}\r\n', [b'{"a": 1}', b"", b'{"a": 2}'], id="windows line breaks"),
+            pytest.param(b"\n\n", [b"", b""], id="empty lines"),
+            pytest.param(b"", [], id="empty file"),
+        ],
+    )
+    def test_lines(self, tmp_path: Path, content: bytes, expected_lines: list[bytes]):
+        path = tmp_path / "data.jsonl"
+        path.write_bytes(content)
+        assert _read_lines(path) == expected_lines
+
+    def test_release_processed_pages(self, tmp_path: Path):
+        path = tmp_path / "data.jsonl"
+        expected_lines = [f'{{"index": {index}}}'.encode() for index in range(10_000)]
+        path.write_bytes(b"\n".join(expected_lines))
+        assert _read_lines(path, release_size=1) == expected_lines
+
+    def test_exit_while_iterating(self, tmp_path: Path):
+        path = tmp_path / "data.jsonl"
+        path.write_bytes(b"1\n2\n3\n")
+        with MemoryMappedJsonLines(path) as lines:
+            line = next(iter(lines))
+            assert bytes(line) == b"1"
+        # the view is released, i.e. the mapping could be closed
+        with pytest.raises(ValueError):
+            bytes(line)
+
+    def test_not_opened(self, tmp_path: Path):
+        with pytest.raises(RuntimeError):
+            iter(MemoryMappedJsonLines(tmp_path / "data.jsonl"))
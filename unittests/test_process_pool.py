@@ -0,0 +1,71 @@
+from datetime import UTC, datetime
+
+import pytest
+from bomf import MigrationConfig
+from ibims.bo4e import Marktlokation, Messlokation, Sparte, Typ, Vertrag, Zaehler
+from ibims.datasets import TripicaResourceLoaderDataSet
+
+from pvtool import BatchSummary, ValidationManagerProviderCustomer, ValidationManagerProviderResource
+from pvtool.batch import DataSetSummary
+from pvtool.fail_fast import FailFast
+from pvtool.process_pool import ProcessPoolRunner, build_validation_manager
+from pvtool.validation_manager import ValidationManagerWithConfig
+
+
+def _resource_data_set(index: int) -> TripicaResourceLoaderDataSet:
+    return TripicaResourceLoaderDataSet.model_construct(
+        marktlokation=Marktlokation.model_construct(  # type: ignore[call-arg]
+            marktlokations_id=f"{index:011d}" if index % 3 else "123"
+        ),
+        messlokation=Messlokation.model_construct(
+            typ=Typ.ANGEBOT, version="1", messlokations_id="DE0123401234012340123401234012340"
+        ),
+        vertrag=Vertrag.model_construct(sparte=Sparte.STROM if index % 4 else Sparte.WASSER),  # type: ignore[call-arg]
+        zaehler=Zaehler.model_construct(zaehlernummer=f"{index}hhjbd0"),  # type: ignore[call-arg]
+    )
+
+
+class TestProcessPoolRunner:
+    async def test_same_results_as_sequential_validation(self):
+        data_sets = [_resource_data_set(index) for index in range(50)]
+        validation_manager = build_validation_manager(ValidationManagerProviderResource)
+        expected_summary = BatchSummary()
+        expected_data_set_summaries = []
+        for index, data_set in enumerate(data_sets):
+            data_set_summary = DataSetSummary.from_validation_result(index, await validation_manager.validate(data_set))
+            expected_data_set_summaries.append(data_set_summary)
+            expected_summary.add_data_set_summary(data_set_summary)
+
+        with ProcessPoolRunner(ValidationManagerProviderResource, max_workers=2, chunk_size=3) as runner:
+            data_set_summaries = list(runner.validate(data_sets))
+
+        assert data_set_summaries == expected_data_set_summaries
+        assert runner.summary == expected_summary
+        assert runner.summary.num_fails == 25
+
+    async def test_fail_fast(self):
+        data_sets = [_resource_data_set(index) for index in range(20)]
+        validation_manager = build_validation_manager(ValidationManagerProviderResource, fail_fast=FailFast())
+        expected_data_set_summaries = [
+            DataSetSummary.from_validation_result(index, await validation_manager.validate(data_set))
+            for index, data_set in enumerate(data_sets)
+        ]
+
+        with ProcessPoolRunner(
+            ValidationManagerProviderResource, max_workers=2, chunk_size=3, fail_fast=FailFast()
+        ) as runner:
+            data_set_summaries = list(runner.validate(data_sets))
+
+        assert data_set_summaries == expected_data_set_summaries
+        assert all(len(data_set_summary.errors) <= 1 for data_set_summary in data_set_summaries)
+
+    def test_invalid_chunk_size(self):
+        with pytest.raises(ValueError):
+            ProcessPoolRunner(ValidationManagerProviderResource, chunk_size=0)
+
+
+def test_build_validation_manager_with_config():
+    config = MigrationConfig(migration_key_date=datetime(2023, 6, 1, tzinfo=UTC))
+    validation_manager = build_validation_manager(ValidationManagerProviderCustomer, config)
+    assert isinstance(validation_manager, ValidationManagerWithConfig)
+    assert validation_manager.config == config
@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+from pvframework import Query
+
+from pvtool.query_plan import PlannedQuery, QueryPlan
+
+
+@dataclass(frozen=True)
+class _Bank:
+    iban: str
+    sepa_zahler: bool
+
+
+@dataclass(frozen=True)
+class _DataSet:
+    banks: dict[str, Any]
+
+
+_iterated_dicts: list[dict[str, Any]] = []
+
+
+def _iter_dict(some_dict: dict[str, Any]) -> Iterator[tuple[Any, str]]:
+    _iterated_dicts.append(some_dict)
+    return ((value, f"[{key}]") for key, value in some_dict.items())
+
+
+def _evaluate(query: Query, data_set: Any) -> list[Any]:
+    return [str(element) if isinstance(element, Exception) else element for element in query.iterable(data_set, True)]
+
+
+class TestQueryPlan:
+    def test_shared_subqueries(self):
+        iban_query = PlannedQuery().path("banks").iter(_iter_dict).path("iban")
+        sepa_zahler_query = PlannedQuery().path("banks").iter(_iter_dict).path("sepa_zahler")
+        other_sepa_zahler_query = PlannedQuery().path("banks").iter(_iter_dict).path("sepa_zahler")
+        query_plan = QueryPlan([iban_query, sepa_zahler_query, other_sepa_zahler_query, Query().path("banks")])
+        assert query_plan.shared_queries == {sepa_zahler_query.steps, sepa_zahler_query.steps[:2]}
+
+    def test_shared_subqueries_are_evaluated_once(self):
+        queries = [
+            PlannedQuery().path("banks").iter(_iter_dict).path("iban"),
+            PlannedQuery().path("banks").iter(_iter_dict).path("sepa_zahler"),
+            PlannedQuery().path("banks").iter(_iter_dict).path("sepa_zahler"),
+            PlannedQuery().path("banks").iter(_iter_dict).path("bic"),
+        ]
+        query_plan = QueryPlan(queries)
+        data_sets = [
+            _DataSet(banks={"1": _Bank("DE52940594210000082271", True), "2": _Bank("DE52", False)}),
+            _DataSet(banks={}),
+        ]
+        _iterated_dicts.clear()
+        expected_results = [[_evaluate(query, data_set) for query in queries] for data_set in data_sets]
+        assert len(_iterated_dicts) == 8
+        _iterated_dicts.clear()
+        for data_set, expected_result in zip(data_sets, expected_results):
+            with query_plan.materialize():
+                assert [_evaluate(query, data_set) for query in queries] == expected_result
+        assert len(_iterated_dicts) == 2
+        assert expected_results[0][3] == ["banks[1].bic: value not provided", "banks[2].bic: value not provided"]
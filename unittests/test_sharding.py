@@ -0,0 +1,116 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from pvtool.fail_fast import FailFast
+from pvtool.sharding import SUMMARY_FILE_NAME, main, validate_shards
+
+from .test_cli import _resource_data_set_json
+
+
+def _write_shard(path: Path, marktlokations_ids: list[str]) -> None:
+    path.write_text(
+        "".join(_resource_data_set_json(malo_id) + "\n" for malo_id in marktlokations_ids), encoding="utf-8"
+    )
+
+
+def _error_lines(path: Path) -> list[int]:
+    return [json.loads(line)["line"] for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestValidateShards:
+    def test_validate_directory(self, tmp_path: Path, capsys):
+        input_dir, output_dir = tmp_path / "input", tmp_path / "output"
+        input_dir.mkdir()
+        _write_shard(input_dir / "1.jsonl", ["51238696781", "123"])
+        _write_shard(input_dir / "2.jsonl", ["41373559241"])
+        _write_shard(input_dir / "3.jsonl", ["51238696781", "41373559241", "4"])
+        (input_dir / "ignored.txt").write_text("not a shard", encoding="utf-8")
+
+        exit_code = main(["resource", str(input_dir), str(output_dir), "--workers", "2"])
+
+        assert exit_code == 1
+        assert _error_lines(output_dir / "1.jsonl.errors.jsonl") == [2]
+        assert _error_lines(output_dir / "2.jsonl.errors.jsonl") == []
+        assert _error_lines(output_dir / "3.jsonl.errors.jsonl") == [3]
+        merged_summary = json.loads((output_dir / SUMMARY_FILE_NAME).read_text(encoding="utf-8"))
+        assert merged_summary["summary"]["total"] == 6
+        assert merged_summary["summary"]["num_fails"] == 2
+        assert merged_summary["failed_shards"] == {}
+        assert "3 of 3 files validated. 6 data sets validated: 4 succeeded, 2 failed" in capsys.readouterr().err
+
+    def test_skip_completed_shards(self, tmp_path: Path):
+        input_dir, output_dir = tmp_path / "input", tmp_path / "output"
+        input_dir.mkdir()
+        _write_shard(input_dir / "1.jsonl", ["123"])
+        _write_shard(input_dir / "2.jsonl", ["123"])
+        input_files = sorted(input_dir.iterdir())
+        validate_shards("resource", input_files, output_dir, max_workers=1)
+        # a completed shard isn't validated again, a changed one is
+        (output_dir / "1.jsonl.errors.jsonl").write_text("", encoding="utf-8")
+        _write_shard(input_dir / "2.jsonl", ["123", "51238696781"])
+
+        shard_results = validate_shards("resource", input_files, output_dir, max_workers=1)
+
+        assert _error_lines(output_dir / "1.jsonl.errors.jsonl") == []
+        assert _error_lines(output_dir / "2.jsonl.errors.jsonl") == [1]
+        assert [shard_result.summary.total for shard_result in shard_results if shard_result.summary] == [1, 2]
+
+        validate_shards("resource", input_files, output_dir, max_workers=1, restart=True)
+        assert _error_lines(output_dir / "1.jsonl.errors.jsonl") == [1]
+
+    def test_other_run_parameters(self, tmp_path: Path, capsys):
+        input_dir, output_dir = tmp_path / "input", tmp_path / "output"
+        input_dir.mkdir()
+        _write_shard(input_dir / "1.jsonl", ["51238696781", "123"])
+        main(["resource", str(input_dir), str(output_dir), "--workers", "1"])
+        capsys.readouterr()
+
+        # the results of the resource run don't apply to the network run
+        main(["network", str(input_dir), str(output_dir), "--workers", "1"])
+        assert "0 data sets validated: 0 succeeded, 0 failed" in capsys.readouterr().err
+        shard_results = validate_shards("resource", [input_dir / "1.jsonl"], output_dir, max_workers=1)
+        assert shard_results[0].summary is not None and shard_results[0].summary.num_fails == 1
+        (output_dir / "1.jsonl.errors.jsonl").write_text("", encoding="utf-8")
+        validate_shards("resource", [input_dir / "1.jsonl"], output_dir, max_workers=1, with_warnings=False)
+        assert _error_lines(output_dir / "1.jsonl.errors.jsonl") == [2]
+
+        # the results of a fail-fast run only contain the first error of each data set
+        (output_dir / "1.jsonl.errors.jsonl").write_text("", encoding="utf-8")
+        validate_shards(
+            "resource", [input_dir / "1.jsonl"], output_dir, max_workers=1, with_warnings=False, fail_fast=FailFast()
+        )
+        assert _error_lines(output_dir / "1.jsonl.errors.jsonl") == [2]
+        (output_dir / "1.jsonl.errors.jsonl").write_text("", encoding="utf-8")
+        validate_shards(
+            "resource", [input_dir / "1.jsonl"], output_dir, max_workers=1, with_warnings=False, fail_fast=FailFast()
+        )
+        assert _error_lines(output_dir / "1.jsonl.errors.jsonl") == []
+
+    def test_files_in_subdirectories(self, tmp_path: Path):
+        input_dir, output_dir = tmp_path / "input", tmp_path / "output"
+        (input_dir / "a").mkdir(parents=True)
+        (input_dir / "b").mkdir()
+        _write_shard(input_dir / "a" / "1.jsonl", ["123"])
+        _write_shard(input_dir / "b" / "1.jsonl", ["51238696781"])
+
+        assert main(["resource", str(input_dir), str(output_dir), "--pattern", "**/*.jsonl"]) == 1
+
+        assert _error_lines(output_dir / "a" / "1.jsonl.errors.jsonl") == [1]
+        assert _error_lines(output_dir / "b" / "1.jsonl.errors.jsonl") == []
+        with pytest.raises(ValueError, match="unique"):
+            validate_shards("resource", sorted(input_dir.glob("**/*.jsonl")), output_dir)
+
+    def test_failed_shard(self, tmp_path: Path):
+        input_dir, output_dir = tmp_path / "input", tmp_path / "output"
+        input_dir.mkdir()
+        _write_shard(input_dir / "1.jsonl", ["51238696781"])
+        (input_dir / "2.jsonl").mkdir()  # can't be read
+
+        shard_results = validate_shards("resource", sorted(input_dir.iterdir()), output_dir, max_workers=2)
+
+        assert shard_results[0].succeeded
+        assert not shard_results[1].succeeded
+        assert shard_results[1].failure is not None and shard_results[1].failure.startswith("IsADirectoryError")
+        assert not (output_dir / "2.jsonl.summary.json").exists()
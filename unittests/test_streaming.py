@@ -0,0 +1,64 @@
+import asyncio
+from contextlib import aclosing
+
+import pytest
+from pvframework.errors import ValidationMode
+
+from pvtool import PVToolValidationManager
+
+from .conftest import NumberDataSet, NumberValidators
+
+
+class TestIterErrors:
+    async def test_same_errors_as_validate(self, number_validation_manager: PVToolValidationManager[NumberDataSet]):
+        data_sets = [NumberDataSet(number) for number in (-1, 2, 3, -4)]
+        streamed_errors = [
+            (validation_error.data_set, validation_error.mapped_validator.name)
+            async for validation_error in number_validation_manager.iter_errors(*data_sets)
+        ]
+        assert streamed_errors == [
+            (NumberDataSet(-1), "check_positive"),
+            (NumberDataSet(-1), "check_even"),
+            (NumberDataSet(3), "check_even"),
+            (NumberDataSet(-4), "check_positive"),
+        ]
+        validation_result = await number_validation_manager.validate(*data_sets)
+        assert len(streamed_errors) == validation_result.num_errors_total + len(validation_result.all_warnings)
+
+    async def test_modes(self, number_validation_manager: PVToolValidationManager[NumberDataSet]):
+        streamed_errors = [
+            validation_error.mapped_validator.name
+            async for validation_error in number_validation_manager.iter_errors(
+                NumberDataSet(-1), NumberDataSet(3), modes={ValidationMode.ERROR}
+            )
+        ]
+        assert streamed_errors == ["check_positive"]
+
+    async def test_early_termination(
+        self, number_validation_manager: PVToolValidationManager[NumberDataSet], number_validators: NumberValidators
+    ):
+        async with aclosing(
+            number_validation_manager.iter_errors(NumberDataSet(-1), NumberDataSet(-3))
+        ) as validation_errors:
+            first_error = await anext(validation_errors)
+        assert first_error.mapped_validator.name == "check_positive"
+        await asyncio.sleep(0)
+        # neither the remaining validator nor the second data set are validated
+        assert number_validators.executed == ["check_positive"]
+
+    async def test_async_validators(
+        self, number_validation_manager: PVToolValidationManager[NumberDataSet], number_validators: NumberValidators
+    ):
+        number_validation_manager.register(number_validators.not_13)
+        streamed_errors = {
+            validation_error.mapped_validator.name
+            async for validation_error in number_validation_manager.iter_errors(NumberDataSet(13))
+        }
+        assert streamed_errors == {"check_even", "check_not_13"}
+
+    async def test_errors_of_the_validation_are_raised(
+        self, number_validation_manager: PVToolValidationManager[NumberDataSet]
+    ):
+        with pytest.raises(TypeError, match="not hashable"):
+            async for _ in number_validation_manager.iter_errors({"number": 1}):  # type:ignore[arg-type]
+                pass
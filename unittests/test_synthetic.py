@@ -0,0 +1,109 @@
+import asyncio
+import random
+from datetime import UTC, datetime
+
+import pytest
+from bomf import MigrationConfig
+from ibims.bo4e import Sparte
+from schwifty import IBAN
+
+from pvtool import (
+    ValidationManagerProviderCustomer,
+    ValidationManagerProviderNetwork,
+    ValidationManagerProviderResource,
+)
+from pvtool.instrumentation import validator_key
+from pvtool.malo_id_validation import _get_malo_id_checksum_per_digit
+from pvtool.network_loader import check_obis, check_rollencodenr
+from pvtool.patterns import REGEX_MELO_ID
+from pvtool.process_pool import build_validation_manager
+from pvtool.synthetic import (
+    GENERATORS,
+    CustomerDataSetGenerator,
+    DataSetGenerator,
+    ResourceDataSetGenerator,
+    random_iban_and_bic,
+    random_malo_id,
+    random_melo_id,
+    random_obis,
+    random_rollencodenummer,
+)
+
+_MIGRATION_CONFIG = MigrationConfig(migration_key_date=datetime(2023, 6, 1, tzinfo=UTC))
+_PROVIDERS = {
+    "customer": ValidationManagerProviderCustomer,
+    "network": ValidationManagerProviderNetwork,
+    "resource": ValidationManagerProviderResource,
+}
+
+
+def _build_generator(loader: str, **kwargs) -> DataSetGenerator:
+    if loader == "customer":
+        return CustomerDataSetGenerator(_MIGRATION_CONFIG.migration_key_date, **kwargs)
+    return GENERATORS[loader](**kwargs)
+
+
+def _failed_validator_keys(validation_manager, data_sets) -> set[str]:
+    """Returns the keys of the validators which raised errors or warnings for any of the data sets"""
+    validation_result = asyncio.run(validation_manager.validate(*data_sets))
+    return {
+        validator_key(validation_error.mapped_validator)
+        for validation_error in validation_result.all_errors + validation_result.all_warnings
+    }
+
+
+class TestRandomValues:
+    def test_values_are_valid(self):
+        rng = random.Random(0)
+        for _ in range(1000):
+            malo_id = random_malo_id(rng)
+            assert len(malo_id) == 11 and malo_id[-1] == _get_malo_id_checksum_per_digit(malo_id)
+            assert REGEX_MELO_ID.match(random_melo_id(rng))
+            check_rollencodenr(random_rollencodenummer(rng))
+            for sparte in (Sparte.STROM, Sparte.GAS):
+                check_obis(random_obis(rng, sparte), sparte)
+            iban, bic, _ = random_iban_and_bic(rng)
+            assert IBAN(iban).bic == bic
+
+
+class TestDataSetGenerator:
+    @pytest.mark.parametrize("loader", sorted(GENERATORS))
+    def test_injected_errors(self, loader: str):
+        validation_manager = build_validation_manager(_PROVIDERS[loader], _MIGRATION_CONFIG)
+        valid_data_sets = list(_build_generator(loader, seed=1).generate(5))
+        # the network manager fails for all data sets, see `NetworkDataSetGenerator`
+        baseline_keys = _failed_validator_keys(validation_manager, valid_data_sets)
+        assert not baseline_keys or loader == "network"
+        for rule in GENERATORS[loader].RULES:
+            data_sets = list(_build_generator(loader, seed=1, error_rates={rule: 1.0}).generate(5))
+            failed_keys = _failed_validator_keys(validation_manager, data_sets) - baseline_keys
+            assert failed_keys, rule
+            assert {key.split(" @ ")[0] for key in failed_keys} == {rule}
+
+    @pytest.mark.parametrize("loader", sorted(GENERATORS))
+    def test_generation_is_deterministic(self, loader: str):
+        error_rates = {rule: 0.2 for rule in GENERATORS[loader].RULES}
+        data_sets = list(_build_generator(loader, seed=7, error_rates=error_rates).generate_with_errors(20))
+        assert data_sets == list(_build_generator(loader, seed=7, error_rates=error_rates).generate_with_errors(20))
+        assert data_sets != list(_build_generator(loader, seed=8, error_rates=error_rates).generate_with_errors(20))
+
+    def test_error_rates(self):
+        generator = ResourceDataSetGenerator(error_rates={"check_melo_id": 0.3, "check_sparte": 0.0})
+        broken_rules = [rules for _, rules in generator.generate_with_errors(2000)]
+        assert {rule for rules in broken_rules for rule in rules} == {"check_melo_id"}
+        assert 0.25 < sum(1 for rules in broken_rules if rules) / len(broken_rules) < 0.35
+
+    def test_streaming(self):
+        data_sets = ResourceDataSetGenerator().generate()
+        assert len([next(data_sets) for _ in range(3)]) == 3
+
+    @pytest.mark.parametrize(
+        "error_rates, message",
+        [
+            pytest.param({"check_iban": 0.1}, "Unknown rules", id="unknown rule"),
+            pytest.param({"check_melo_id": 1.5}, "between 0 and 1", id="rate too large"),
+        ],
+    )
+    def test_invalid_error_rates(self, error_rates, message: str):
+        with pytest.raises(ValueError, match=message):
+            ResourceDataSetGenerator(error_rates=error_rates)
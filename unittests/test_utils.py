@@ -0,0 +1,85 @@
+import asyncio
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+
+import pytest
+from bomf import MigrationConfig
+from pvframework import PathMappedValidator, ValidationManager, Validator
+
+from pvtool.utils import migration_config
+from pvtool.validation_manager import KeyDateContext, PVToolValidationManager, ValidationManagerWithConfig
+
+
+@dataclass(frozen=True)
+class _DataSet:
+    key_date: datetime
+
+
+async def check_key_date(key_date: datetime):
+    # yield to the event loop to let validations of other managers interleave
+    await asyncio.sleep(0)
+    if migration_config().migration_key_date != key_date:
+        raise ValueError("wrong migration config")
+
+
+def _build_manager(key_date: datetime) -> ValidationManagerWithConfig[_DataSet]:
+    manager = ValidationManagerWithConfig[_DataSet](MigrationConfig(migration_key_date=key_date))
+    manager.register(PathMappedValidator(Validator(check_key_date), {"key_date": "key_date"}))
+    return manager
+
+
+class TestMigrationConfig:
+    def test_outside_of_validation(self):
+        with pytest.raises(RuntimeError):
+            migration_config()
+
+    async def test_plain_validation_manager(self):
+        manager = ValidationManager[_DataSet]()
+        manager.register(PathMappedValidator(Validator(check_key_date), {"key_date": "key_date"}))
+        validation_summary = await manager.validate(_DataSet(key_date=datetime(2023, 1, 1, tzinfo=UTC)))
+        assert validation_summary.num_fails == 1
+        assert isinstance(validation_summary.all_errors[0].cause, TypeError)
+        assert "ValidationManagerWithConfig" in validation_summary.all_errors[0].message_detail
+
+    async def test_pvtool_validation_manager_without_config(self):
+        manager = PVToolValidationManager[_DataSet]()
+        manager.register(PathMappedValidator(Validator(check_key_date), {"key_date": "key_date"}))
+        validation_summary = await manager.validate(_DataSet(key_date=datetime(2023, 1, 1, tzinfo=UTC)))
+        assert validation_summary.num_fails == 1
+        assert isinstance(validation_summary.all_errors[0].cause, TypeError)
+        assert "ValidationManagerWithConfig" in validation_summary.all_errors[0].message_detail
+
+    async def test_concurrent_managers(self):
+        key_dates = [datetime(2020 + offset, 1, 1, tzinfo=UTC) for offset in range(5)]
+        managers = [_build_manager(key_date) for key_date in key_dates]
+        validation_summaries = await asyncio.gather(
+            *(manager.validate(_DataSet(key_date=key_date)) for manager, key_date in zip(managers, key_dates))
+        )
+        assert all(validation_summary.num_fails == 0 for validation_summary in validation_summaries)
+        with pytest.raises(RuntimeError):
+            migration_config()
+
+
+class TestKeyDateContext:
+    @pytest.mark.parametrize(
+        ["migration_key_date", "expected_berlin_date", "expected_latest_adult_birthday"],
+        [
+            pytest.param(datetime(2023, 6, 1, tzinfo=UTC), date(2023, 6, 1), date(2005, 6, 1), id="plain"),
+            pytest.param(
+                datetime(2023, 12, 31, 23, 30, tzinfo=UTC), date(2024, 1, 1), date(2006, 1, 1), id="berlin is ahead"
+            ),
+            pytest.param(datetime(2024, 2, 29, tzinfo=UTC), date(2024, 2, 29), date(2006, 2, 28), id="leap day"),
+        ],
+    )
+    def test_from_config(
+        self, migration_key_date: datetime, expected_berlin_date: date, expected_latest_adult_birthday: date
+    ):
+        key_dates = KeyDateContext.from_config(MigrationConfig(migration_key_date=migration_key_date))
+        assert key_dates.migration_key_date_berlin == expected_berlin_date
+        assert key_dates.latest_adult_birthday == expected_latest_adult_birthday
+        assert key_dates.migration_key_date_utc == migration_key_date
+        assert key_dates.migration_key_date_iso == migration_key_date.isoformat()
+
+    def test_precomputed_on_manager(self):
+        manager = _build_manager(datetime(2023, 6, 1, tzinfo=UTC))
+        assert manager.key_date_context == KeyDateContext.from_config(manager.config)
@@ -0,0 +1,281 @@
+import gc
+import inspect
+import logging
+import weakref
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any, Callable, Sequence
+
+import pytest
+from bomf import MigrationConfig
+from pvframework import PathMappedValidator, ValidationManager, ValidationResult, Validator
+from pvframework.errors import _get_identifier
+from pvframework.types import SyncValidatorFunction
+from pvframework.utils import param
+from schwifty import IBAN
+
+from pvtool import ValidationManagerProviderCustomer, ValidationManagerProviderNetwork
+from pvtool.customer_loader import (
+    check_bic,
+    check_e_mail,
+    check_postleitzahl,
+    check_str_is_stripped,
+    check_telefonnummer,
+)
+from pvtool.network_loader import check_obis, check_rollencodenr
+from pvtool.process_pool import build_validation_manager
+from pvtool.synthetic import CustomerDataSetGenerator, DataSetGenerator, NetworkDataSetGenerator
+from pvtool.validation_cache import (
+    CacheInfo,
+    ValidationCache,
+    bic_validation_cache,
+    e_mail_domain_validation_cache,
+    iban_validation_cache,
+    is_pure,
+    pure,
+)
+from pvtool.validation_manager import PVToolValidationManager, error_identifier
+
+
+def _validate_iban(iban: str) -> None:
+    IBAN(iban).validate()
+
+
+@pytest.fixture
+def logging_disabled():
+    # the log records captured by pytest reference the validation errors and thus the manager
+    logging.disable(logging.ERROR)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+class TestValidationCache:
+    def test_hits_and_misses(self):
+        cache = ValidationCache(_validate_iban, str.upper, maxsize=10)
+        cache.validate("DE52940594210000082271")
+        cache.validate("de52940594210000082271")
+        cache.validate("DE52940594210000082271")
+        assert cache.cache_info() == CacheInfo(hits=2, misses=1, maxsize=10, currsize=1)
+        cache.cache_clear()
+        assert cache.cache_info() == CacheInfo(hits=0, misses=0, maxsize=10, currsize=0)
+
+    def test_cached_error_is_the_same_as_the_uncached(self):
+        cache = ValidationCache(_validate_iban, str.upper, maxsize=10)
+        with pytest.raises(Exception) as uncached_error:
+            _validate_iban("DE42940594210000082271")
+        for _ in range(2):
+            with pytest.raises(Exception) as cached_error:
+                cache.validate("DE42940594210000082271")
+            assert type(cached_error.value) is type(uncached_error.value)
+            assert str(cached_error.value) == str(uncached_error.value)
+            # the error ID depends on the location where the error was raised
+            assert error_identifier(cached_error.value) == _get_identifier(uncached_error.value)
+        assert cache.cache_info().hits == 1
+
+    def test_least_recently_used_entry_is_evicted(self):
+        validated_values = []
+        cache = ValidationCache(validated_values.append, str.upper, maxsize=2)
+        for value in ["a", "b", "a", "c", "a", "b"]:
+            cache.validate(value)
+        assert validated_values == ["A", "B", "C", "B"]
+        assert cache.cache_info() == CacheInfo(hits=2, misses=4, maxsize=2, currsize=2)
+
+    def test_invalid_maxsize(self):
+        with pytest.raises(ValueError):
+            ValidationCache(_validate_iban, str.upper, maxsize=0)
+
+    @pytest.mark.usefixtures("logging_disabled")
+    async def test_cached_errors_dont_keep_the_manager_alive(self):
+        cache = ValidationCache(_validate_iban, str.upper, maxsize=10)
+
+        def check_iban(string: str):
+            cache.validate(string)
+
+        validation_manager = _names_validation_manager(check_iban)
+        await validation_manager.validate(_Names("DE42940594210000082271", "DE43940594210000082271"))
+        manager_reference = weakref.ref(validation_manager)
+        del validation_manager
+        gc.collect()
+        assert manager_reference() is None
+        assert cache.cache_info().currsize == 2
+
+    def test_iban_normalization(self):
+        iban_validation_cache.cache_clear()
+        iban_validation_cache.validate("DE52 9405 9421 0000 0822 71")
+        iban_validation_cache.validate("de52940594210000082271")
+        assert iban_validation_cache.cache_info().hits == 1
+
+
+@dataclass(frozen=True)
+class _Names:
+    vorname: str
+    nachname: str
+
+
+def check_stripped(string: str):
+    if string.strip() != string:
+        raise ValueError(f"{param('string').param_id} must not start or end with whitespace.")
+
+
+def _names_validation_manager(validator_function: Callable[..., None]) -> PVToolValidationManager[_Names]:
+    validation_manager = PVToolValidationManager[_Names]()
+    validator: Validator[_Names, SyncValidatorFunction] = Validator(validator_function)
+    validation_manager.register(PathMappedValidator(validator, {"string": "vorname"}))
+    validation_manager.register(PathMappedValidator(validator, {"string": "nachname"}))
+    return validation_manager
+
+
+def _errors(validation_result: ValidationResult) -> list[tuple[int, str]]:
+    return sorted(
+        (error.error_id, error.message_detail)
+        for errors in validation_result.data_set_errors.values()
+        for error in errors
+    )
+
+
+class TestPureValidatorCache:
+    async def test_cached_errors_refer_to_the_current_parameter(self):
+        memoized_check_stripped = pure(maxsize=10)(check_stripped)
+        data_sets = [_Names(" Max", "Mustermann"), _Names("Max", " Max"), _Names(" Max", " Max")]
+        validation_result = await _names_validation_manager(memoized_check_stripped).validate(*data_sets)
+        uncached_validation_result = await _names_validation_manager(check_stripped).validate(*data_sets)
+        assert _errors(validation_result) == _errors(uncached_validation_result)
+        assert [message for _, message in _errors(validation_result)] == [
+            "nachname must not start or end with whitespace.",
+            "nachname must not start or end with whitespace.",
+            "vorname must not start or end with whitespace.",
+            "vorname must not start or end with whitespace.",
+        ]
+        assert memoized_check_stripped.cache.cache_info() == CacheInfo(hits=3, misses=3, maxsize=10, currsize=3)
+
+    @pytest.mark.usefixtures("logging_disabled")
+    async def test_cached_errors_dont_keep_the_manager_alive(self):
+        memoized_check_stripped = pure(maxsize=10)(check_stripped)
+        validation_manager = _names_validation_manager(memoized_check_stripped)
+        await validation_manager.validate(_Names(" Max", "Mustermann"))
+        manager_reference = weakref.ref(validation_manager)
+        del validation_manager
+        gc.collect()
+        assert manager_reference() is None
+        assert memoized_check_stripped.cache.cache_info().currsize == 2
+
+    def test_passing_arguments_are_cached(self):
+        calls = []
+        memoized_append = pure(maxsize=2)(calls.append)
+        for value in ["a", "b", "a", "c", "a", "b"]:
+            memoized_append(value)
+        assert calls == ["a", "b", "c", "b"]
+        assert memoized_append.cache.cache_info() == CacheInfo(hits=2, misses=4, maxsize=2, currsize=2)
+
+    def test_arguments_of_other_types_are_not_mixed_up(self):
+        calls = []
+        memoized_append = pure()(calls.append)
+        memoized_append(1)
+        memoized_append(1.0)
+        memoized_append(True)
+        assert calls == [1, 1.0, True]
+
+    def test_unhashable_arguments_are_not_cached(self):
+        memoized_check = pure()(lambda values: None)
+        memoized_check(values=["a"])
+        assert memoized_check.cache.cache_info().currsize == 0
+
+    def test_errors_outside_a_validation_are_not_cached(self):
+        def check_positive(number: int):
+            if number <= 0:
+                raise ValueError("number must be positive")
+
+        memoized_check_positive = pure()(check_positive)
+        with pytest.raises(ValueError) as error:
+            memoized_check_positive(number=0)
+        assert _get_identifier(error.value)[1] == "check_positive"
+        assert memoized_check_positive.cache.cache_info().currsize == 0
+
+    def test_is_pure(self):
+        assert is_pure(check_postleitzahl)
+        assert not is_pure(check_stripped)
+        assert inspect.signature(check_postleitzahl) == inspect.signature(inspect.unwrap(check_postleitzahl))
+
+
+_MIGRATION_CONFIG = MigrationConfig(migration_key_date=datetime(2023, 6, 1, tzinfo=UTC))
+_CACHES: dict[str, Any] = {
+    "check_str_is_stripped": check_str_is_stripped.cache,  # type:ignore[attr-defined]
+    "check_telefonnummer": check_telefonnummer.cache,  # type:ignore[attr-defined]
+    "check_postleitzahl": check_postleitzahl.cache,  # type:ignore[attr-defined]
+    "check_e_mail": e_mail_domain_validation_cache,
+    "check_iban": iban_validation_cache,
+    "check_bic": bic_validation_cache,
+    "check_rollencodenr": check_rollencodenr.cache,  # type:ignore[attr-defined]
+    "check_obis": check_obis.cache,  # type:ignore[attr-defined]
+}
+"""The caches of all cached validators by their name"""
+_CONTACT_RULES = ("check_e_mail", "check_bic")
+
+
+def _errors_and_warnings(validation_result: ValidationResult) -> list[tuple[str, int, str]]:
+    return sorted(
+        (error.mapped_validator.name, error.error_id, error.message_detail)
+        for error in validation_result.all_errors + validation_result.all_warnings
+    )
+
+
+@dataclass(frozen=True)
+class _Contact:
+    e_mail: str
+    bic: str
+    sepa_zahler: bool = True
+
+
+def _contact_validation_manager() -> PVToolValidationManager[_Contact]:
+    validation_manager = PVToolValidationManager[_Contact]()
+    validation_manager.register(PathMappedValidator(Validator(check_e_mail), {"e_mail": "e_mail"}))
+    validation_manager.register(PathMappedValidator(Validator(check_bic), {"sepa_zahler": "sepa_zahler", "bic": "bic"}))
+    return validation_manager
+
+
+def _synthetic_data_sets(
+    generator_factory: Callable[[dict[str, float]], DataSetGenerator[Any]], rules: Sequence[str]
+) -> tuple[list[Any], list[str]]:
+    """Returns data sets breaking all cached validators which the generator supports and the names of the validators"""
+    # the e-mail addresses and BICs of the synthetic data sets are invalid before the cached validation is reached
+    cached_validators = [rule for rule in _CACHES if rule in rules and rule not in _CONTACT_RULES]
+    generator = generator_factory(dict.fromkeys(cached_validators, 1.0))
+    return list(generator.generate(5)), cached_validators
+
+
+@pytest.mark.parametrize(
+    "validation_manager, data_sets_and_cached_validators",
+    [
+        (
+            build_validation_manager(ValidationManagerProviderCustomer, _MIGRATION_CONFIG),
+            _synthetic_data_sets(
+                lambda error_rates: CustomerDataSetGenerator(_MIGRATION_CONFIG.migration_key_date, 1, error_rates),
+                CustomerDataSetGenerator.RULES,
+            ),
+        ),
+        (
+            build_validation_manager(ValidationManagerProviderNetwork, _MIGRATION_CONFIG),
+            _synthetic_data_sets(
+                lambda error_rates: NetworkDataSetGenerator(1, error_rates), NetworkDataSetGenerator.RULES
+            ),
+        ),
+        (
+            _contact_validation_manager(),
+            ([_Contact("max@-example.de", "DEUTDEF"), _Contact("max@example", "ABCDDE1")], list(_CONTACT_RULES)),
+        ),
+    ],
+    ids=["customer", "network", "contact"],
+)
+async def test_cached_errors_have_the_error_ids_of_uncached_calls(
+    validation_manager: ValidationManager, data_sets_and_cached_validators: tuple[list[Any], list[str]]
+):
+    data_sets, cached_validators = data_sets_and_cached_validators
+    caches = [_CACHES[cached_validator] for cached_validator in cached_validators]
+    for data_set in data_sets:
+        for cache in caches:
+            cache.cache_clear()
+        uncached_validation_result = await validation_manager.validate(data_set)
+        validation_result = await validation_manager.validate(data_set)
+        assert _errors_and_warnings(validation_result) == _errors_and_warnings(uncached_validation_result)
+        assert set(cached_validators) <= {name for name, _, _ in _errors_and_warnings(validation_result)}
+    assert all(cache.cache_info().hits > 0 for cache in caches)
@@ -1,8 +1,10 @@
+from dataclasses import replace
 from datetime import UTC, datetime
 
 import pytest
 import pytz
 from bomf import MigrationConfig
+from email_validator import EmailNotValidError, validate_email
 from ibims.bo4e import (
     Adresse,
     Anrede,
@@ -23,7 +25,16 @@ from ibims.datasets import TripicaCustomerLoaderDataSet
 from injector import Injector
 from pvframework import ValidationManager
 
-from pvtool.customer_loader import ValidationManagerProviderCustomer
+from pvtool.customer_loader import (
+    ValidationManagerProviderCustomer,
+    build_customer_validation_manager,
+    check_bankname,
+    check_bic,
+    check_date_in_past_bankverbindung,
+    check_e_mail,
+    check_iban,
+    check_kontoinhaber,
+)
 
 from .conftest import assert_full_error_coverage
 
@@ -274,3 +285,140 @@ class TestValidationCustomer:
 
         assert validation_summary.num_errors_total == len(expected_errors)
         assert_full_error_coverage(set(expected_errors), set(validation_summary.all_errors))
+
+
+@pytest.mark.parametrize(
+    "e_mail",
+    [
+        "test@test.com",
+        "Max.Mustermann+tag@Example.DE",
+        "test@test",
+        "test@localhost",
+        "test@foo.test",
+        "test..test@test.com",
+        ".test@test.com",
+        "test@-test.com",
+        "test@test..com",
+        "test@ab--test.com",
+        "test@xn--mnchen-3ya.de",
+        "test@123.456",
+        "a" * 65 + "@test.com",
+        "test@" + "a" * 63 + "." + "b" * 63 + "." + "c" * 63 + "." + "d" * 50 + ".de",
+        "test.test@" + "a" * 63 + "." + "b" * 63 + "." + "c" * 63 + "." + "d" * 50 + ".de",
+        "test@" + "a" * 64 + ".de",
+        "tëst@test.com",
+        "test@münchen.de",
+        "Max Mustermann <test@test.com>",
+        '"test test"@test.com',
+        "test@[127.0.0.1]",
+        "test",
+        "test@",
+    ],
+)
+def test_check_e_mail_equals_email_validator(e_mail: str):
+    """
+    The fast path of check_e_mail has to behave exactly like email_validator.validate_email
+    """
+    try:
+        validate_email(e_mail, check_deliverability=False)
+        expected_error = None
+    except EmailNotValidError as error:
+        expected_error = error
+    for _ in range(2):  # the second run uses the cached domain
+        if expected_error is None:
+            check_e_mail(e_mail)
+        else:
+            with pytest.raises(type(expected_error)) as error_info:
+                check_e_mail(e_mail)
+            assert str(error_info.value) == str(expected_error)
+
+
+_CONFIG = MigrationConfig(migration_key_date=datetime(2023, 6, 1, tzinfo=UTC))
+_SEPA_BANKVERBINDUNG = Bankverbindung.model_construct(
+    iban="DE52940594210000082271",
+    bic="TESTDETT421",
+    bankname="Sparkasse WelcheAuchImmer",
+    kontoinhaber="Max Mustermann",
+    gueltig_seit=datetime(2023, 1, 1, tzinfo=UTC),
+    sepa_info=SepaInfo(sepa_id="123456789", sepa_zahler=True),
+    ouid=1,
+)
+_NO_SEPA_BANKVERBINDUNG = Bankverbindung.model_construct(
+    iban="DE",
+    bic=None,
+    bankname=" ",
+    kontoinhaber="",
+    sepa_info=SepaInfo(sepa_id="123456789", sepa_zahler=False),
+    ouid=2,
+)
+
+
+def _customer_with_banks(*bankverbindungen: Bankverbindung) -> TripicaCustomerLoaderDataSet:
+    return TripicaCustomerLoaderDataSet.model_construct(  # type:ignore[call-arg]
+        powercloud_customer_id="209876543",
+        banks={f"contract_id_{index}": bankverbindung for index, bankverbindung in enumerate(bankverbindungen)},
+    )
+
+
+class TestBankverbindungRuleGroup:
+    def test_rule_group(self):
+        rule_groups = build_customer_validation_manager(_CONFIG).rule_groups
+        assert len(rule_groups) == 1
+        rule_group = rule_groups[0]
+        assert rule_group.name == "Bankverbindung"
+        assert {mapped_validator.validator.func for mapped_validator in rule_group.mapped_validators} == {
+            check_iban,
+            check_bic,
+            check_kontoinhaber,
+            check_bankname,
+            check_date_in_past_bankverbindung,
+        }
+
+    @pytest.mark.parametrize(
+        ["bankverbindungen", "expected"],
+        [
+            pytest.param([], True, id="no banks"),
+            pytest.param([_SEPA_BANKVERBINDUNG, _NO_SEPA_BANKVERBINDUNG], True, id="valid"),
+            pytest.param(
+                [_SEPA_BANKVERBINDUNG.model_copy(update={"iban": "DE42940594210000082271"})], False, id="iban"
+            ),
+            pytest.param([_SEPA_BANKVERBINDUNG.model_copy(update={"bic": None})], False, id="bic"),
+            pytest.param([_SEPA_BANKVERBINDUNG.model_copy(update={"kontoinhaber": " "})], False, id="kontoinhaber"),
+            pytest.param([_SEPA_BANKVERBINDUNG.model_copy(update={"bankname": ""})], False, id="bankname"),
+            pytest.param(
+                [_SEPA_BANKVERBINDUNG.model_copy(update={"gueltig_seit": datetime(2024, 1, 1, tzinfo=UTC)})],
+                False,
+                id="gueltig_seit",
+            ),
+            pytest.param([_SEPA_BANKVERBINDUNG.model_copy(update={"sepa_info": None})], False, id="sepa_info"),
+            pytest.param(
+                [
+                    _NO_SEPA_BANKVERBINDUNG.model_copy(
+                        update={"sepa_info": SepaInfo.model_construct(sepa_zahler=0)}  # type:ignore[call-arg,arg-type]
+                    )
+                ],
+                False,
+                id="sepa_zahler type",
+            ),
+            pytest.param([_NO_SEPA_BANKVERBINDUNG.model_copy(update={"iban": 123})], False, id="iban type"),
+        ],
+    )
+    async def test_same_errors_as_single_validators(self, bankverbindungen: list[Bankverbindung], expected: bool):
+        data_set = _customer_with_banks(*bankverbindungen)
+        validation_manager = build_customer_validation_manager(_CONFIG)
+        rule_group = validation_manager.rule_groups[0]
+        results: list[bool] = []
+
+        def _recording_passes(data_set: TripicaCustomerLoaderDataSet) -> bool:
+            results.append(rule_group.passes(data_set))
+            return results[-1]
+
+        validation_manager.rule_groups[0] = replace(rule_group, passes=_recording_passes)
+        unfused_validation_manager = build_customer_validation_manager(_CONFIG)
+        unfused_validation_manager.rule_groups.clear()
+
+        validation_result = await validation_manager.validate(data_set)
+        expected_result = await unfused_validation_manager.validate(data_set)
+        assert results == [expected]
+        assert sorted(map(str, validation_result.all_errors)) == sorted(map(str, expected_result.all_errors))
+        assert validation_result.num_errors_per_id == expected_result.num_errors_per_id
@@ -0,0 +1,69 @@
+from datetime import UTC, datetime
+
+from bomf import MigrationConfig
+from injector import Injector
+from pvframework import PathMappedValidator, ValidationManager, Validator
+
+from pvtool import PVToolValidationManager, ValidationManagerProviderCustomer, ValidationManagerProviderNetwork
+from pvtool.validation_manager import clear_validation_manager_cache, current_param_ids
+
+from .conftest import NumberDataSet
+
+
+def _customer_validation_manager(migration_key_date: datetime) -> ValidationManager:
+    injector = Injector(
+        [
+            lambda binder: binder.bind(MigrationConfig, to=MigrationConfig(migration_key_date=migration_key_date)),
+            ValidationManagerProviderCustomer(),
+        ]
+    )
+    return injector.get(ValidationManager)
+
+
+class TestValidationManagerCache:
+    def test_same_config_reuses_manager(self):
+        validation_manager = _customer_validation_manager(datetime(2023, 6, 1, tzinfo=UTC))
+        assert _customer_validation_manager(datetime(2023, 6, 1, tzinfo=UTC)) is validation_manager
+
+    def test_different_config_builds_new_manager(self):
+        validation_manager = _customer_validation_manager(datetime(2023, 6, 1, tzinfo=UTC))
+        other_validation_manager = _customer_validation_manager(datetime(2024, 6, 1, tzinfo=UTC))
+        assert other_validation_manager is not validation_manager
+        assert other_validation_manager.config.migration_key_date == datetime(2024, 6, 1, tzinfo=UTC)
+
+    def test_provider_without_config(self):
+        validation_manager = Injector([ValidationManagerProviderNetwork()]).get(ValidationManager)
+        assert Injector([ValidationManagerProviderNetwork()]).get(ValidationManager) is validation_manager
+
+    def test_clear_cache(self):
+        validation_manager = Injector([ValidationManagerProviderNetwork()]).get(ValidationManager)
+        clear_validation_manager_cache()
+        assert Injector([ValidationManagerProviderNetwork()]).get(ValidationManager) is not validation_manager
+
+
+def check_positive(number: int):
+    if number <= 0:
+        raise ValueError(f"{current_param_ids()['number']} must be positive")
+
+
+class TestValidationState:
+    async def test_nested_validation_of_other_manager(self):
+        inner_manager = PVToolValidationManager[NumberDataSet]()
+        inner_manager.register(PathMappedValidator(Validator(check_positive), {"number": "number"}))
+
+        async def check_inner(number: int):
+            assert (await inner_manager.validate(NumberDataSet(-number))).num_fails == 1
+            # the state of the outer validation is restored
+            assert current_param_ids() == {"number": "number"}
+
+        outer_manager = PVToolValidationManager[NumberDataSet]()
+        outer_manager.register(PathMappedValidator(Validator(check_inner), {"number": "number"}))
+        assert (await outer_manager.validate(NumberDataSet(1))).num_fails == 0
+
+    async def test_state_is_reset_after_validation(self):
+        validation_manager = PVToolValidationManager[NumberDataSet]()
+        validation_manager.register(PathMappedValidator(Validator(check_positive), {"number": "number"}))
+        validation_result = await validation_manager.validate(NumberDataSet(-1))
+        assert validation_result.all_errors[0].message_detail == "number must be positive"
+        # pylint: disable-next=protected-access
+        assert validation_manager._runtime_execution_info is None